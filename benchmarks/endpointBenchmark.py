@@ -0,0 +1,524 @@
+# API 엔드포인트 지연 시간 벤치마크 (성능 회귀 검사)
+# 실행: python -m benchmarks.endpointBenchmark [--patients 100 --readings 200 ...] [--update-baseline]
+#
+# 앱을 같은 프로세스에서 실행하고(httpx ASGITransport, lifespan 포함) 로컬 mongod의 벤치마크 전용 데이터베이스에
+# 환자/모니터/측정 기록/메모를 채운 뒤, users/health/monitoring/memos 컨트롤러의 모든 라우트를
+# 동시 요청으로 호출해서 라우트별 p50/p95/p99 지연 시간과 처리량을 측정한다.
+#
+# - 결과는 기준값 파일(JSON)과 비교하고, 기준값보다 허용 비율 이상 느려진 라우트나 오류 응답이 있으면 종료 코드 1
+# - 같은 데이터셋/부하 설정으로 만든 기준값과만 비교한다 (설정이 다르면 종료 코드 2)
+# - 측정 대상에 없는 라우트가 컨트롤러에 추가되면 종료 코드 2 (ROUTE_CASES 또는 SKIPPED_ROUTES에 추가해야 함)
+# - 삭제/승인처럼 대상이 사라지는 라우트는 측정 전에 요청 수만큼 대상을 따로 만든다
+# - 데이터베이스는 실행 전후에 삭제한다 (MONGO_DB_NAME 기본값인 stroke_db는 사용할 수 없음)
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from bson import ObjectId
+from dotenv import load_dotenv
+
+from core.config import settings
+from core.passwordHasher import password_hasher
+from crud import healthCrud, memoCrud, monitoringCrud, userCrud
+from models.memoModel import MemoDB
+from models.monitoringModel import MonitoringRelationDB, MonitoringRequestDB
+from models.userModel import UserDB, UserRole, sexEnum, smokingEnum
+from schemas.healthSchema import HealthRecordBatchItem
+from schemas.monitoringSchema import MonitoringStatus
+from services import healthService
+from services.relationGraphService import load_relation_graph
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "endpointBaseline.json")
+PASSWORD = "bench-password"
+# 시드 사용자 비밀번호 해시 (한 번만 계산, 로그인 시 다시 저장하지 않도록 현재 방식으로 저장)
+PASSWORD_HASH = password_hasher.hash_sync(PASSWORD)
+SEED_CHUNK = 5000
+BATCH_RECORDS = 20  # POST /health/records/batch 요청 하나의 기록 수
+
+# 측정하는 컨트롤러 (main.py의 include_router prefix)
+BENCH_PREFIXES = ("/users", "/health", "/monitoring", "/memos")
+
+# 측정하지 않는 라우트와 이유
+SKIPPED_ROUTES = {
+    "GET /monitoring/events/{user_id}": "SSE 스트림은 연결이 끊길 때까지 응답이 끝나지 않음",
+}
+
+@dataclass
+class BenchContext:
+    """시드 데이터 (라우트별 요청 생성에 사용)"""
+    db: object
+    rng: random.Random
+    patients: List[str] = field(default_factory=list)
+    monitors: List[str] = field(default_factory=list)
+    relations: List[tuple] = field(default_factory=list)     # (관계 ID, 환자 ID, 모니터 ID)
+    doctor_pairs: List[tuple] = field(default_factory=list)  # (의사 ID, 환자 ID)
+    memos: List[str] = field(default_factory=list)
+    disposable: int = 0                                      # 일회용 대상 ID 순번
+
+    def next_id(self, prefix: str) -> str:
+        self.disposable += 1
+        return f"bench_{prefix}_{self.disposable:06d}"
+
+    def pick(self, values: list):
+        return self.rng.choice(values)
+
+# 요청 목록 생성 함수: (ctx, 요청 수) -> httpx.request 인자 목록
+RequestBuilder = Callable[[BenchContext, int], Awaitable[List[dict]]]
+
+@dataclass
+class RouteCase:
+    method: str
+    path: str       # 라우트 경로 템플릿 (prefix 포함)
+    build: RequestBuilder
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.path}"
+
+def _reading(rng: random.Random, user_id: str) -> dict:
+    return {
+        "user_id": user_id,
+        "weight_kg": round(rng.uniform(45, 110), 1),
+        "systolic_bp": rng.randint(95, 190),
+        "diastolic_bp": rng.randint(55, 120),
+        "glucose_level": rng.randint(70, 280),
+        "smoking": rng.choice([0, 0, 0, 5, 10, 20]),
+    }
+
+def _each(make: Callable[[BenchContext, int], dict]) -> RequestBuilder:
+    """요청마다 make(ctx, i)로 인자를 만드는 빌더 (대상이 그대로 남는 라우트)"""
+    async def build(ctx: BenchContext, n: int) -> List[dict]:
+        return [make(ctx, i) for i in range(n)]
+    return build
+
+# ---------------------------------------------------------------------------
+# 시드 데이터
+
+def _user(user_id: str, name: str, role: UserRole, rng: random.Random) -> UserDB:
+    if role != UserRole.PATIENT:
+        return UserDB(id=user_id, password=PASSWORD_HASH, name=name, role=role)
+    return UserDB(
+        id=user_id,
+        password=PASSWORD_HASH,
+        name=name,
+        role=role,
+        sex=rng.choice(list(sexEnum)),
+        birth_date=date(rng.randint(1940, 1995), rng.randint(1, 12), rng.randint(1, 28)),
+        height_cm=rng.randint(150, 190),
+        hypertension=rng.random() < 0.3,
+        heart_disease=rng.random() < 0.1,
+        diabetes=rng.random() < 0.15,
+        smoking_history=rng.choice(list(smokingEnum))
+    )
+
+async def _create_relation(db, patient_id: str, monitor_id: str) -> str:
+    request = MonitoringRequestDB(id=str(ObjectId()), patient_id=patient_id, requester_id=monitor_id,
+                                  status=MonitoringStatus.APPROVED, responded_at=datetime.now())
+    await monitoringCrud.create_monitoring_request(db, request)
+    relation = MonitoringRelationDB(id=str(ObjectId()), patient_id=patient_id, monitor_id=monitor_id, request_id=request.id)
+    await monitoringCrud.create_monitoring_relation(db, relation)
+    return relation.id
+
+async def _create_pending_request(ctx: BenchContext) -> str:
+    """일회용 보호자 + 대기 중 요청"""
+    caregiver_id = ctx.next_id("caregiver")
+    await userCrud.create_user(ctx.db, _user(caregiver_id, "벤치 보호자", UserRole.CAREGIVER, ctx.rng))
+    request = MonitoringRequestDB(id=str(ObjectId()), patient_id=ctx.pick(ctx.patients),
+                                  requester_id=caregiver_id, status=MonitoringStatus.PENDING)
+    await monitoringCrud.create_monitoring_request(ctx.db, request)
+    return request.id
+
+async def _create_readings(db, rng: random.Random, user_ids: List[str], per_user: int) -> List[str]:
+    """사용자별 per_user건 (6시간 간격, 오래된 순) - 위험도 계산과 통계 갱신은 앱과 같은 경로"""
+    now = datetime.now().replace(microsecond=0)
+    created: List[str] = []
+    items: List[HealthRecordBatchItem] = []
+
+    async def flush():
+        records = [record for record in await healthService.score_health_records(db, items) if record]
+        failed = await healthCrud.create_health_records(db, records)
+        created.extend(record.id for i, record in enumerate(records) if i not in failed)
+        items.clear()
+
+    for user_id in user_ids:
+        for i in range(per_user):
+            items.append(HealthRecordBatchItem(**_reading(rng, user_id), created_at=now - timedelta(hours=6 * (per_user - i))))
+            if len(items) >= SEED_CHUNK:
+                await flush()
+    if items:
+        await flush()
+    return created
+
+async def seed(db, args) -> BenchContext:
+    ctx = BenchContext(db=db, rng=random.Random(args.seed))
+    rng = ctx.rng
+
+    ctx.patients = [f"bench_patient_{i:05d}" for i in range(args.patients)]
+    ctx.monitors = [f"bench_doctor_{i:04d}" for i in range(args.monitors)]
+    for i, patient_id in enumerate(ctx.patients):
+        await userCrud.create_user(db, _user(patient_id, f"환자{i}", UserRole.PATIENT, rng))
+    for i, monitor_id in enumerate(ctx.monitors):
+        await userCrud.create_user(db, _user(monitor_id, f"의사{i}", UserRole.DOCTOR, rng))
+
+    for patient_id in ctx.patients:
+        for monitor_id in rng.sample(ctx.monitors, min(args.monitors_per_patient, len(ctx.monitors))):
+            relation_id = await _create_relation(db, patient_id, monitor_id)
+            ctx.relations.append((relation_id, patient_id, monitor_id))
+            ctx.doctor_pairs.append((monitor_id, patient_id))
+
+    await _create_readings(db, rng, ctx.patients, args.readings)
+
+    for doctor_id, patient_id in ctx.doctor_pairs:
+        for _ in range(args.memos):
+            memo = MemoDB(id=str(ObjectId()), doctor_id=doctor_id, patient_id=patient_id,
+                          content=f"벤치마크 메모 {rng.randint(0, 1_000_000)}")
+            await memoCrud.create_memo(db, memo)
+            ctx.memos.append(memo.id)
+    return ctx
+
+# ---------------------------------------------------------------------------
+# 라우트별 요청
+
+def _relation(ctx: BenchContext) -> tuple:
+    return ctx.pick(ctx.relations)
+
+async def _build_register(ctx: BenchContext, n: int) -> List[dict]:
+    return [{"url": "/users/register", "json": {"id": ctx.next_id("user"), "name": "신규 의사",
+                                                "password": PASSWORD, "role": "DOCTOR"}} for _ in range(n)]
+
+async def _build_delete_record(ctx: BenchContext, n: int) -> List[dict]:
+    record_ids = await _create_readings(ctx.db, ctx.rng, [ctx.pick(ctx.patients) for _ in range(n)], 1)
+    return [{"url": f"/health/records/{record_id}"} for record_id in record_ids]
+
+async def _build_monitoring_request(ctx: BenchContext, n: int) -> List[dict]:
+    requests = []
+    for _ in range(n):
+        caregiver_id = ctx.next_id("caregiver")
+        await userCrud.create_user(ctx.db, _user(caregiver_id, "벤치 보호자", UserRole.CAREGIVER, ctx.rng))
+        requests.append({"url": "/monitoring/request", "json": {"patient_id": ctx.pick(ctx.patients), "requester_id": caregiver_id}})
+    return requests
+
+async def _build_approve(ctx: BenchContext, n: int) -> List[dict]:
+    return [{"url": "/monitoring/approve", "json": {"request_id": await _create_pending_request(ctx), "approved": True}}
+            for _ in range(n)]
+
+async def _build_delete_request(ctx: BenchContext, n: int) -> List[dict]:
+    return [{"url": f"/monitoring/request/{await _create_pending_request(ctx)}"} for _ in range(n)]
+
+async def _build_delete_relation(ctx: BenchContext, n: int) -> List[dict]:
+    requests = []
+    for _ in range(n):
+        caregiver_id = ctx.next_id("caregiver")
+        await userCrud.create_user(ctx.db, _user(caregiver_id, "벤치 보호자", UserRole.CAREGIVER, ctx.rng))
+        relation_id = await _create_relation(ctx.db, ctx.pick(ctx.patients), caregiver_id)
+        requests.append({"url": f"/monitoring/relation/{relation_id}"})
+    return requests
+
+async def _build_delete_memo(ctx: BenchContext, n: int) -> List[dict]:
+    requests = []
+    for _ in range(n):
+        doctor_id, patient_id = ctx.pick(ctx.doctor_pairs)
+        memo = MemoDB(id=str(ObjectId()), doctor_id=doctor_id, patient_id=patient_id, content="삭제용 메모")
+        await memoCrud.create_memo(ctx.db, memo)
+        requests.append({"url": f"/memos/{memo.id}", "params": {"doctor_id": doctor_id}})
+    return requests
+
+def _monitor_url(ctx: BenchContext, suffix: str = "") -> dict:
+    _, patient_id, monitor_id = _relation(ctx)
+    return {"url": f"/health/records/monitor/{monitor_id}/patient/{patient_id}{suffix}"}
+
+def _monitor_export(ctx: BenchContext, i: int) -> dict:
+    _, patient_id, monitor_id = _relation(ctx)
+    return {"url": f"/health/records/monitor/{monitor_id}/export", "params": {"patient_id": patient_id, "format": "ndjson"}}
+
+def _update_user(ctx: BenchContext, i: int) -> dict:
+    user_id = ctx.pick(ctx.patients)
+    return {"url": f"/users/{user_id}", "json": {"id": user_id, "name": f"환자 {i}"}}
+
+def _update_health(ctx: BenchContext, i: int) -> dict:
+    user_id = ctx.pick(ctx.patients)
+    return {"url": f"/users/{user_id}/health", "json": {"id": user_id, "height_cm": ctx.rng.randint(150, 190)}}
+
+def _create_memo(ctx: BenchContext, i: int) -> dict:
+    doctor_id, patient_id = ctx.pick(ctx.doctor_pairs)
+    return {"url": "/memos", "json": {"doctor_id": doctor_id, "patient_id": patient_id, "content": f"메모 {i}"}}
+
+def _batch(ctx: BenchContext, i: int) -> dict:
+    now = datetime.now()
+    records = []
+    for j in range(BATCH_RECORDS):
+        record = _reading(ctx.rng, ctx.pick(ctx.patients))
+        record["created_at"] = (now - timedelta(minutes=j)).isoformat()
+        records.append(record)
+    return {"url": "/health/records/batch", "json": {"records": records}}
+
+# 조회 라우트를 먼저, 대상을 만들거나 바꾸는 라우트를 다음에, 삭제 라우트를 마지막에 측정
+ROUTE_CASES = [
+    # users
+    RouteCase("POST", "/users/login", _each(lambda ctx, i: {"url": "/users/login", "json": {"id": ctx.pick(ctx.patients), "password": PASSWORD}})),
+    RouteCase("GET", "/users/{user_id}", _each(lambda ctx, i: {"url": f"/users/{ctx.pick(ctx.patients)}"})),
+    RouteCase("GET", "/users/{user_id}/health", _each(lambda ctx, i: {"url": f"/users/{ctx.pick(ctx.patients)}/health"})),
+    # health
+    RouteCase("GET", "/health/records/user/{user_id}", _each(lambda ctx, i: {"url": f"/health/records/user/{ctx.pick(ctx.patients)}"})),
+    RouteCase("GET", "/health/records/user/{user_id}/latest", _each(lambda ctx, i: {"url": f"/health/records/user/{ctx.pick(ctx.patients)}/latest"})),
+    RouteCase("GET", "/health/records/user/{user_id}/trend", _each(lambda ctx, i: {"url": f"/health/records/user/{ctx.pick(ctx.patients)}/trend",
+                                                                                      "params": {"metric": "systolic_bp"}})),
+    RouteCase("GET", "/health/records/user/{user_id}/stats", _each(lambda ctx, i: {"url": f"/health/records/user/{ctx.pick(ctx.patients)}/stats"})),
+    RouteCase("GET", "/health/records/user/{user_id}/export", _each(lambda ctx, i: {"url": f"/health/records/user/{ctx.pick(ctx.patients)}/export",
+                                                                                       "params": {"format": "ndjson"}})),
+    RouteCase("GET", "/health/records/monitor/{monitor_id}/patient/{patient_id}", _each(lambda ctx, i: _monitor_url(ctx))),
+    RouteCase("GET", "/health/records/monitor/{monitor_id}/patient/{patient_id}/latest", _each(lambda ctx, i: _monitor_url(ctx, "/latest"))),
+    RouteCase("GET", "/health/records/monitor/{monitor_id}/patient/{patient_id}/trend", _each(lambda ctx, i: _monitor_url(ctx, "/trend"))),
+    RouteCase("GET", "/health/records/monitor/{monitor_id}/patient/{patient_id}/stats", _each(lambda ctx, i: _monitor_url(ctx, "/stats"))),
+    RouteCase("GET", "/health/records/monitor/{monitor_id}/export", _each(_monitor_export)),
+    # monitoring
+    RouteCase("GET", "/monitoring/requests/pending/{patient_id}", _each(lambda ctx, i: {"url": f"/monitoring/requests/pending/{ctx.pick(ctx.patients)}"})),
+    RouteCase("GET", "/monitoring/requests/sent/{requester_id}", _each(lambda ctx, i: {"url": f"/monitoring/requests/sent/{ctx.pick(ctx.monitors)}"})),
+    RouteCase("GET", "/monitoring/relations/{patient_id}", _each(lambda ctx, i: {"url": f"/monitoring/relations/{ctx.pick(ctx.patients)}"})),
+    RouteCase("GET", "/monitoring/my-patients/{monitor_id}", _each(lambda ctx, i: {"url": f"/monitoring/my-patients/{ctx.pick(ctx.monitors)}"})),
+    RouteCase("GET", "/monitoring/dashboard/{monitor_id}", _each(lambda ctx, i: {"url": f"/monitoring/dashboard/{ctx.pick(ctx.monitors)}"})),
+    # memos
+    RouteCase("GET", "/memos/{memo_id}", _each(lambda ctx, i: {"url": f"/memos/{ctx.pick(ctx.memos)}"})),
+    RouteCase("GET", "/memos", _each(lambda ctx, i: {"url": "/memos", "params": {"patient_id": ctx.pick(ctx.patients), "include_author": "true"}})),
+    # 생성/수정
+    RouteCase("POST", "/users/register", _build_register),
+    RouteCase("PUT", "/users/{user_id}", _each(_update_user)),
+    RouteCase("PUT", "/users/{user_id}/health", _each(_update_health)),
+    RouteCase("POST", "/health/records", _each(lambda ctx, i: {"url": "/health/records", "json": _reading(ctx.rng, ctx.pick(ctx.patients))})),
+    RouteCase("POST", "/health/records/batch", _each(_batch)),
+    RouteCase("POST", "/monitoring/request", _build_monitoring_request),
+    RouteCase("POST", "/monitoring/approve", _build_approve),
+    RouteCase("POST", "/memos", _each(_create_memo)),
+    # 삭제
+    RouteCase("DELETE", "/health/records/{record_id}", _build_delete_record),
+    RouteCase("DELETE", "/monitoring/request/{request_id}", _build_delete_request),
+    RouteCase("DELETE", "/monitoring/relation/{relation_id}", _build_delete_relation),
+    RouteCase("DELETE", "/memos/{memo_id}", _build_delete_memo),
+]
+
+def uncovered_routes(controllers) -> List[str]:
+    """측정 대상 컨트롤러의 라우트 중 ROUTE_CASES와 SKIPPED_ROUTES 어디에도 없는 것 (controllers: main.CONTROLLERS)"""
+    covered = {case.key for case in ROUTE_CASES} | set(SKIPPED_ROUTES)
+    missing = []
+    for prefix, router, _ in controllers:
+        if prefix not in BENCH_PREFIXES:
+            continue
+        for route in router.routes:
+            for method in sorted(getattr(route, "methods", None) or ()):
+                key = f"{method} {prefix}{route.path}"
+                if key not in covered:
+                    missing.append(key)
+    return missing
+
+# ---------------------------------------------------------------------------
+# 측정
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """nearest-rank 백분위수"""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+async def run_case(client: httpx.AsyncClient, ctx: BenchContext, case: RouteCase, args) -> dict:
+    """요청 수만큼 동시 실행해서 지연 시간(ms)과 처리량 집계 (워밍업 요청은 집계에서 제외)"""
+    payloads = await case.build(ctx, args.warmup + args.requests)
+    for payload in payloads[:args.warmup]:
+        await client.request(case.method, **payload)
+
+    pending = iter(payloads[args.warmup:])
+    latencies: List[float] = []
+    errors: Dict[int, int] = {}
+    first_error: Optional[str] = None
+
+    async def worker():
+        nonlocal first_error
+        for payload in pending:
+            start = time.perf_counter()
+            response = await client.request(case.method, **payload)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors[response.status_code] = errors.get(response.status_code, 0) + 1
+                first_error = first_error or f"{response.status_code} {response.text[:200]}"
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors.values()),
+        "p50_ms": round(_percentile(latencies, 0.50), 3),
+        "p95_ms": round(_percentile(latencies, 0.95), 3),
+        "p99_ms": round(_percentile(latencies, 0.99), 3),
+        "rps": round(len(latencies) / elapsed, 1),
+        **({"first_error": first_error} if first_error else {}),
+    }
+
+def dataset_meta(args) -> dict:
+    """기준값과 비교할 때 같아야 하는 설정"""
+    return {
+        "patients": args.patients,
+        "monitors": args.monitors,
+        "monitors_per_patient": args.monitors_per_patient,
+        "readings": args.readings,
+        "memos": args.memos,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "seed": args.seed,
+        "health_records_timeseries": settings.health_records_timeseries,
+    }
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], metric: str, tolerance: float, min_delta_ms: float) -> List[str]:
+    """기준값보다 metric이 (1 + tolerance)배와 min_delta_ms를 모두 넘게 느려진 라우트"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or metric not in base:
+            continue
+        current, previous = result[metric], base[metric]
+        if current > previous * (1 + tolerance) and current - previous > min_delta_ms:
+            regressions.append(f"{key}: {metric} {previous:.2f}ms → {current:.2f}ms (+{(current / previous - 1) * 100:.0f}%)")
+    return regressions
+
+def print_table(results: Dict[str, dict], baseline: Dict[str, dict], metric: str) -> None:
+    print(f"\n{'라우트':<70} {'p50':>8} {'p95':>8} {'p99':>8} {'rps':>8} {'오류':>5} {'기준 ' + metric:>12}")
+    for key, result in results.items():
+        base = baseline.get(key, {}).get(metric)
+        base_text = f"{base:.2f}" if base is not None else "-"
+        print(f"{key:<70} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+              f"{result['rps']:>8.1f} {result['errors']:>5} {base_text:>12}")
+
+async def run(args) -> int:
+    load_dotenv()
+    os.environ["MONGO_URL"] = args.mongo_url or os.getenv("MONGO_URL") or "mongodb://localhost:27017"
+    settings.mongo_db_name = args.db
+    import main  # MONGO_URL/데이터베이스 이름을 정한 뒤에 앱 생성
+
+    missing = uncovered_routes(main.CONTROLLERS)
+    if missing:
+        print("❌ 측정 대상이 정해지지 않은 라우트가 있습니다 (ROUTE_CASES 또는 SKIPPED_ROUTES에 추가하세요):")
+        for key in missing:
+            print(f"  {key}")
+        return 2
+
+    baseline_doc = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline_doc = json.load(f)
+    meta = dataset_meta(args)
+    if baseline_doc and not args.update_baseline and baseline_doc.get("meta", {}).get("dataset") != meta:
+        print(f"❌ 기준값({args.baseline})과 데이터셋/부하 설정이 다릅니다. 같은 설정으로 실행하거나 --update-baseline으로 기준값을 다시 만드세요.")
+        print(f"  기준값: {baseline_doc.get('meta', {}).get('dataset')}")
+        print(f"  현재:   {meta}")
+        return 2
+
+    cases = [case for case in ROUTE_CASES if not args.routes or any(pattern in case.key for pattern in args.routes)]
+    results: Dict[str, dict] = {}
+    client = main.create_mongo_client()
+    await client.drop_database(args.db)  # 시작 시 인덱스를 빈 데이터베이스에 만들도록 lifespan 전에 삭제
+    client.close()
+    async with main.lifespan(main.app):
+        db = main.app.mongodb
+        try:
+            start = time.perf_counter()
+            ctx = await seed(db, args)
+            await load_relation_graph(db)  # 시작 시 적재한 그래프에는 시드 관계가 없음
+            print(f"✅ 시드 완료: 환자 {len(ctx.patients):,}명, 의사 {len(ctx.monitors):,}명, 관계 {len(ctx.relations):,}건, "
+                  f"기록 {len(ctx.patients) * args.readings:,}건, 메모 {len(ctx.memos):,}건 ({time.perf_counter() - start:.1f}s)")
+
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+                for case in cases:
+                    results[case.key] = await run_case(client, ctx, case, args)
+                    print(f"  {case.key}: p95 {results[case.key]['p95_ms']:.2f}ms", flush=True)
+        finally:
+            if not args.keep:
+                await main.app.mongodb_client.drop_database(args.db)
+
+    baseline = baseline_doc.get("routes", {})
+    print_table(results, baseline, args.gate_metric)
+    for key, reason in SKIPPED_ROUTES.items():
+        print(f"  (제외) {key}: {reason}")
+
+    failed = False
+    errored = {key: result for key, result in results.items() if result["errors"]}
+    for key, result in errored.items():
+        print(f"❌ 오류 응답 {key}: {result['errors']}건 (첫 오류: {result['first_error']})")
+        failed = True
+
+    if args.update_baseline:
+        if failed:
+            print("❌ 오류 응답이 있어서 기준값을 저장하지 않았습니다.")
+            return 1
+        routes = dict(baseline) if args.routes else {}
+        routes.update(results)
+        doc = {
+            "meta": {
+                "dataset": meta,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+            },
+            "routes": routes,
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"✅ 기준값 저장: {args.baseline} (라우트 {len(results)}개)")
+        return 0
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": {"dataset": meta}, "routes": results}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    if not baseline:
+        print(f"⚠️ 기준값이 없습니다. --update-baseline으로 {args.baseline}을 만드세요.")
+        return 1 if failed else 0
+
+    regressions = compare(results, baseline, args.gate_metric, args.tolerance, args.min_delta_ms)
+    for line in regressions:
+        print(f"❌ 성능 회귀 {line}")
+    if regressions or failed:
+        return 1
+    print(f"✅ 성능 회귀 없음 ({args.gate_metric}, 허용 +{args.tolerance * 100:.0f}%)")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="API 라우트별 지연 시간(p50/p95/p99)/처리량 측정 및 기준값 대비 회귀 검사")
+    parser.add_argument("--mongo-url", help="MongoDB 주소 (기본값: MONGO_URL 또는 mongodb://localhost:27017)")
+    parser.add_argument("--db", default="stroke_benchmark_api", help="벤치마크용 데이터베이스 (실행 전후 삭제)")
+    parser.add_argument("--keep", action="store_true", help="끝난 후 데이터베이스를 삭제하지 않음")
+    parser.add_argument("--patients", type=int, default=100, help="환자 수")
+    parser.add_argument("--monitors", type=int, default=10, help="의사 수")
+    parser.add_argument("--monitors-per-patient", type=int, default=2, help="환자 한 명을 모니터링하는 의사 수")
+    parser.add_argument("--readings", type=int, default=200, help="환자당 측정 기록 수")
+    parser.add_argument("--memos", type=int, default=3, help="의사-환자 관계당 메모 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=200, help="라우트당 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=10, help="라우트당 워밍업 요청 수 (집계 제외)")
+    parser.add_argument("--routes", action="append", help="이 문자열이 포함된 라우트만 측정 (여러 번 지정 가능)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 JSON 파일")
+    parser.add_argument("--update-baseline", action="store_true", help="비교하지 않고 이번 결과를 기준값으로 저장")
+    parser.add_argument("--output", help="이번 결과를 저장할 JSON 파일 (선택)")
+    parser.add_argument("--gate-metric", choices=["p50_ms", "p95_ms", "p99_ms"], default="p95_ms", help="회귀 판정 지표")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 비율 (0.2 = 기준값보다 20%%까지 느려도 통과)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="이 값 이하로 느려진 것은 회귀로 보지 않음 (ms, 측정 잡음)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.db == "stroke_db":
+        parser.error("stroke_db는 앱 데이터베이스라서 벤치마크에 사용할 수 없습니다 (실행 전후 삭제됨).")
+    raise SystemExit(asyncio.run(run(args)))
+
+if __name__ == "__main__":
+    main()
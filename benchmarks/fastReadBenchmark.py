@@ -0,0 +1,171 @@
+# 빠른 읽기 경로(FAST_READ_PATH) 바이트 호환 검사 + 경로별 지연 시간 비교
+# 실행: python -m benchmarks.fastReadBenchmark [--patients 20 --readings 120 --repeat 20]
+#
+# 앱을 같은 프로세스에서 실행하고(httpx ASGITransport, lifespan 포함) 로컬 mongod의 벤치마크 전용 데이터베이스에
+# endpointBenchmark와 같은 방식으로 환자/의사/측정 기록/메모를 채운 뒤, 빠른 읽기 경로를 쓰는 조회 라우트를
+# FAST_READ_PATH를 끈 상태(response_model 경로)와 켠 상태로 각각 호출해서 응답을 비교한다.
+#   - 상태 코드, Content-Type, 본문 바이트, X-Next-Cursor가 모두 같아야 하며 하나라도 다르면 종료 코드 1
+#   - 목록 라우트는 X-Next-Cursor를 따라 마지막 페이지까지 비교한다
+#   - 앱 모델로 저장했지만 응답 모델과 모양이 다른 문서도 넣어서 확인한다
+#     (float 필드에 저장된 정수, 위험도 필드가 없는 기록, 마이크로초가 있는 시각, 따옴표/줄바꿈/이모지가 있는 메모)
+#   - 검사를 통과하면 라우트별로 두 경로의 평균 지연 시간을 출력한다
+# - 데이터베이스는 실행 전후에 삭제한다 (MONGO_DB_NAME 기본값인 stroke_db는 사용할 수 없음)
+#
+# BSON → JSON 변환 단계만 DB 없이 비교하려면: python -m benchmarks.hotPathBenchmark --suite read
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import httpx
+from bson import ObjectId
+from dotenv import load_dotenv
+
+from core.config import settings
+from crud import healthCrud, memoCrud
+from models.memoModel import MemoDB
+from services.relationGraphService import load_relation_graph
+from benchmarks.endpointBenchmark import BenchContext, seed
+
+# 비교 결과 한 건: (상태 코드, Content-Type, 본문, X-Next-Cursor)
+Snapshot = Tuple[int, Optional[str], bytes, Optional[str]]
+
+async def add_edge_cases(ctx: BenchContext) -> None:
+    """응답 모델로 변환할 때 값이 바뀌는 문서 (환자 0번 기록/메모)"""
+    patient_id = ctx.patients[0]
+    doctor_id = next(doctor for doctor, patient in ctx.doctor_pairs if patient == patient_id)
+    created_at = datetime.now().replace(microsecond=123456) - timedelta(days=400)
+    await healthCrud.records_collection(ctx.db).insert_many([
+        # 정수로 저장된 체중, 위험도 필드 없음
+        {"_id": str(ObjectId()), "user_id": patient_id, "weight_kg": 70, "systolic_bp": 120, "diastolic_bp": 80,
+         "glucose_level": 100, "smoking": 0, "created_at": created_at},
+        {"_id": str(ObjectId()), "user_id": patient_id, "weight_kg": 65.5, "systolic_bp": 135, "diastolic_bp": 85,
+         "glucose_level": 110, "smoking": 3, "stroke_risk_score": 12, "stroke_risk_level": "MEDIUM",
+         "created_at": created_at + timedelta(seconds=1)},
+    ])
+    memo = MemoDB(id=str(ObjectId()), doctor_id=doctor_id, patient_id=patient_id,
+                  content='"따옴표" \\ 역슬래시\n줄바꿈\t탭 😀 </script>')
+    await memoCrud.create_memo(ctx.db, memo)
+    ctx.memos.append(memo.id)
+
+def target_urls(ctx: BenchContext, page_size: int) -> List[str]:
+    """빠른 읽기 경로를 쓰는 조회 라우트 (없는 대상/권한 없는 요청 포함)"""
+    patient_id = ctx.patients[0]
+    doctor_id = next(doctor for doctor, patient in ctx.doctor_pairs if patient == patient_id)
+    stranger = next((monitor for monitor in ctx.monitors if (monitor, patient_id) not in ctx.doctor_pairs), "bench_nobody")
+    urls = []
+    for user_id in ctx.patients[:3]:
+        urls += [f"/health/records/user/{user_id}", f"/health/records/user/{user_id}?limit={page_size}",
+                 f"/health/records/user/{user_id}/latest"]
+    urls += [
+        "/health/records/user/bench_nobody",
+        "/health/records/user/bench_nobody/latest",
+        f"/health/records/monitor/{doctor_id}/patient/{patient_id}",
+        f"/health/records/monitor/{doctor_id}/patient/{patient_id}?limit={page_size}",
+        f"/health/records/monitor/{doctor_id}/patient/{patient_id}/latest",
+        f"/health/records/monitor/{stranger}/patient/{patient_id}",
+        f"/health/records/monitor/{stranger}/patient/{patient_id}/latest",
+        f"/memos?doctor_id={doctor_id}",
+        f"/memos?doctor_id={doctor_id}&limit=2",
+        f"/memos?patient_id={patient_id}&include_author=true",
+        f"/memos?doctor_id={doctor_id}&patient_id={patient_id}&include_author=true&limit=2",
+        "/memos?doctor_id=bench_nobody",
+        "/memos?limit=5",
+        "/memos/bench_nobody",
+    ]
+    urls += [f"/memos/{memo_id}" for memo_id in ctx.memos[:3] + ctx.memos[-1:]]
+    return urls
+
+async def snapshot(client: httpx.AsyncClient, url: str, fast: bool) -> Snapshot:
+    settings.fast_read_path = fast
+    response = await client.get(url)
+    return response.status_code, response.headers.get("content-type"), response.content, response.headers.get("x-next-cursor")
+
+async def compare_url(client: httpx.AsyncClient, url: str) -> List[str]:
+    """두 경로의 응답 비교 (X-Next-Cursor를 따라 마지막 페이지까지), 다른 점 목록"""
+    diffs = []
+    page_url: Optional[str] = url
+    while page_url:
+        expected = await snapshot(client, page_url, False)
+        actual = await snapshot(client, page_url, True)
+        for name, a, b in zip(("상태 코드", "Content-Type", "본문", "X-Next-Cursor"), expected, actual):
+            if a != b:
+                diffs.append(f"{page_url} {name}: response_model={a[:300] if isinstance(a, bytes) else a!r} "
+                             f"fast_read={b[:300] if isinstance(b, bytes) else b!r}")
+        cursor = expected[3]
+        page_url = f"{url}{'&' if '?' in url else '?'}after={cursor}" if cursor else None
+    return diffs
+
+async def time_url(client: httpx.AsyncClient, url: str, fast: bool, repeat: int) -> float:
+    """평균 지연 시간 (ms)"""
+    settings.fast_read_path = fast
+    await client.get(url)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await client.get(url)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+async def run(args) -> int:
+    load_dotenv()
+    os.environ["MONGO_URL"] = args.mongo_url or os.getenv("MONGO_URL") or "mongodb://localhost:27017"
+    settings.mongo_db_name = args.db
+    import main  # MONGO_URL/데이터베이스 이름을 정한 뒤에 앱 생성
+
+    client = main.create_mongo_client()
+    await client.drop_database(args.db)
+    client.close()
+    diffs: List[str] = []
+    timings = []
+    async with main.lifespan(main.app):
+        db = main.app.mongodb
+        try:
+            ctx = await seed(db, args)
+            await add_edge_cases(ctx)
+            await load_relation_graph(db)
+            urls = target_urls(ctx, args.page_size)
+
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as http:
+                for url in urls:
+                    diffs += await compare_url(http, url)
+                if not diffs:
+                    for url in urls:
+                        timings.append((url, await time_url(http, url, False, args.repeat), await time_url(http, url, True, args.repeat)))
+        finally:
+            settings.fast_read_path = False
+            await main.app.mongodb_client.drop_database(args.db)
+
+    if diffs:
+        for line in diffs:
+            print(f"❌ 응답 불일치 {line}")
+        return 1
+
+    print(f"✅ 응답 일치: 라우트 {len(urls)}개 (상태 코드, Content-Type, 본문 바이트, X-Next-Cursor)")
+    print(f"\n{'URL':<80} {'response_model ms':>18} {'fast_read ms':>13} {'배율':>6}")
+    for url, model_ms, fast_ms in timings:
+        print(f"{url:<80} {model_ms:>18.2f} {fast_ms:>13.2f} {model_ms / fast_ms:>5.1f}x")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="FAST_READ_PATH 켜고 끈 조회 응답의 바이트 호환 검사와 지연 시간 비교")
+    parser.add_argument("--mongo-url", help="MongoDB 주소 (기본값: MONGO_URL 또는 mongodb://localhost:27017)")
+    parser.add_argument("--db", default="stroke_benchmark_fast_read", help="벤치마크용 데이터베이스 (실행 전후 삭제)")
+    parser.add_argument("--patients", type=int, default=20, help="환자 수")
+    parser.add_argument("--monitors", type=int, default=5, help="의사 수")
+    parser.add_argument("--monitors-per-patient", type=int, default=2, help="환자 한 명을 모니터링하는 의사 수")
+    parser.add_argument("--readings", type=int, default=120, help="환자당 측정 기록 수")
+    parser.add_argument("--memos", type=int, default=3, help="의사-환자 관계당 메모 수")
+    parser.add_argument("--page-size", type=int, default=25, help="X-Next-Cursor를 따라가며 비교할 목록의 limit")
+    parser.add_argument("--repeat", type=int, default=20, help="지연 시간 측정 시 URL당 요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.db == "stroke_db":
+        parser.error("stroke_db는 앱 데이터베이스라서 벤치마크에 사용할 수 없습니다 (실행 전후 삭제됨).")
+    raise SystemExit(asyncio.run(run(args)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+# 요청 처리 핫 패스 마이크로 벤치마크
+# 실행: python -m benchmarks.hotPathBenchmark [--suite risk --sizes 1,100,1000]
+#
+# 요청마다 반복되는 계산을 실제 요청에서 쓰는 크기(batch)로 나눠 구현(variant)별로 비교한다.
+#   - risk:     위험도 계산 (calculate_stroke_risk / 고정 점수 캐시 + 변동 점수 / 배치 계산)
+#   - age:      생년월일 → 나이 (calculate_age)
+#   - response: DB 원본 문서 → HealthRecordResponse (HealthRecordDB(**doc)를 거치는 현재 경로와 대안)
+#   - read:     드라이버가 받은 BSON → 응답 JSON 바이트 (response_model 경로 / 빠른 읽기 경로 core.fastRead)
+#               10,000건 기록을 페이지 크기로 나눠 비교: --suite read --items 10000 --sizes 100,500
+#
+# 같은 묶음(suite)의 구현은 모두 같은 입력(batch 하나)을 받아 같은 결과를 돌려줘야 하며,
+# 타이밍 전에 첫 번째 구현(현재 앱에서 쓰는 경로) 결과와 같은지 먼저 검증한다.
+# 건당 시간은 repeat 회 중 최소값, 할당은 tracemalloc으로 batch 호출마다 측정한다 (타이밍과 별도 실행).
+#   - 할당 B/건: 호출 중 최대로 늘어난 메모리 (임시 객체 포함)
+#   - 유지 B/건: 호출 후 결과로 남아 있는 메모리
+#
+# 다른 구현 비교: SUITES에 Variant를 추가하거나, 모듈의 함수를 그대로 지정한다.
+#   python -m benchmarks.hotPathBenchmark --candidate age=mypackage.fastAge:calculate_ages
+
+import argparse
+import importlib
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List
+
+import bson
+from pydantic import TypeAdapter
+
+from core.riskCalculator import calculate_age, calculate_dynamic_risk, calculate_static_risk, calculate_stroke_risk, combine_risk_score
+from core.batchRiskCalculator import calculate_stroke_risk_batch
+from models.healthModel import HealthRecordDB
+from schemas.healthSchema import HealthRecordResponse
+from services.healthService import HEALTH_RECORD_SHAPE
+from core.fastRead import dumps
+from benchmarks.riskCalculatorBenchmark import generate_rows
+from benchmarks.patientSeriesBenchmark import generate_documents
+
+@dataclass
+class Variant:
+    name: str
+    run: Callable[[list], Any]  # batch 하나 → 결과
+
+@dataclass
+class Suite:
+    name: str
+    description: str
+    generate: Callable[[int, int], list]  # (건수, seed) → 입력 목록
+    normalize: Callable[[Any], list]      # 결과 비교용 변환
+    variants: List[Variant]
+
+# ---------------------------------------------------------------------------
+# risk: 입력 한 건 = (calculate_stroke_risk 인자, 캐시된 고정 점수)
+# 앱에서는 고정 점수를 riskProfileService 캐시에서 가져오므로 입력에 미리 계산해 둔다
+
+STATIC_KEYS = ("age", "sex", "stroke_history", "hypertension", "heart_disease", "diabetes")
+DYNAMIC_KEYS = ("smoking_history", "systolic_bp", "diastolic_bp", "weight_kg", "height_cm", "glucose_level", "smoking")
+
+def generate_risk_inputs(n: int, seed: int) -> list:
+    columns = generate_rows(n, seed=seed)
+    inputs = []
+    for i in range(n):
+        kwargs = {key: values[i] for key, values in columns.items()}
+        inputs.append((kwargs, calculate_static_risk(**{key: kwargs[key] for key in STATIC_KEYS})))
+    return inputs
+
+def risk_scalar(batch: list) -> list:
+    """현재 단건 경로: 건마다 calculate_stroke_risk"""
+    return [calculate_stroke_risk(**kwargs) for kwargs, _ in batch]
+
+def risk_cached_static(batch: list) -> list:
+    """healthService.create_health_record 경로: 캐시된 고정 점수 + 변동 점수"""
+    return [
+        combine_risk_score(static_score, calculate_dynamic_risk(**{key: kwargs[key] for key in DYNAMIC_KEYS}))
+        for kwargs, static_score in batch
+    ]
+
+def risk_batch(batch: list) -> list:
+    """일괄 등록 경로: 컬럼으로 모아서 calculate_stroke_risk_batch"""
+    columns = {key: [kwargs[key] for kwargs, _ in batch] for key in STATIC_KEYS + DYNAMIC_KEYS}
+    scores, _ = calculate_stroke_risk_batch(**columns)
+    return scores.tolist()
+
+# ---------------------------------------------------------------------------
+# age: 입력 한 건 = 생년월일 (오늘과 같은 월/일, 2월 29일 포함)
+
+def generate_birth_dates(n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    today = date.today()
+    dates = []
+    for i in range(n):
+        if i % 50 == 0:
+            dates.append(today.replace(year=today.year - rng.randint(1, 90)) if (today.month, today.day) != (2, 29) else date(1960, 2, 29))
+        elif i % 50 == 1:
+            dates.append(date(rng.choice([1948, 1960, 1972, 1984, 1996]), 2, 29))
+        else:
+            dates.append(date(1930, 1, 1) + timedelta(days=rng.randint(0, 80 * 365)))
+    return dates
+
+def age_current(batch: list) -> list:
+    """현재 경로: 건마다 calculate_age (호출마다 오늘 날짜 조회)"""
+    return [calculate_age(birth_date) for birth_date in batch]
+
+def age_today_once(batch: list) -> list:
+    """batch마다 오늘 날짜를 한 번만 조회하고 월/일을 튜플로 비교"""
+    today = date.today()
+    key = (today.month, today.day)
+    return [today.year - b.year - (key < (b.month, b.day)) for b in batch]
+
+# ---------------------------------------------------------------------------
+# response: 입력 한 건 = health_records 원본 문서
+
+def response_via_db_model(batch: list) -> list:
+    """현재 경로: HealthRecordDB(**doc) 후 필드를 복사해서 HealthRecordResponse 생성"""
+    responses = []
+    for doc in batch:
+        h = HealthRecordDB(**doc)
+        responses.append(HealthRecordResponse(
+            id=h.id,
+            user_id=h.user_id,
+            weight_kg=h.weight_kg,
+            systolic_bp=h.systolic_bp,
+            diastolic_bp=h.diastolic_bp,
+            glucose_level=h.glucose_level,
+            smoking=h.smoking,
+            stroke_risk_score=h.stroke_risk_score,
+            stroke_risk_level=h.stroke_risk_level,
+            created_at=h.created_at
+        ))
+    return responses
+
+def response_validate(batch: list) -> list:
+    """DB 모델 없이 원본 문서로 응답 모델을 바로 검증"""
+    validate = HealthRecordResponse.model_validate
+    return [validate({**doc, "id": doc["_id"]}) for doc in batch]
+
+def response_construct(batch: list) -> list:
+    """검증 없이 응답 모델 생성 (DB에서 읽은 신뢰할 수 있는 문서 전용, 기본값 채움은 유지)"""
+    construct = HealthRecordResponse.model_construct
+    return [construct(**{**doc, "id": doc["_id"]}) for doc in batch]
+
+def _dump_models(models: list) -> list:
+    return [model.model_dump() for model in models]
+
+# ---------------------------------------------------------------------------
+# read: 입력 한 건 = (원본 문서 BSON, 빠른 읽기 경로 projection을 적용한 BSON)
+# 서버가 보낸 batch를 디코딩하는 것부터 응답 본문 바이트까지 (FastAPI는 response_model로 검증 후 dump_json)
+
+RESPONSE_LIST = TypeAdapter(List[HealthRecordResponse])
+
+def _project(doc: dict) -> dict:
+    """HEALTH_RECORD_SHAPE.projection을 적용한 문서 ($project와 같이 _id → id)"""
+    projected = {name: doc[name] for name in HEALTH_RECORD_SHAPE.projection if name in doc and name != "_id"}
+    projected["id"] = doc["_id"]
+    return projected
+
+def generate_read_inputs(n: int, seed: int) -> list:
+    return [(bson.encode(doc), bson.encode(_project(doc))) for doc in generate_documents(n, seed=seed)]
+
+def read_response_model(batch: list) -> bytes:
+    """현재 경로: 원본 문서 디코딩 → HealthRecordDB → HealthRecordResponse → response_model 검증/직렬화"""
+    docs = bson.decode_all(b"".join(full for full, _ in batch))
+    return RESPONSE_LIST.dump_json(RESPONSE_LIST.validate_python(response_via_db_model(docs)))
+
+def read_fast_path(batch: list) -> bytes:
+    """빠른 읽기 경로: projection 적용 문서 디코딩 → 응답 필드 dict → JSON 바이트"""
+    docs = bson.decode_all(b"".join(projected for _, projected in batch))
+    return dumps(HEALTH_RECORD_SHAPE.rows(docs))
+
+SUITES: Dict[str, Suite] = {
+    suite.name: suite for suite in [
+        Suite("risk", "위험도 점수 계산", generate_risk_inputs, list, [
+            Variant("calculate_stroke_risk", risk_scalar),
+            Variant("cached_static+dynamic", risk_cached_static),
+            Variant("batch_numpy", risk_batch),
+        ]),
+        Suite("age", "생년월일 → 나이", generate_birth_dates, list, [
+            Variant("calculate_age", age_current),
+            Variant("today_once", age_today_once),
+        ]),
+        Suite("response", "원본 문서 → HealthRecordResponse", lambda n, seed: generate_documents(n, seed=seed), _dump_models, [
+            Variant("db_model+copy", response_via_db_model),
+            Variant("model_validate", response_validate),
+            Variant("model_construct", response_construct),
+        ]),
+        Suite("read", "BSON → 건강 기록 목록 응답 JSON", generate_read_inputs, lambda body: [body], [
+            Variant("response_model", read_response_model),
+            Variant("fast_read_path", read_fast_path),
+        ]),
+    ]
+}
+
+def load_candidate(spec: str) -> tuple:
+    """'suite=module:function' → (suite 이름, Variant)"""
+    suite_name, _, target = spec.partition("=")
+    module_name, _, attr = target.partition(":")
+    if suite_name not in SUITES or not module_name or not attr:
+        raise ValueError(f"--candidate 형식이 올바르지 않습니다: {spec} (예: age=mypackage.fastAge:calculate_ages)")
+    return suite_name, Variant(f"{module_name}:{attr}", getattr(importlib.import_module(module_name), attr))
+
+# ---------------------------------------------------------------------------
+# 측정
+
+def _batches(items: list, size: int) -> List[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def check_parity(suite: Suite, inputs: list) -> None:
+    """모든 구현의 결과가 첫 번째 구현과 같은지 검증"""
+    reference = suite.variants[0]
+    expected = suite.normalize(reference.run(inputs))
+    for variant in suite.variants[1:]:
+        actual = suite.normalize(variant.run(inputs))
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            if a != b:
+                raise AssertionError(f"[{suite.name}] {variant.name} 결과 불일치 (index={i}): {reference.name}={a!r} {variant.name}={b!r}")
+        if len(expected) != len(actual):
+            raise AssertionError(f"[{suite.name}] {variant.name} 결과 수 불일치: {len(expected)} != {len(actual)}")
+
+def time_per_item(variant: Variant, batches: List[list], items: int, repeat: int) -> float:
+    """건당 소요 시간 (초, repeat 회 중 최소)"""
+    run = variant.run
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for batch in batches:
+            run(batch)
+        best = min(best, time.perf_counter() - start)
+    return best / items
+
+def allocations_per_item(variant: Variant, batches: List[list], items: int) -> tuple:
+    """(할당 B/건, 유지 B/건) - batch 호출마다 tracemalloc으로 측정"""
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        retained_total = 0
+        for batch in batches:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            result = variant.run(batch)
+            current, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+            retained_total += current - before
+            del result
+    finally:
+        tracemalloc.stop()
+    return peak_total / items, retained_total / items
+
+def run_suite(suite: Suite, sizes: List[int], items: int, repeat: int, seed: int) -> None:
+    inputs = suite.generate(items, seed)
+    check_parity(suite, inputs)
+    print(f"\n[{suite.name}] {suite.description} - {items:,}건, 결과 일치 확인")
+    print(f"{'구현':<36} {'batch':>6} {'µs/건':>9} {'건/s':>12} {'배율':>6} {'할당 B/건':>10} {'유지 B/건':>10}")
+    for size in sizes:
+        batches = _batches(inputs, size)
+        reference_time = None
+        for variant in suite.variants:
+            elapsed = time_per_item(variant, batches, items, repeat)
+            allocated, retained = allocations_per_item(variant, batches, items)
+            reference_time = reference_time or elapsed
+            print(f"{variant.name:<36} {size:>6} {elapsed * 1e6:>9.2f} {1 / elapsed:>12,.0f} "
+                  f"{reference_time / elapsed:>5.1f}x {allocated:>10,.0f} {retained:>10,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="위험도 계산/나이 계산/응답 모델 변환/조회 응답 직렬화 구현별 건당 시간과 할당 비교")
+    parser.add_argument("--suite", action="append", choices=list(SUITES), help="실행할 묶음 (여러 번 지정 가능, 없으면 전체)")
+    parser.add_argument("--sizes", default="1,100,1000", help="batch 크기 목록 (쉼표 구분, 단건 요청=1 / 목록 한 페이지=100 / 일괄 등록=1000)")
+    parser.add_argument("--items", type=int, default=20_000, help="측정에 사용할 건수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최소값 사용)")
+    parser.add_argument("--candidate", action="append", default=[], help="추가로 비교할 구현 (suite=module:function)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for spec in args.candidate:
+        try:
+            suite_name, variant = load_candidate(spec)
+        except (ValueError, ImportError, AttributeError) as e:
+            parser.error(str(e))
+        SUITES[suite_name].variants.append(variant)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    for name in args.suite or list(SUITES):
+        run_suite(SUITES[name], sizes, args.items, args.repeat, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+# JSON 응답 직렬화 방식 비교 + 바이트 호환 검증 (JSON_RESPONSE)
+# 실행: python -m benchmarks.jsonResponseBenchmark [--records 500 --repeat 200]
+#
+# 기존 스키마로 만든 응답(건강 기록 목록/추이/통계, 사용자/건강 정보, 모니터링 요청/관계, 대시보드, 메모)을
+# JSON_RESPONSE 설정별로 만든 FastAPI 앱에서 실제로 응답받아 본문이 바이트 단위로 같은지 먼저 확인하고 (다르면 종료 코드 1),
+# 라우트 한 번의 직렬화 단계(반환 값 → response_model 검증 → 본문 바이트)를 방식별로 측정한다.
+#   - pydantic:         validate_python → dump_json (FastAPI 기본 응답 클래스)
+#   - orjson:           validate_python → dump_python(mode="json") → ORJSONResponse.render
+#   - jsonable_encoder: validate_python → jsonable_encoder → JSONResponse.render
+#                       (response_model이 없는 라우트, dump_json 경로가 없던 이전 FastAPI의 경로 - 비교용)
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import httpx
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from core.jsonResponse import json_response_class, ORJSONResponse, JSON_RESPONSE_PYDANTIC, JSON_RESPONSE_ORJSON
+from models.userModel import UserRole, sexEnum, smokingEnum
+from schemas.healthSchema import (
+    HealthRecordResponse, HealthStatsResponse, HealthStatsWindow, HealthTrendResponse, MetricStats, TrendMetric, TrendPoint
+)
+from schemas.memoSchema import MemoResponse
+from schemas.monitoringSchema import MonitoringRelationResponse, MonitoringRequestResponse, MonitoringStatus, PatientDashboardItem
+from schemas.userSchema import UserHealthInfoResponse, UserResponse
+from benchmarks.patientSeriesBenchmark import generate_documents
+
+@dataclass
+class Payload:
+    name: str
+    response_model: Any  # 라우트의 response_model
+    value: Any           # 엔드포인트 반환 값
+    items: int           # 목록 항목 수 (건당 시간 계산용)
+
+def _record(doc: dict) -> HealthRecordResponse:
+    return HealthRecordResponse.model_validate({**doc, "id": doc["_id"]})
+
+def generate_payloads(records: int, seed: int) -> List[Payload]:
+    rng = random.Random(seed)
+    docs = generate_documents(records, seed=seed)
+    now = datetime.now().replace(microsecond=123000)
+    names = ["김환자", "이보호", "박의사", "Kim \"Jr\"", "최\\민수"]
+
+    metrics = {
+        name: MetricStats(count=rng.randint(1, 500), avg=round(rng.uniform(50, 150), 1), min=float(rng.randint(40, 60)), max=rng.uniform(150, 200))
+        for name in ("weight_kg", "systolic_bp", "diastolic_bp", "glucose_level", "stroke_risk_score", "bmi")
+    }
+    stats = HealthStatsResponse(
+        user_id="patient_0001",
+        total_count=records,
+        first_at=docs[0]["created_at"],
+        last_at=docs[-1]["created_at"],
+        lifetime=metrics,
+        windows={
+            name: HealthStatsWindow(start_date=date.today() - timedelta(days=days - 1), count=rng.randint(0, 90), metrics=metrics)
+            for name, days in (("7d", 7), ("30d", 30), ("90d", 90), ("month", 18))
+        }
+    )
+    requests = [
+        MonitoringRequestResponse(
+            id=f"request_{i:04d}", patient_id="patient_0001", patient_name=rng.choice(names),
+            requester_id=f"monitor_{i:04d}", requester_name=rng.choice(names),
+            requester_role=rng.choice([UserRole.DOCTOR, UserRole.CAREGIVER]).value,
+            status=rng.choice(list(MonitoringStatus)),
+            created_at=now - timedelta(days=i),
+            responded_at=None if i % 3 else now - timedelta(days=i, hours=-1)
+        )
+        for i in range(50)
+    ]
+    relations = [
+        MonitoringRelationResponse(
+            id=f"relation_{i:04d}", patient_id=f"patient_{i:04d}", patient_name=rng.choice(names),
+            monitor_id="monitor_0001", monitor_name="박의사", monitor_role=UserRole.DOCTOR.value,
+            granted_at=now - timedelta(hours=i * 7)
+        )
+        for i in range(50)
+    ]
+    dashboard = [
+        PatientDashboardItem(
+            relation_id=relation.id, patient_id=relation.patient_id, patient_name=relation.patient_name,
+            granted_at=relation.granted_at, record_count=rng.randint(0, 5000),
+            latest_record=_record(docs[i]) if i % 5 else None
+        )
+        for i, relation in enumerate(relations)
+    ]
+    memos = [
+        MemoResponse(
+            id=f"memo_{i:04d}", doctor_id="monitor_0001", patient_id="patient_0001",
+            content=f"혈압 추이 확인 필요 ({i}) - \"재측정\"\n다음 내원 시 상담", created_at=now - timedelta(minutes=i),
+            doctor_name="박의사" if i % 2 else None
+        )
+        for i in range(100)
+    ]
+    return [
+        Payload("health_records", List[HealthRecordResponse], [_record(doc) for doc in docs], records),
+        Payload("health_trend", HealthTrendResponse, HealthTrendResponse(
+            user_id="patient_0001", metric=TrendMetric.SYSTOLIC_BP, total_count=records,
+            points=[TrendPoint(created_at=doc["created_at"], value=doc["systolic_bp"]) for doc in docs[:100]]
+        ), 100),
+        Payload("health_stats", HealthStatsResponse, stats, 1),
+        Payload("user", UserResponse, UserResponse(id="doctor_0001", name="박의사", role=UserRole.DOCTOR), 1),
+        Payload("user_health", UserHealthInfoResponse, UserHealthInfoResponse(
+            sex=sexEnum.FEMALE, birth_date=date(1960, 2, 29), height_cm=162, stroke_history=False, hypertension=True,
+            heart_disease=False, smoking_history=smokingEnum.PAST_SMOKER, diabetes=True, measured_at=now
+        ), 1),
+        Payload("monitoring_requests", List[MonitoringRequestResponse], requests, len(requests)),
+        Payload("monitoring_relations", List[MonitoringRelationResponse], relations, len(relations)),
+        Payload("dashboard", List[PatientDashboardItem], dashboard, len(dashboard)),
+        Payload("memos", List[MemoResponse], memos, len(memos)),
+    ]
+
+# ---------------------------------------------------------------------------
+# 직렬화 방식 (FastAPI serialize_response + 응답 클래스와 같은 순서)
+
+def _pydantic(adapter: TypeAdapter) -> Callable[[Any], bytes]:
+    return lambda value: adapter.dump_json(adapter.validate_python(value))
+
+def _orjson(adapter: TypeAdapter) -> Callable[[Any], bytes]:
+    render = ORJSONResponse.render
+    return lambda value: render(None, adapter.dump_python(adapter.validate_python(value), mode="json"))
+
+def _jsonable_encoder(adapter: TypeAdapter) -> Callable[[Any], bytes]:
+    render = JSONResponse.render
+    return lambda value: render(None, jsonable_encoder(adapter.validate_python(value)))
+
+ENCODERS: Dict[str, Callable[[TypeAdapter], Callable[[Any], bytes]]] = {
+    JSON_RESPONSE_PYDANTIC: _pydantic,
+    JSON_RESPONSE_ORJSON: _orjson,
+    "jsonable_encoder": _jsonable_encoder,
+}
+
+# ---------------------------------------------------------------------------
+# 바이트 호환 검증 (설정별 실제 FastAPI 앱)
+
+def build_app(setting: str, payloads: List[Payload]) -> FastAPI:
+    app = FastAPI(default_response_class=json_response_class(setting))
+    for payload in payloads:
+        app.add_api_route(f"/{payload.name}", (lambda value: lambda: value)(payload.value), response_model=payload.response_model)
+    return app
+
+async def fetch_bodies(app: FastAPI, payloads: List[Payload]) -> Dict[str, bytes]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        bodies = {}
+        for payload in payloads:
+            response = await client.get(f"/{payload.name}")
+            response.raise_for_status()
+            bodies[payload.name] = response.content
+        return bodies
+
+def check_compatibility(payloads: List[Payload]) -> List[str]:
+    """설정별 앱 응답과 측정용 직렬화 결과가 모두 기본 설정 응답과 같은지 확인 (다른 항목 목록 반환)"""
+    expected = asyncio.run(fetch_bodies(build_app(JSON_RESPONSE_PYDANTIC, payloads), payloads))
+    actual = {JSON_RESPONSE_ORJSON: asyncio.run(fetch_bodies(build_app(JSON_RESPONSE_ORJSON, payloads), payloads))}
+    for name, encoder in ENCODERS.items():
+        actual[f"{name} (측정용)"] = {
+            payload.name: encoder(TypeAdapter(payload.response_model))(payload.value) for payload in payloads
+        }
+
+    mismatches = []
+    for source, bodies in actual.items():
+        for payload in payloads:
+            if bodies[payload.name] != expected[payload.name]:
+                a, b = expected[payload.name], bodies[payload.name]
+                at = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+                mismatches.append(f"{payload.name} [{source}] offset {at}: {a[max(0, at - 30):at + 30]!r} != {b[max(0, at - 30):at + 30]!r}")
+    return mismatches
+
+# ---------------------------------------------------------------------------
+# 측정
+
+def time_encoder(encode: Callable[[Any], bytes], value: Any, repeat: int, rounds: int) -> float:
+    """응답 한 번의 직렬화 시간 (초, rounds 회 중 최소)"""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            encode(value)
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 응답 직렬화 방식별 바이트 호환 검증과 응답당 직렬화 시간 비교")
+    parser.add_argument("--records", type=int, default=500, help="건강 기록 목록 응답의 기록 수 (목록 한 페이지 최대 500)")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 1회당 직렬화 횟수")
+    parser.add_argument("--rounds", type=int, default=5, help="측정 횟수 (최소값 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    payloads = generate_payloads(args.records, args.seed)
+    mismatches = check_compatibility(payloads)
+    if mismatches:
+        print("❌ 응답 본문 불일치")
+        for line in mismatches:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"✅ 응답 본문 일치 확인 ({len(payloads)}개 응답, JSON_RESPONSE={JSON_RESPONSE_PYDANTIC}/{JSON_RESPONSE_ORJSON})")
+
+    print(f"\n{'응답':<22} {'건수':>5} {'바이트':>8} " + " ".join(f"{name + ' µs':>20}" for name in ENCODERS))
+    for payload in payloads:
+        adapter = TypeAdapter(payload.response_model)
+        timings = {name: time_encoder(make(adapter), payload.value, args.repeat, args.rounds) for name, make in ENCODERS.items()}
+        reference = timings[JSON_RESPONSE_PYDANTIC]
+        size = len(_pydantic(adapter)(payload.value))
+        cells = " ".join(f"{elapsed * 1e6:>12.1f} ({reference / elapsed:>4.2f}x)" for elapsed in timings.values())
+        print(f"{payload.name:<22} {payload.items:>5} {size:>8,} {cells}")
+
+if __name__ == "__main__":
+    main()
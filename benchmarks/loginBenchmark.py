@@ -0,0 +1,90 @@
+# 동시 로그인 벤치마크 (비밀번호 검증 위치/스레드 수별 처리량과 이벤트 루프 지연)
+# 실행: python -m benchmarks.loginBenchmark [--logins 64 --concurrency 32 --workers 1,2,4,8]
+#
+# 로그인 한 번 = DB 조회(asyncio.sleep으로 대신) + 비밀번호 검증을 동시에 여러 개 실행하고,
+# 같은 이벤트 루프에서 짧은 주기로 깨어나는 하트비트 작업이 예정보다 얼마나 늦게 깨어났는지(루프 지연)를 함께 측정한다.
+#   - inline:    이벤트 루프에서 바로 검증 (verify_sync - 이전 방식, 검증하는 동안 다른 요청이 모두 멈춤)
+#   - executor:  PasswordHasher.verify (스레드 풀, --workers 값별로 측정)
+#
+# 루프 지연이 작을수록 로그인이 몰려도 다른 요청(조회, SSE 등)이 제때 처리된다.
+# 처리량은 CPU 코어 수와 스레드 수에 따라 달라진다 (검증 중 GIL을 놓으므로 코어 수만큼 늘어남).
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, List
+
+from core.passwordHasher import PasswordHasher, available_schemes, resolve_scheme
+
+PASSWORD = "bench-password"
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+async def _heartbeat(interval: float, lags: List[float], stop: asyncio.Event) -> None:
+    """interval마다 깨어나서 예정보다 늦은 시간 기록"""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+async def run_logins(verify: Callable[[str, str], Awaitable[bool]], stored: str, logins: int, concurrency: int, db_latency: float) -> dict:
+    slots = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    lags: List[float] = []
+    stop = asyncio.Event()
+
+    async def login() -> None:
+        async with slots:
+            start = time.perf_counter()
+            await asyncio.sleep(db_latency)  # 사용자 조회
+            if not await verify(PASSWORD, stored):
+                raise RuntimeError("비밀번호 검증 실패")
+            latencies.append(time.perf_counter() - start)
+
+    heartbeat = asyncio.create_task(_heartbeat(0.005, lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await heartbeat
+    return {
+        "throughput": logins / elapsed,
+        "p50": _percentile(latencies, 0.5),
+        "p95": _percentile(latencies, 0.95),
+        "max_lag": max(lags, default=0.0),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 로그인 시 비밀번호 검증 위치/스레드 수별 처리량과 이벤트 루프 지연 비교")
+    parser.add_argument("--scheme", default="auto", choices=["auto", *available_schemes()], help="해시 방식")
+    parser.add_argument("--logins", type=int, default=64, help="측정당 로그인 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시에 진행하는 로그인 수")
+    parser.add_argument("--workers", default="1,2,4,8", help="비교할 스레드 수 (쉼표 구분)")
+    parser.add_argument("--db-latency-ms", type=float, default=2.0, help="사용자 조회 지연 (ms)")
+    args = parser.parse_args()
+
+    scheme = resolve_scheme(args.scheme)
+    stored = PasswordHasher(scheme).hash_sync(PASSWORD)
+    db_latency = args.db_latency_ms / 1000
+
+    variants = [("inline", None)] + [(f"executor x{n}", int(n)) for n in args.workers.split(",")]
+    print(f"방식: {scheme}, 로그인 {args.logins}건 (동시 {args.concurrency}), CPU {os.cpu_count()}개, 조회 지연 {args.db_latency_ms}ms")
+    print(f"\n{'구현':<14} {'로그인/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'최대 루프 지연 ms':>18}")
+    for name, workers in variants:
+        hasher = PasswordHasher(scheme, workers or 1)
+        if workers is None:
+            async def verify(password: str, stored: str, hasher=hasher) -> bool:
+                return hasher.verify_sync(password, stored)
+        else:
+            verify = hasher.verify
+        try:
+            result = asyncio.run(run_logins(verify, stored, args.logins, args.concurrency, db_latency))
+        finally:
+            hasher.shutdown()
+        print(f"{name:<14} {result['throughput']:>10.1f} {result['p50'] * 1000:>10.1f} {result['p95'] * 1000:>10.1f} {result['max_lag'] * 1000:>18.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# 환자 기록 분석용 컨테이너 비교 벤치마크: HealthRecordDB 목록 vs 컬럼형 PatientSeries
+# 실행: python -m benchmarks.patientSeriesBenchmark --records 100000
+#
+# DB 커서가 돌려주는 것과 같은 원본 문서(dict) 목록에서 두 형태를 만들고
+# 생성 시간, 유지 메모리(tracemalloc), 7일 이동 평균 계산 시간을 비교한다.
+# 타이밍 전에 두 경로의 이동 평균 결과가 같은지 먼저 검증한다.
+
+import argparse
+import math
+import random
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from models.healthModel import HealthRecordDB
+from core.patientSeries import PatientSeries
+
+ROLLING_DAYS = 7
+
+def generate_documents(n: int, seed: int = 42, missing_rate: float = 0.02) -> list:
+    """한 환자의 원본 문서 (오래된 순, 일부 위험도 누락)"""
+    rng = random.Random(seed)
+    at = datetime.now().replace(microsecond=0) - timedelta(hours=6 * n)
+    docs = []
+    for i in range(n):
+        at += timedelta(hours=rng.uniform(2, 10))
+        docs.append({
+            "_id": f"record_{i:08d}",
+            "user_id": "bench_patient",
+            "weight_kg": round(rng.uniform(50, 100), 1),
+            "systolic_bp": rng.randint(95, 190),
+            "diastolic_bp": rng.randint(55, 120),
+            "glucose_level": rng.randint(70, 280),
+            "smoking": rng.choice([0, 0, 5, 10]),
+            "stroke_risk_score": None if rng.random() < missing_rate else round(rng.uniform(5, 95), 1),
+            "stroke_risk_level": "보통",
+            "created_at": at,
+        })
+    return docs
+
+def build_models(docs: list) -> list:
+    return [HealthRecordDB(**doc) for doc in docs]
+
+def build_series(docs: list) -> PatientSeries:
+    return PatientSeries.from_documents("bench_patient", docs)
+
+def rolling_mean_models(records: list, days: float) -> list:
+    """모델 목록으로 직전 days일 이동 평균 (덱 기반 슬라이딩 윈도우)"""
+    span = timedelta(days=days)
+    window = deque()
+    total = 0.0
+    result = []
+    for record in records:
+        value = record.systolic_bp
+        window.append((record.created_at, value))
+        total += value
+        while window[0][0] <= record.created_at - span:
+            total -= window.popleft()[1]
+        result.append(total / len(window))
+    return result
+
+def rolling_mean_series(series: PatientSeries, days: float) -> np.ndarray:
+    return series.rolling_mean("systolic_bp", days)
+
+def measure(fn, *args):
+    """(결과, 소요 시간 초, 유지 메모리 바이트) - 결과가 살아 있는 동안 할당된 메모리"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, retained
+
+def _best_time(fn, *args, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def check_parity(docs: list) -> None:
+    """두 경로의 이동 평균이 같은지 검증 (부동소수점 누적 오차 허용)"""
+    expected = rolling_mean_models(build_models(docs), ROLLING_DAYS)
+    actual = rolling_mean_series(build_series(docs), ROLLING_DAYS)
+    for i, (a, b) in enumerate(zip(expected, actual)):
+        if not math.isclose(a, b, rel_tol=1e-9):
+            raise AssertionError(f"이동 평균 불일치 (index={i}): models={a} series={b}")
+
+def main():
+    parser = argparse.ArgumentParser(description="HealthRecordDB 목록 vs 컬럼형 PatientSeries 생성 시간/메모리 비교")
+    parser.add_argument("--records", type=int, default=100_000, help="환자 한 명의 기록 수")
+    parser.add_argument("--parity-records", type=int, default=5_000, help="결과 일치 검증에 사용할 기록 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    check_parity(generate_documents(args.parity_records, seed=args.seed))
+    print(f"✅ 이동 평균 결과 일치 확인 ({args.parity_records:,}건)")
+
+    docs = generate_documents(args.records, seed=args.seed + 1)
+    models, _, models_memory = measure(build_models, docs)
+    series, _, series_memory = measure(build_series, docs)
+    models_build = _best_time(build_models, docs, repeat=args.repeat)
+    series_build = _best_time(build_series, docs, repeat=args.repeat)
+    models_rolling = _best_time(rolling_mean_models, models, ROLLING_DAYS, repeat=args.repeat)
+    series_rolling = _best_time(rolling_mean_series, series, ROLLING_DAYS, repeat=args.repeat)
+
+    n = args.records
+    print(f"기록 {n:,}건")
+    print(f"생성      models {models_build:.3f}s / series {series_build:.3f}s (x{models_build / series_build:.1f})")
+    print(f"메모리    models {models_memory / n:,.0f}B/건 / series {series_memory / n:,.0f}B/건 "
+          f"(배열 {series.nbytes / n:.0f}B/건, x{models_memory / series_memory:.1f})")
+    print(f"{ROLLING_DAYS}일 이동 평균 models {models_rolling * 1000:.1f}ms / series {series_rolling * 1000:.1f}ms "
+          f"(x{models_rolling / series_rolling:.1f})")
+
+if __name__ == "__main__":
+    main()
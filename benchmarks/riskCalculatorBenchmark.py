@@ -0,0 +1,98 @@
+# 위험도 계산 스칼라 경로 vs 배치(벡터화) 경로 처리량 비교 벤치마크
+# 실행: python -m benchmarks.riskCalculatorBenchmark --rows 1000000
+#
+# 타이밍 전에 무작위 데이터로 두 경로의 결과가 완전히 같은지 먼저 검증한다.
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from core.riskCalculator import calculate_stroke_risk, get_risk_level
+from core.batchRiskCalculator import calculate_stroke_risk_batch
+
+def _maybe(rng: random.Random, value, missing_rate: float):
+    """일정 확률로 측정값을 누락(None) 처리"""
+    return None if rng.random() < missing_rate else value
+
+def generate_rows(n: int, seed: int = 42, missing_rate: float = 0.05) -> dict:
+    """경계값 주변을 포함한 무작위 컬럼 데이터 생성"""
+    rng = random.Random(seed)
+    return {
+        "age": [rng.randint(18, 95) for _ in range(n)],
+        "sex": [rng.choice(["M", "F"]) for _ in range(n)],
+        "stroke_history": [rng.random() < 0.1 for _ in range(n)],
+        "hypertension": [rng.random() < 0.3 for _ in range(n)],
+        "heart_disease": [rng.random() < 0.15 for _ in range(n)],
+        "diabetes": [rng.random() < 0.2 for _ in range(n)],
+        "smoking_history": [rng.choice(["SMOKER", "PAST_SMOKER", "NON_SMOKER"]) for _ in range(n)],
+        "systolic_bp": [_maybe(rng, rng.randint(0, 220), missing_rate) for _ in range(n)],
+        "diastolic_bp": [_maybe(rng, rng.randint(0, 140), missing_rate) for _ in range(n)],
+        "weight_kg": [_maybe(rng, round(rng.uniform(0, 140), 1), missing_rate) for _ in range(n)],
+        "height_cm": [_maybe(rng, rng.randint(0, 200), missing_rate) for _ in range(n)],
+        "glucose_level": [_maybe(rng, rng.randint(0, 300), missing_rate) for _ in range(n)],
+        "smoking": [_maybe(rng, rng.randint(0, 40), missing_rate) for _ in range(n)],
+    }
+
+def run_scalar(rows: dict):
+    """행마다 calculate_stroke_risk 호출"""
+    n = len(rows["age"])
+    keys = list(rows.keys())
+    scores = []
+    levels = []
+    for i in range(n):
+        score = calculate_stroke_risk(**{k: rows[k][i] for k in keys})
+        scores.append(score)
+        levels.append(get_risk_level(score))
+    return scores, levels
+
+def run_batch(rows: dict):
+    """컬럼 배열을 한 번에 계산"""
+    return calculate_stroke_risk_batch(**rows)
+
+def check_parity(rows: dict) -> None:
+    """스칼라/배치 결과가 비트 단위로 같은지 검증"""
+    scalar_scores, scalar_levels = run_scalar(rows)
+    batch_scores, batch_levels = run_batch(rows)
+
+    expected = np.asarray(scalar_scores, dtype=np.float64)
+    if expected.tobytes() != batch_scores.tobytes():
+        mismatch = int(np.flatnonzero(expected != batch_scores)[0])
+        row = {k: v[mismatch] for k, v in rows.items()}
+        raise AssertionError(
+            f"점수 불일치 (index={mismatch}): scalar={expected[mismatch]} batch={batch_scores[mismatch]} row={row}"
+        )
+    if list(batch_levels) != scalar_levels:
+        raise AssertionError("등급 불일치")
+
+def _timeit(fn, rows: dict, repeat: int) -> float:
+    """repeat 회 실행 중 최소 소요 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="위험도 계산 스칼라/배치 처리량 비교")
+    parser.add_argument("--rows", type=int, default=200_000, help="측정 데이터 행 수")
+    parser.add_argument("--parity-rows", type=int, default=50_000, help="결과 일치 검증에 사용할 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    check_parity(generate_rows(args.parity_rows, seed=args.seed))
+    print(f"✅ 결과 일치 확인 ({args.parity_rows:,}행)")
+
+    rows = generate_rows(args.rows, seed=args.seed + 1)
+    scalar_time = _timeit(run_scalar, rows, args.repeat)
+    batch_time = _timeit(run_batch, rows, args.repeat)
+
+    print(f"scalar: {scalar_time:.3f}s ({args.rows / scalar_time:,.0f} rows/s)")
+    print(f"batch : {batch_time:.3f}s ({args.rows / batch_time:,.0f} rows/s)")
+    print(f"speedup: x{scalar_time / batch_time:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# 건강 기록 저장 방식 비교 벤치마크: 일반 컬렉션 vs MongoDB 시계열 컬렉션
+# 실행: python -m benchmarks.timeseriesBenchmark --patients 200 --records 2000
+#
+# MONGO_URL의 별도 데이터베이스(기본값: stroke_benchmark)에 같은 무작위 기록을 두 컬렉션에 저장하고
+# 저장 크기(데이터/인덱스)와 앱에서 사용하는 범위 조회의 지연 시간을 비교한다. 끝나면 데이터베이스를 삭제한다.
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from core.indexRegistry import HEALTH_RECORDS_INDEXES, HEALTH_RECORDS_TS_INDEXES, timeseries_options
+from core.timeseriesMigration import storage_stats
+
+PLAIN = "plain_records"
+TIMESERIES = "timeseries_records"
+
+def generate_records(patients: int, per_patient: int, seed: int = 42):
+    """환자별로 하루 몇 번씩 측정한 기록 (오래된 순)"""
+    rng = random.Random(seed)
+    end = datetime.now().replace(microsecond=0)
+    for p in range(patients):
+        user_id = f"bench_patient_{p:05d}"
+        at = end - timedelta(hours=8 * per_patient)
+        for _ in range(per_patient):
+            at += timedelta(hours=rng.uniform(4, 12))
+            score = round(rng.uniform(5, 95), 1)
+            yield {
+                "_id": str(ObjectId()),
+                "user_id": user_id,
+                "weight_kg": round(rng.uniform(45, 110), 1),
+                "systolic_bp": rng.randint(95, 190),
+                "diastolic_bp": rng.randint(55, 120),
+                "glucose_level": rng.randint(70, 280),
+                "smoking": rng.choice([0, 0, 0, 5, 10, 20]),
+                "stroke_risk_score": score,
+                "stroke_risk_level": "낮음" if score < 30 else "보통" if score < 50 else "높음" if score < 70 else "매우 높음",
+                "created_at": at,
+            }
+
+async def load(db, name: str, docs, batch_size: int = 5000) -> float:
+    """기록 저장 소요 시간 (초)"""
+    start = time.perf_counter()
+    batch = []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            await db[name].insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await db[name].insert_many(batch, ordered=False)
+    return time.perf_counter() - start
+
+def query_cases(user_id: str, now: datetime):
+    """앱의 건강 기록 조회 패턴 (이름, 실행 함수)"""
+    last_30 = {"user_id": user_id, "created_at": {"$gte": now - timedelta(days=30)}}
+    return [
+        ("최신 100건 (목록 첫 페이지)", lambda c: c.find({"user_id": user_id}).sort([("created_at", -1), ("_id", -1)]).limit(100).to_list(length=100)),
+        ("최근 30일 전체 (추이/내보내기)", lambda c: c.find(last_30).sort("created_at", 1).to_list(length=None)),
+        ("최근 30일 평균 (집계)", lambda c: c.aggregate([
+            {"$match": last_30},
+            {"$group": {"_id": None, "bp": {"$avg": "$systolic_bp"}, "glucose": {"$max": "$glucose_level"}}},
+        ]).to_list(length=None)),
+        ("전체 기간 측정 수", lambda c: c.count_documents({"user_id": user_id})),
+    ]
+
+def _percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+async def time_queries(db, name: str, user_ids, repeat: int):
+    """조회 패턴별 (p50, p95) 밀리초"""
+    now = datetime.now()
+    results = {}
+    for user_id in user_ids[:3]:  # 워밍업
+        for _, run in query_cases(user_id, now):
+            await run(db[name])
+
+    timings = {}
+    for i in range(repeat):
+        user_id = user_ids[i % len(user_ids)]
+        for label, run in query_cases(user_id, now):
+            start = time.perf_counter()
+            await run(db[name])
+            timings.setdefault(label, []).append((time.perf_counter() - start) * 1000)
+
+    for label, values in timings.items():
+        results[label] = (statistics.median(values), _percentile(values, 0.95))
+    return results
+
+def _mb(size: int) -> str:
+    return f"{size / (1 << 20):,.1f}MB"
+
+async def run(args):
+    load_dotenv()
+    client = AsyncIOMotorClient(os.getenv("MONGO_URL"))
+    db = client[args.db]
+    try:
+        await client.drop_database(args.db)
+        await db.create_collection(TIMESERIES, **timeseries_options(args.granularity))
+        await db[PLAIN].create_indexes([spec.to_model() for spec in HEALTH_RECORDS_INDEXES])
+        await db[TIMESERIES].create_indexes([spec.to_model() for spec in HEALTH_RECORDS_TS_INDEXES])
+
+        total = args.patients * args.records
+        plain_load = await load(db, PLAIN, generate_records(args.patients, args.records, args.seed))
+        ts_load = await load(db, TIMESERIES, generate_records(args.patients, args.records, args.seed))
+        print(f"기록 {total:,}건 (환자 {args.patients:,}명 x {args.records:,}건), granularity={args.granularity}")
+        print(f"저장 시간   plain {plain_load:.2f}s / timeseries {ts_load:.2f}s")
+
+        # 저장 크기는 체크포인트 후에 정확해지므로 fsync로 디스크에 반영
+        await db.command("fsync")
+        plain_size = await storage_stats(db, PLAIN)
+        ts_size = await storage_stats(db, TIMESERIES)
+        print(f"데이터 크기 plain {_mb(plain_size['storage_size'])} / timeseries {_mb(ts_size['storage_size'])}")
+        print(f"인덱스 크기 plain {_mb(plain_size['index_size'])} / timeseries {_mb(ts_size['index_size'])}")
+
+        user_ids = [f"bench_patient_{p:05d}" for p in random.Random(args.seed).sample(range(args.patients), min(50, args.patients))]
+        plain_times = await time_queries(db, PLAIN, user_ids, args.repeat)
+        ts_times = await time_queries(db, TIMESERIES, user_ids, args.repeat)
+        print(f"\n{'조회':<28} {'plain p50/p95 (ms)':>20} {'timeseries p50/p95 (ms)':>26}")
+        for label, (p50, p95) in plain_times.items():
+            ts_p50, ts_p95 = ts_times[label]
+            print(f"{label:<28} {p50:>9.2f} / {p95:<8.2f} {ts_p50:>12.2f} / {ts_p95:<8.2f}")
+    finally:
+        if not args.keep:
+            await client.drop_database(args.db)
+        client.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="건강 기록 일반 컬렉션 vs 시계열 컬렉션 저장 크기/조회 지연 비교")
+    parser.add_argument("--patients", type=int, default=200, help="환자 수")
+    parser.add_argument("--records", type=int, default=2000, help="환자당 기록 수")
+    parser.add_argument("--granularity", choices=["seconds", "minutes", "hours"], default="hours")
+    parser.add_argument("--repeat", type=int, default=200, help="조회 패턴별 반복 횟수")
+    parser.add_argument("--db", default="stroke_benchmark", help="벤치마크용 데이터베이스 (실행 전후 삭제)")
+    parser.add_argument("--keep", action="store_true", help="끝난 후 데이터베이스를 삭제하지 않음")
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
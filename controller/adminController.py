@@ -0,0 +1,57 @@
+# AdminController
+# 운영/관리용 요청을 처리하는 모듈 (X-Admin-Token 헤더 필요)
+
+import secrets
+from fastapi import APIRouter, Depends, HTTPException, Request, Header, Query
+from schemas.importSchema import ImportFormat, ImportReport
+from services import importService
+from core.config import settings
+from typing import Optional
+
+# 의존성: 관리자 토큰 확인 (설정에 토큰이 없으면 관리자 API 비활성화)
+def verify_admin_token(x_admin_token: Optional[str] = Header(None)):
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다. (ADMIN_TOKEN 미설정)")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 올바르지 않습니다.")
+
+router = APIRouter(dependencies=[Depends(verify_admin_token)])
+
+# 의존성: DB 가져오기
+def get_db(request: Request):
+    return request.app.mongodb
+
+# 과거 건강 기록 가져오기
+@router.post("/import/health-records", response_model=ImportReport)
+async def import_health_records(
+    request: Request,
+    format: ImportFormat = Query(..., description="ndjson 또는 csv"),
+    job_id: Optional[str] = Query(None, description="이어서 진행할 작업 ID"),
+    db=Depends(get_db)
+):
+    """
+    과거 건강 기록 가져오기 (요청 본문을 스트리밍으로 읽음)
+    - 본문: NDJSON(한 줄에 객체 하나) 또는 CSV(첫 줄 헤더)
+    - 각 행: user_id, weight_kg, systolic_bp, diastolic_bp, glucose_level, smoking, created_at
+    - 중단되면 응답/조회 결과의 job_id로 같은 파일을 다시 보내면 체크포인트 이후부터 이어서 진행
+    """
+    try:
+        return await importService.import_health_records(
+            db, importService.iter_lines(request.stream()), format, job_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"가져오기 실패: {str(e)}")
+
+# 가져오기 작업 상태 조회
+@router.get("/import/{job_id}", response_model=ImportReport)
+async def get_import_job(job_id: str, db=Depends(get_db)):
+    """
+    가져오기 작업 진행 상태/결과 조회
+    - **job_id**: 작업 ID
+    """
+    report = await importService.get_import_report(db, job_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="가져오기 작업을 찾을 수 없습니다.")
+    return report
@@ -2,10 +2,24 @@
 # health data 관련 요청을 처리하는 모듈
 # 시계열 건강 측정 데이터
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
-from schemas.healthSchema import HealthRecordInput, HealthRecordResponse
-from services import healthService
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Query
+from schemas.healthSchema import (
+    HealthRecordInput,
+    HealthRecordResponse,
+    HealthRecordBatchInput,
+    HealthRecordBatchResponse,
+    HealthTrendResponse,
+    HealthStatsResponse,
+    TrendMetric,
+    ExportFormat
+)
+from fastapi.responses import StreamingResponse
+from services import healthService, healthStatsService, exportService
+from core.pagination import PageParams, get_page_params, set_next_cursor
+from core.fastRead import RawJSONResponse
+from core.config import settings
+from typing import List, Optional
+from datetime import datetime
 
 router = APIRouter()
 
@@ -31,14 +45,50 @@ async def create_health_record(record_input: HealthRecordInput, db=Depends(get_d
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"건강 측정 데이터 생성 실패: {str(e)}")
 
+# 건강 측정 데이터 일괄 생성
+@router.post("/records/batch", response_model=HealthRecordBatchResponse)
+async def create_health_records_batch(
+    batch: HealthRecordBatchInput,
+    db=Depends(get_db)
+):
+    """
+    건강 측정 데이터 일괄 생성 (기기에 쌓인 측정 동기화용, 여러 사용자 가능)
+    - **records**: 측정 데이터 목록 (항목 형식은 POST /records와 같고 created_at(측정 시각)을 추가로 받음)
+    - 항목별 성공/실패를 요청 순서대로 반환 (일부 항목이 실패해도 나머지는 저장)
+    - 본문 크기(HEALTH_BATCH_MAX_BYTES)는 파싱 전에 main.py의 BodySizeLimitMiddleware에서 확인 (넘으면 413)
+    """
+    try:
+        return await healthService.create_health_records_batch(db, batch)
+    except healthService.BatchTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"건강 측정 데이터 일괄 생성 실패: {str(e)}")
+
 # 사용자별 건강 측정 데이터 조회
 @router.get("/records/user/{user_id}", response_model=List[HealthRecordResponse])
-async def get_user_health_records(user_id: str, db=Depends(get_db)):
+async def get_user_health_records(
+    user_id: str,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    db=Depends(get_db)
+):
     """
-    특정 사용자의 건강 측정 데이터 목록 조회 (최신순)
+    특정 사용자의 건강 측정 데이터 목록 조회 (최신순, 커서 기반 페이지)
     - **user_id**: 사용자 ID
+    - **limit**: 페이지 크기
+    - **after**: 다음 페이지 커서 (응답 헤더 X-Next-Cursor)
     """
-    records = await healthService.get_user_health_records(db, user_id)
+    if settings.fast_read_path:
+        # 빠른 읽기 경로: 모델 없이 JSON 바이트로 응답 (주입된 response 헤더는 반영되지 않으므로 직접 설정)
+        body, next_cursor = await healthService.get_user_health_records_json(db, user_id, page.limit, page.after)
+        raw = RawJSONResponse(body)
+        set_next_cursor(raw, next_cursor)
+        return raw
+
+    records, next_cursor = await healthService.get_user_health_records(db, user_id, page.limit, page.after)
+    set_next_cursor(response, next_cursor)
     return records
 
 # 최신 건강 측정 데이터 조회
@@ -48,11 +98,72 @@ async def get_latest_health_record(user_id: str, db=Depends(get_db)):
     사용자의 가장 최근 건강 측정 데이터 조회
     - **user_id**: 사용자 ID
     """
+    if settings.fast_read_path:
+        body = await healthService.get_latest_health_record_json(db, user_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="건강 측정 데이터를 찾을 수 없습니다.")
+        return RawJSONResponse(body)
+
     record = await healthService.get_latest_health_record(db, user_id)
     if not record:
         raise HTTPException(status_code=404, detail="건강 측정 데이터를 찾을 수 없습니다.")
     return record
 
+# 측정 항목 추이 조회 (그래프용, 다운샘플링)
+@router.get("/records/user/{user_id}/trend", response_model=HealthTrendResponse)
+async def get_health_trend(
+    user_id: str,
+    metric: TrendMetric = Query(TrendMetric.STROKE_RISK_SCORE, description="측정 항목"),
+    start: Optional[datetime] = Query(None, description="조회 시작 시각"),
+    end: Optional[datetime] = Query(None, description="조회 종료 시각"),
+    points: int = Query(100, ge=3, le=1000, description="최대 점 개수"),
+    db=Depends(get_db)
+):
+    """
+    측정 항목 추이 조회 (LTTB 다운샘플링, 오래된 순)
+    - **user_id**: 사용자 ID
+    - **metric**: 측정 항목 (기본값: stroke_risk_score)
+    - **start**, **end**: 조회 기간 (선택)
+    - **points**: 반환할 최대 점 개수
+    """
+    return await healthService.get_health_trend(db, user_id, metric, points, start, end)
+
+# 건강 통계 조회
+@router.get("/records/user/{user_id}/stats", response_model=HealthStatsResponse)
+async def get_health_stats(user_id: str, db=Depends(get_db)):
+    """
+    사용자 건강 통계 조회 (전체 기간, 최근 7/30/90일, 이번 달)
+    - **user_id**: 사용자 ID
+    - 측정 항목별 측정 수/평균/최소/최대 (혈압, 혈당, 체중, BMI, 위험도)
+    """
+    return await healthStatsService.get_health_stats(db, user_id)
+
+def _export_response(db, user_ids: List[str], name: str, format: ExportFormat, start, end, gzip: bool) -> StreamingResponse:
+    return StreamingResponse(
+        exportService.export_health_records(db, user_ids, format, start, end, gzip),
+        media_type=exportService.media_type(format, gzip),
+        headers={"Content-Disposition": f'attachment; filename="{exportService.export_filename(name, format, gzip)}"'}
+    )
+
+# 건강 측정 데이터 내보내기 (전체 기록)
+@router.get("/records/user/{user_id}/export")
+async def export_health_records(
+    user_id: str,
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv 또는 ndjson"),
+    start: Optional[datetime] = Query(None, description="시작 시각"),
+    end: Optional[datetime] = Query(None, description="종료 시각"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+    db=Depends(get_db)
+):
+    """
+    사용자의 전체 건강 측정 데이터를 파일로 내보내기 (스트리밍, 오래된 순)
+    - **user_id**: 사용자 ID
+    - **format**: csv(기본값) 또는 ndjson
+    - **start**, **end**: 기간 (선택)
+    - **gzip**: true면 .gz 파일로 압축
+    """
+    return _export_response(db, [user_id], f"health_records_{user_id}", format, start, end, gzip)
+
 # 건강 측정 데이터 삭제
 @router.delete("/records/{record_id}", response_model=HealthRecordResponse, status_code=200)
 async def delete_health_record(record_id: str, db=Depends(get_db)):
@@ -67,14 +178,33 @@ async def delete_health_record(record_id: str, db=Depends(get_db)):
 
 # 모니터링 권한으로 환자 건강 데이터 조회
 @router.get("/records/monitor/{monitor_id}/patient/{patient_id}", response_model=List[HealthRecordResponse])
-async def get_monitored_patient_records(monitor_id: str, patient_id: str, db=Depends(get_db)):
+async def get_monitored_patient_records(
+    monitor_id: str,
+    patient_id: str,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    db=Depends(get_db)
+):
     """
-    모니터링 권한이 있는 사용자가 환자의 건강 측정 데이터 조회
+    모니터링 권한이 있는 사용자가 환자의 건강 측정 데이터 조회 (커서 기반 페이지)
     - **monitor_id**: 모니터(의사/보호자) ID
     - **patient_id**: 환자 ID
+    - **limit**: 페이지 크기
+    - **after**: 다음 페이지 커서 (응답 헤더 X-Next-Cursor)
     """
     try:
-        records = await healthService.get_monitored_patient_records(db, monitor_id, patient_id)
+        if settings.fast_read_path:
+            body, next_cursor = await healthService.get_monitored_patient_records_json(
+                db, monitor_id, patient_id, page.limit, page.after
+            )
+            raw = RawJSONResponse(body)
+            set_next_cursor(raw, next_cursor)
+            return raw
+
+        records, next_cursor = await healthService.get_monitored_patient_records(
+            db, monitor_id, patient_id, page.limit, page.after
+        )
+        set_next_cursor(response, next_cursor)
         return records
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
@@ -90,6 +220,12 @@ async def get_monitored_patient_latest_record(monitor_id: str, patient_id: str,
     - **patient_id**: 환자 ID
     """
     try:
+        if settings.fast_read_path:
+            body = await healthService.get_monitored_patient_latest_record_json(db, monitor_id, patient_id)
+            if body is None:
+                raise HTTPException(status_code=404, detail="건강 측정 데이터를 찾을 수 없습니다.")
+            return RawJSONResponse(body)
+
         record = await healthService.get_monitored_patient_latest_record(db, monitor_id, patient_id)
         if not record:
             raise HTTPException(status_code=404, detail="건강 측정 데이터를 찾을 수 없습니다.")
@@ -98,3 +234,68 @@ async def get_monitored_patient_latest_record(monitor_id: str, patient_id: str,
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 조회 실패: {str(e)}")
+
+# 모니터링 권한으로 환자 측정 항목 추이 조회
+@router.get("/records/monitor/{monitor_id}/patient/{patient_id}/trend", response_model=HealthTrendResponse)
+async def get_monitored_patient_trend(
+    monitor_id: str,
+    patient_id: str,
+    metric: TrendMetric = Query(TrendMetric.STROKE_RISK_SCORE, description="측정 항목"),
+    start: Optional[datetime] = Query(None, description="조회 시작 시각"),
+    end: Optional[datetime] = Query(None, description="조회 종료 시각"),
+    points: int = Query(100, ge=3, le=1000, description="최대 점 개수"),
+    db=Depends(get_db)
+):
+    """
+    모니터링 권한이 있는 사용자가 환자의 측정 항목 추이 조회 (LTTB 다운샘플링)
+    - **monitor_id**: 모니터(의사/보호자) ID
+    - **patient_id**: 환자 ID
+    - **metric**: 측정 항목 (기본값: stroke_risk_score)
+    - **start**, **end**: 조회 기간 (선택)
+    - **points**: 반환할 최대 점 개수
+    """
+    try:
+        return await healthService.get_monitored_patient_trend(db, monitor_id, patient_id, metric, points, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 조회 실패: {str(e)}")
+
+# 모니터링 권한으로 환자 건강 통계 조회
+@router.get("/records/monitor/{monitor_id}/patient/{patient_id}/stats", response_model=HealthStatsResponse)
+async def get_monitored_patient_stats(monitor_id: str, patient_id: str, db=Depends(get_db)):
+    """
+    모니터링 권한이 있는 사용자가 환자의 건강 통계 조회
+    - **monitor_id**: 모니터(의사/보호자) ID
+    - **patient_id**: 환자 ID
+    """
+    try:
+        return await healthStatsService.get_monitored_patient_stats(db, monitor_id, patient_id)
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 조회 실패: {str(e)}")
+
+# 모니터링 권한으로 환자(여러 명) 건강 측정 데이터 내보내기
+@router.get("/records/monitor/{monitor_id}/export")
+async def export_monitored_patient_records(
+    monitor_id: str,
+    patient_id: Optional[List[str]] = Query(None, description="환자 ID (여러 번 지정 가능, 없으면 모니터링 중인 전체 환자)"),
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv 또는 ndjson"),
+    start: Optional[datetime] = Query(None, description="시작 시각"),
+    end: Optional[datetime] = Query(None, description="종료 시각"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+    db=Depends(get_db)
+):
+    """
+    모니터링 중인 환자들의 전체 건강 측정 데이터를 한 파일로 내보내기 (스트리밍)
+    - **monitor_id**: 모니터(의사/보호자) ID
+    - **patient_id**: 환자 ID (여러 번 지정 가능, 생략 시 모니터링 중인 전체 환자)
+    - 환자 ID 순, 환자별로는 오래된 순
+    """
+    try:
+        patient_ids = await exportService.resolve_monitor_cohort(db, monitor_id, patient_id)
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    
+    return _export_response(db, patient_ids, f"health_records_{monitor_id}_patients", format, start, end, gzip)
@@ -1,9 +1,12 @@
 # MemoController에 대응
 # memo 관련 요청을 처리하는 모듈
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Query
 from schemas.memoSchema import MemoCreate, MemoResponse
 from services import memoService
+from core.pagination import PageParams, get_page_params, set_next_cursor
+from core.fastRead import RawJSONResponse
+from core.config import settings
 from typing import List, Optional
 
 router = APIRouter()
@@ -36,6 +39,12 @@ async def get_memo(memo_id: str, db=Depends(get_db)):
     메모 ID로 단건 조회
     - **memo_id**: 메모 ID
     """
+    if settings.fast_read_path:
+        body = await memoService.get_memo_json(db, memo_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="메모를 찾을 수 없습니다.")
+        return RawJSONResponse(body)
+
     memo = await memoService.get_memo(db, memo_id)
     if not memo:
         raise HTTPException(status_code=404, detail="메모를 찾을 수 없습니다.")
@@ -44,30 +53,50 @@ async def get_memo(memo_id: str, db=Depends(get_db)):
 # 메모 목록 조회 (다양한 필터)
 @router.get("", response_model=List[MemoResponse])
 async def get_memos(
+    response: Response,
     doctor_id: Optional[str] = Query(None, description="의사 ID로 필터링"),
     patient_id: Optional[str] = Query(None, description="환자 ID로 필터링"),
+    include_author: bool = Query(False, description="작성자(의사) 이름 포함 여부"),
+    page: PageParams = Depends(get_page_params),
     db=Depends(get_db)
 ):
     """
-    메모 목록 조회
+    메모 목록 조회 (최신순, 커서 기반 페이지)
     - **doctor_id**: (선택) 특정 의사가 작성한 메모만 조회
     - **patient_id**: (선택) 특정 환자에 대한 메모만 조회
     - 두 파라미터 모두 제공 시: 특정 의사가 특정 환자에 대해 작성한 메모 조회
+    - **include_author**: true면 각 메모에 작성자 이름(doctor_name) 포함 (한 번에 조회)
+    - **limit**: 페이지 크기
+    - **after**: 다음 페이지 커서 (응답 헤더 X-Next-Cursor)
     """
     try:
+        if settings.fast_read_path and (doctor_id or patient_id):
+            # 빠른 읽기 경로: 모델 없이 JSON 바이트로 응답 (주입된 response 헤더는 반영되지 않으므로 직접 설정)
+            body, next_cursor = await memoService.get_memos_json(
+                db, doctor_id, patient_id, page.limit, page.after, include_author
+            )
+            raw = RawJSONResponse(body)
+            set_next_cursor(raw, next_cursor)
+            return raw
+
         if doctor_id and patient_id:
             # 특정 의사가 특정 환자에 대해 작성한 메모
-            memos = await memoService.get_memos_by_doctor_and_patient(db, doctor_id, patient_id)
+            memos, next_cursor = await memoService.get_memos_by_doctor_and_patient(
+                db, doctor_id, patient_id, page.limit, page.after, include_author
+            )
         elif doctor_id:
-            # 특정 의사가 작성한 모든 메모
-            memos = await memoService.get_memos_by_doctor(db, doctor_id)
+            # 특정 의사가 작성한 메모
+            memos, next_cursor = await memoService.get_memos_by_doctor(db, doctor_id, page.limit, page.after, include_author)
         elif patient_id:
-            # 특정 환자에 대한 모든 메모
-            memos = await memoService.get_memos_by_patient(db, patient_id)
+            # 특정 환자에 대한 메모
+            memos, next_cursor = await memoService.get_memos_by_patient(db, patient_id, page.limit, page.after, include_author)
         else:
             raise HTTPException(status_code=400, detail="doctor_id 또는 patient_id 중 최소 하나를 제공해야 합니다.")
         
+        set_next_cursor(response, next_cursor)
         return memos
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
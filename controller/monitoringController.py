@@ -6,9 +6,14 @@ from schemas.monitoringSchema import (
     MonitoringRequestCreate,
     MonitoringRequestResponse,
     MonitoringApproval,
-    MonitoringRelationResponse
+    MonitoringRelationResponse,
+    PatientDashboardItem
 )
+from fastapi.responses import StreamingResponse
 from services import monitoringService
+from core.config import settings
+from core.eventBroker import event_broker, stream_events
+from core.pagination import PageParams, get_page_params, set_next_cursor
 from typing import List
 
 router = APIRouter()
@@ -42,26 +47,36 @@ async def create_monitoring_request(
 @router.get("/requests/pending/{patient_id}", response_model=List[MonitoringRequestResponse])
 async def get_pending_requests(
     patient_id: str,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db=Depends(get_db)
 ):
     """
     환자가 받은 대기 중인 모니터링 요청 목록
     - **patient_id**: 환자 ID
+    - **limit**: 페이지 크기
+    - **after**: 다음 페이지 커서 (응답 헤더 X-Next-Cursor)
     """
-    requests = await monitoringService.get_pending_requests_for_patient(db, patient_id)
+    requests, next_cursor = await monitoringService.get_pending_requests_for_patient(db, patient_id, page.limit, page.after)
+    set_next_cursor(response, next_cursor)
     return requests
 
 # 모니터가 보낸 요청 조회
 @router.get("/requests/sent/{requester_id}", response_model=List[MonitoringRequestResponse])
 async def get_sent_requests(
     requester_id: str,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db=Depends(get_db)
 ):
     """
     의사/보호자가 보낸 모니터링 요청 목록
     - **requester_id**: 요청자 ID (의사/보호자)
+    - **limit**: 페이지 크기
+    - **after**: 다음 페이지 커서 (응답 헤더 X-Next-Cursor)
     """
-    requests = await monitoringService.get_requests_by_requester(db, requester_id)
+    requests, next_cursor = await monitoringService.get_requests_by_requester(db, requester_id, page.limit, page.after)
+    set_next_cursor(response, next_cursor)
     return requests
 
 # 모니터링 요청 승인/거부
@@ -111,28 +126,77 @@ async def cancel_monitoring_request(
 @router.get("/relations/{patient_id}", response_model=List[MonitoringRelationResponse])
 async def get_patient_relations(
     patient_id: str,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db=Depends(get_db)
 ):
     """
     특정 환자의 승인된 모니터링 관계 목록
     - **patient_id**: 환자 ID
+    - **limit**: 페이지 크기
+    - **after**: 다음 페이지 커서 (응답 헤더 X-Next-Cursor)
     """
-    relations = await monitoringService.get_patient_relations(db, patient_id)
+    relations, next_cursor = await monitoringService.get_patient_relations(db, patient_id, page.limit, page.after)
+    set_next_cursor(response, next_cursor)
     return relations
 
 # 내가 모니터링하는 환자 목록
 @router.get("/my-patients/{monitor_id}", response_model=List[MonitoringRelationResponse])
 async def get_my_patients(
     monitor_id: str,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db=Depends(get_db)
 ):
     """
     의사/보호자가 모니터링 중인 환자 목록
     - **monitor_id**: 의사/보호자 ID
+    - **limit**: 페이지 크기
+    - **after**: 다음 페이지 커서 (응답 헤더 X-Next-Cursor)
     """
-    patients = await monitoringService.get_my_patients(db, monitor_id)
+    patients, next_cursor = await monitoringService.get_my_patients(db, monitor_id, page.limit, page.after)
+    set_next_cursor(response, next_cursor)
     return patients
 
+# 실시간 이벤트 구독 (Server-Sent Events)
+@router.get("/events/{user_id}")
+async def subscribe_events(
+    user_id: str,
+    db=Depends(get_db)
+):
+    """
+    실시간 이벤트 스트림 (text/event-stream)
+    - **user_id**: 구독하는 사용자 ID (환자 또는 의사/보호자)
+    - 이벤트: health_record_created, risk_level_changed, memo_created, monitoring_request_responded
+    - lagged: 연결이 느려 이벤트가 버려졌음 (목록을 다시 조회해야 함)
+    """
+    try:
+        await monitoringService.validate_event_subscriber(db, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    return StreamingResponse(
+        stream_events(event_broker, user_id, settings.event_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# 모니터 대시보드 (환자별 최신 측정/위험도 요약)
+@router.get("/dashboard/{monitor_id}", response_model=List[PatientDashboardItem])
+async def get_monitor_dashboard(
+    monitor_id: str,
+    db=Depends(get_db)
+):
+    """
+    의사/보호자가 모니터링 중인 모든 환자의 최신 측정 데이터, 위험도, 측정 수
+    - **monitor_id**: 의사/보호자 ID
+    - 위험도 높은 순으로 정렬 (측정 기록이 없는 환자는 마지막)
+    """
+    try:
+        return await monitoringService.get_monitor_dashboard(db, monitor_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"대시보드 조회 실패: {str(e)}")
+
 # 모니터링 관계 해제
 @router.delete("/relation/{relation_id}", status_code=204)
 async def delete_relation(
@@ -69,7 +69,10 @@ async def update_user(user_id: str, user_data: UserUpdate, db=Depends(get_db)):
     # None이 아닌 필드만 추출
     update_dict = user_data.model_dump(exclude_unset=True, exclude={"id"})
     
-    updated_user = await userService.update_user(db, user_id, update_dict)
+    try:
+        updated_user = await userService.update_user(db, user_id, update_dict)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not updated_user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
     return updated_user
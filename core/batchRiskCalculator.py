@@ -0,0 +1,149 @@
+# RiskCalculator의 배치(벡터화) 버전
+# 여러 건의 측정 데이터를 NumPy 배열 단위로 한 번에 위험도 계산하는 모듈
+# 결과는 core.riskCalculator.calculate_stroke_risk / get_risk_level 과 비트 단위로 동일해야 한다
+
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+# 위험도 등급 (get_risk_level과 동일한 경계값)
+RISK_LEVEL_BOUNDS = (20, 40, 60)
+RISK_LEVEL_NAMES = ("낮음", "보통", "높음", "매우 높음")
+
+def _as_float(values: Optional[Sequence], n: int) -> np.ndarray:
+    """측정값 컬럼을 float64 배열로 변환 (None/누락 → NaN)"""
+    if values is None:
+        return np.full(n, np.nan)
+    return np.asarray(values, dtype=np.float64)
+
+def _as_bool(values: Optional[Sequence], n: int) -> np.ndarray:
+    """질병력 플래그 컬럼을 bool 배열로 변환 (None → False)"""
+    if values is None:
+        return np.zeros(n, dtype=bool)
+    return np.asarray(values, dtype=bool)
+
+def _truthy(values: np.ndarray) -> np.ndarray:
+    """스칼라 버전의 `if value:` 판정 (None/NaN, 0 → False)"""
+    return ~np.isnan(values) & (values != 0)
+
+def calculate_stroke_risk_batch(
+    # 사용자 기본 정보
+    age: Sequence[int],
+    sex: Sequence[str],  # "M" or "F"
+    # 건강 상태 (고정)
+    stroke_history: Optional[Sequence[bool]] = None,
+    hypertension: Optional[Sequence[bool]] = None,
+    heart_disease: Optional[Sequence[bool]] = None,
+    diabetes: Optional[Sequence[bool]] = None,
+    smoking_history: Optional[Sequence[str]] = None,  # "SMOKER", "PAST_SMOKER", "NON_SMOKER"
+    # 측정 데이터 (변동, 누락값은 None 또는 NaN)
+    systolic_bp: Optional[Sequence[float]] = None,
+    diastolic_bp: Optional[Sequence[float]] = None,
+    weight_kg: Optional[Sequence[float]] = None,
+    height_cm: Optional[Sequence[float]] = None,
+    glucose_level: Optional[Sequence[float]] = None,
+    smoking: Optional[Sequence[float]] = None  # 현재 흡연량 (개비/일)
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    뇌졸중 위험도 점수/등급 일괄 계산
+
+    각 인자는 같은 길이의 컬럼 배열이며, i번째 원소끼리 하나의 측정 데이터를 구성한다.
+    calculate_stroke_risk를 행마다 호출한 결과와 동일한 값을 반환한다.
+
+    Returns:
+        (점수 배열 float64, 등급 배열 object)
+    """
+    age = np.asarray(age, dtype=np.float64)
+    n = age.shape[0]
+
+    sex = np.asarray(sex, dtype=object)
+    if smoking_history is None:
+        smoking_history = np.full(n, "NON_SMOKER", dtype=object)
+    else:
+        smoking_history = np.asarray(smoking_history, dtype=object)
+
+    stroke_history = _as_bool(stroke_history, n)
+    hypertension = _as_bool(hypertension, n)
+    heart_disease = _as_bool(heart_disease, n)
+    diabetes = _as_bool(diabetes, n)
+
+    systolic_bp = _as_float(systolic_bp, n)
+    diastolic_bp = _as_float(diastolic_bp, n)
+    weight_kg = _as_float(weight_kg, n)
+    height_cm = _as_float(height_cm, n)
+    glucose_level = _as_float(glucose_level, n)
+    smoking = _as_float(smoking, n)
+
+    risk_score = np.zeros(n, dtype=np.float64)
+
+    # 1. 나이 (최대 20점)
+    risk_score += np.select(
+        [age < 40, age < 50, age < 60, age < 70],
+        [0.0, 5.0, 10.0, 15.0],
+        default=20.0
+    )
+
+    # 2. 성별 (남성 가산 5점)
+    risk_score += np.where(sex == "M", 5.0, 0.0)
+
+    # 3~6. 질병력
+    risk_score += np.where(stroke_history, 30.0, 0.0)
+    risk_score += np.where(hypertension, 15.0, 0.0)
+    risk_score += np.where(heart_disease, 15.0, 0.0)
+    risk_score += np.where(diabetes, 10.0, 0.0)
+
+    # 7. 흡연 이력 및 현재 흡연량 (최대 15점)
+    smoking_truthy = _truthy(smoking)
+    with np.errstate(invalid="ignore"):
+        current_smoker = (smoking_history == "SMOKER") | (smoking_truthy & (smoking > 0))
+        current_points = np.where(
+            smoking_truthy,
+            np.select([smoking >= 20, smoking >= 10], [15.0, 12.0], default=8.0),
+            10.0
+        )
+    risk_score += np.select(
+        [current_smoker, smoking_history == "PAST_SMOKER"],
+        [current_points, 5.0],
+        default=0.0
+    )
+
+    # 8. 혈압 수치 (최대 20점)
+    with np.errstate(invalid="ignore"):
+        bp_points = np.select(
+            [
+                (systolic_bp >= 180) | (diastolic_bp >= 120),
+                (systolic_bp >= 160) | (diastolic_bp >= 100),
+                (systolic_bp >= 140) | (diastolic_bp >= 90),
+                (systolic_bp >= 130) | (diastolic_bp >= 85),
+            ],
+            [20.0, 15.0, 10.0, 5.0],
+            default=0.0
+        )
+    risk_score += np.where(_truthy(systolic_bp) & _truthy(diastolic_bp), bp_points, 0.0)
+
+    # 9. BMI (최대 10점)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        height_m = height_cm / 100
+        bmi = weight_kg / (height_m ** 2)
+        bmi_points = np.select([bmi >= 30, bmi >= 25, bmi < 18.5], [10.0, 5.0, 3.0], default=0.0)
+    risk_score += np.where(_truthy(weight_kg) & _truthy(height_cm), bmi_points, 0.0)
+
+    # 10. 혈당 수치 (최대 10점)
+    with np.errstate(invalid="ignore"):
+        glucose_points = np.select(
+            [glucose_level >= 200, glucose_level >= 140, glucose_level >= 100],
+            [10.0, 7.0, 4.0],
+            default=0.0
+        )
+    risk_score += np.where(_truthy(glucose_level), glucose_points, 0.0)
+
+    # 최종 점수는 0-100 사이로 제한
+    risk_score = np.round(np.minimum(risk_score, 100.0), 1)
+
+    return risk_score, get_risk_level_batch(risk_score)
+
+
+def get_risk_level_batch(risk_score: np.ndarray) -> np.ndarray:
+    """위험도 점수 배열을 등급 배열로 변환 (get_risk_level의 배치 버전)"""
+    risk_score = np.asarray(risk_score, dtype=np.float64)
+    index = np.searchsorted(np.asarray(RISK_LEVEL_BOUNDS, dtype=np.float64), risk_score, side="right")
+    return np.asarray(RISK_LEVEL_NAMES, dtype=object)[index]
@@ -0,0 +1,77 @@
+# 요청 본문 크기 제한 ASGI 미들웨어
+# FastAPI는 본문을 모두 읽고 JSON으로 파싱한 뒤에 라우트 함수/의존성을 실행하므로,
+# 라우트 안에서 크기를 확인하면 이미 메모리/CPU를 쓴 뒤다. 그래서 라우트 앞에서 본문을 읽으며 제한한다.
+#
+# - Content-Length 헤더가 제한보다 크면 본문을 읽지 않고 413
+# - 헤더가 없거나(chunked) 실제 본문이 더 길면 제한을 넘는 순간 읽기를 멈추고 413
+# - 제한 이내면 읽은 본문을 그대로 라우트에 넘긴다 (제한 크기까지만 메모리에 보관)
+
+from typing import Dict, Optional, Tuple
+
+from starlette.responses import JSONResponse
+
+BODY_METHODS = ("POST", "PUT", "PATCH")
+
+class BodySizeLimitMiddleware:
+    """
+    경로별 요청 본문 최대 크기 (바이트)
+
+    Args:
+        limits: {경로: 최대 바이트} (예: {"/health/records/batch": 1_000_000}, 경로는 정확히 일치해야 함)
+    """
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" and scope["method"] in BODY_METHODS else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            await self._reject(scope, receive, send, limit)
+            return
+
+        body, disconnected = await self._read_body(receive, limit)
+        if body is None:
+            if not disconnected:
+                await self._reject(scope, receive, send, limit)
+            return
+
+        replayed = False
+
+        async def replay_receive():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
+
+    async def _read_body(self, receive, limit: int) -> Tuple[Optional[bytes], bool]:
+        """본문 전체 읽기 (제한을 넘으면 (None, False), 클라이언트가 끊으면 (None, True))"""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None, True
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > limit:
+                return None, False
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                return b"".join(chunks), False
+
+    async def _reject(self, scope, receive, send, limit: int) -> None:
+        response = JSONResponse(
+            {"detail": f"요청 본문은 최대 {limit}바이트까지 허용됩니다."},
+            status_code=413,
+            headers={"Connection": "close"}
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,96 @@
+# 프로세스 내 메모리 캐시
+# LRU 방식으로 최대 크기를 제한하고, TTL이 지난 항목은 조회 시 만료 처리한다
+#
+# DB 조회 후 저장하는 경우 조회 중에 invalidate()가 불리면 조회 전 값을 다시 넣게 되므로,
+# 조회 전에 token(key)을 받아 두고 set(key, value, token)으로 저장한다 (그 사이 무효화되었으면 저장하지 않음)
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class TTLCache:
+    """
+    크기 제한(LRU) + TTL 캐시
+
+    - max_size를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - ttl_seconds가 None이면 만료 없음
+    - hit/miss/eviction/expiration 카운터 제공
+    - 키별 세대 번호: invalidate()마다 증가, token이 다르면 set()을 버림 (stale_sets 카운터)
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (만료 시각, 값)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_sets = 0
+        # 키별 무효화 세대 (max_size를 넘으면 비우고 epoch를 올려서 이전 token을 모두 무효로 만든다)
+        self._generations: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._epoch = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값 반환 (없거나 만료되면 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def token(self, key: Hashable) -> tuple:
+        """현재 세대 (값을 읽기 전에 받아서 set에 넘김)"""
+        return self._epoch, self._generations.get(key, 0)
+
+    def set(self, key: Hashable, value: Any, token: Optional[tuple] = None) -> bool:
+        """
+        값 저장 (가득 차면 LRU 항목 제거)
+        token을 받은 뒤 invalidate/clear 되었으면 저장하지 않고 False 반환
+        """
+        if token is not None and token != self.token(key):
+            self.stale_sets += 1
+            return False
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """항목 제거 (없어도 무시) + 세대 증가"""
+        self._data.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        self._generations.move_to_end(key)
+        if len(self._generations) > self.max_size:
+            self._generations.clear()
+            self._epoch += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._generations.clear()
+        self._epoch += 1
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 카운터"""
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_sets": self.stale_sets,
+        }
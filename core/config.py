@@ -0,0 +1,114 @@
+# 애플리케이션 설정
+# 환경 변수(.env 포함)에서 값을 읽어 타입이 지정된 설정 객체로 제공한다
+# 환경 변수 이름은 필드 이름을 대문자로 바꾼 것 (예: user_cache_enabled → USER_CACHE_ENABLED)
+
+import os
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from typing import Any, Dict, Literal, Optional
+
+# 건강 기록 컬렉션 이름 (일반 컬렉션 / 시계열 컬렉션)
+HEALTH_RECORDS_COLLECTION = "health_records"
+HEALTH_RECORDS_TS_COLLECTION = "health_records_ts"
+
+class Settings(BaseModel):
+    # 사용할 MongoDB 데이터베이스 이름 (접속 주소는 MONGO_URL)
+    mongo_db_name: str = "stroke_db"
+
+    # MongoDB 연결 풀/타임아웃/압축/읽기 설정 (mongo_client_options) - 클라이언트는 워커 프로세스마다 하나
+    # 서버 쪽 최대 연결 수는 워커 수 × mongo_max_pool_size
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 0
+    mongo_max_idle_time_ms: Optional[int] = None          # 유휴 연결을 닫기까지의 시간 (없으면 닫지 않음)
+    mongo_wait_queue_timeout_ms: Optional[int] = None     # 풀에서 연결을 기다리는 최대 시간 (없으면 서버 선택 시간까지)
+    mongo_connect_timeout_ms: int = 20000
+    mongo_socket_timeout_ms: Optional[int] = None         # 응답 대기 최대 시간 (없으면 무제한)
+    mongo_server_selection_timeout_ms: int = 30000
+    mongo_compressors: Optional[str] = None               # 쉼표 구분, 앞에서부터 서버와 협상 (예: zstd,zlib)
+    mongo_read_preference: Literal["primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"] = "primary"
+
+    # 사용자 조회 캐시 (userCrud.get_user_by_id)
+    user_cache_enabled: bool = True
+    user_cache_max_size: int = 10000
+    user_cache_ttl_seconds: float = 300.0
+
+    # 위험도 프로필 캐시 (riskProfileService)
+    risk_profile_cache_max_size: int = 10000
+    risk_profile_cache_ttl_seconds: float = 60.0  # 다른 워커에서 바뀐 건강 정보가 반영되는 최대 지연
+
+    # 모니터링 관계 그래프 (relationGraphService)
+    relation_graph_max_staleness_seconds: float = 1.0  # 다른 워커의 승인/해제가 권한 확인에 반영되는 최대 지연
+    relation_graph_reconcile_seconds: float = 3600.0   # 전체 재적재 주기 (변경 내역 누락 대비 안전망)
+
+    # 건강 기록 일괄 등록 (POST /health/records/batch) - 요청당 최대 기록 수, 최대 본문 크기
+    health_batch_max_records: int = 1000
+    health_batch_max_bytes: int = 1_000_000
+
+    # 과거 기록 가져오기 (importService) - insert_many 한 번에 쓰는 기록 수
+    import_chunk_size: int = 1000
+
+    # 비밀번호 해시 (core.passwordHasher) - auto: argon2 > bcrypt > scrypt(표준 라이브러리) 중 설치된 것
+    password_hash_scheme: Literal["auto", "argon2", "bcrypt", "scrypt"] = "auto"
+    password_hash_workers: int = 4  # 동시에 해시/검증하는 최대 수 (스레드 수, 나머지는 대기)
+
+    # 관리자 API 토큰 (X-Admin-Token 헤더, 설정하지 않으면 관리자 API 비활성화)
+    admin_token: Optional[str] = None
+
+    # 실시간 이벤트 (SSE) - 연결별 큐 크기, 하트비트 주기
+    event_queue_size: int = 100
+    event_heartbeat_seconds: float = 15.0
+
+    # 건강 기록 저장 방식 - true면 MongoDB 시계열 컬렉션(health_records_ts, MongoDB 7.0 이상) 사용
+    # 기존 컬렉션의 기록은 python -m core.timeseriesMigration 으로 옮긴 뒤 켠다
+    health_records_timeseries: bool = False
+    health_records_granularity: Literal["seconds", "minutes", "hours"] = "hours"
+
+    # 빠른 읽기 경로 - true면 건강 기록/메모 조회 응답을 모델 검증 없이 DB 문서에서 바로 JSON으로 만든다 (core.fastRead)
+    # 앱이 저장한 문서만 읽는 경우에 켠다 (응답 형식은 기존과 같음)
+    fast_read_path: bool = False
+
+    # 앱 전체 JSON 응답 직렬화 방식 (core.jsonResponse) - pydantic: FastAPI 기본(response_model은 pydantic-core), orjson: ORJSONResponse
+    json_response: Literal["pydantic", "orjson"] = "pydantic"
+
+    # 요청/DB 지표 수집 (GET /metrics, Prometheus 텍스트 형식)
+    metrics_enabled: bool = True
+
+    # 느린 쿼리 로그 - 이 시간(ms) 이상 걸린 MongoDB 명령을 JSON 한 줄로 기록 (0이면 기록하지 않음)
+    mongo_slow_query_ms: float = 100.0
+    mongo_slow_query_log_file: Optional[str] = None  # 없으면 표준 에러
+
+    @property
+    def health_records_collection(self) -> str:
+        """건강 기록을 저장하는 컬렉션 이름"""
+        return HEALTH_RECORDS_TS_COLLECTION if self.health_records_timeseries else HEALTH_RECORDS_COLLECTION
+
+    def mongo_client_options(self) -> Dict[str, Any]:
+        """AsyncIOMotorClient 옵션 (지정하지 않은 선택 값은 드라이버 기본값)"""
+        options: Dict[str, Any] = {
+            "maxPoolSize": self.mongo_max_pool_size,
+            "minPoolSize": self.mongo_min_pool_size,
+            "connectTimeoutMS": self.mongo_connect_timeout_ms,
+            "serverSelectionTimeoutMS": self.mongo_server_selection_timeout_ms,
+            "readPreference": self.mongo_read_preference,
+        }
+        optional = {
+            "maxIdleTimeMS": self.mongo_max_idle_time_ms,
+            "waitQueueTimeoutMS": self.mongo_wait_queue_timeout_ms,
+            "socketTimeoutMS": self.mongo_socket_timeout_ms,
+            "compressors": self.mongo_compressors,
+        }
+        options.update({key: value for key, value in optional.items() if value is not None})
+        return options
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """환경 변수에 지정된 값만 덮어쓰기 (문자열은 pydantic이 필드 타입으로 변환)"""
+        values = {
+            name: os.environ[name.upper()]
+            for name in cls.model_fields
+            if name.upper() in os.environ
+        }
+        return cls(**values)
+
+load_dotenv()
+settings = Settings.from_env()
@@ -0,0 +1,106 @@
+# 시계열 다운샘플링 모듈
+# Largest-Triangle-Three-Buckets(LTTB) 알고리즘으로 그래프 모양을 유지하면서 점 개수를 줄인다
+# 점을 하나씩 받아 처리하므로 DB 커서를 끝까지 리스트로 모으지 않고 스트리밍으로 계산할 수 있다
+
+from typing import Any, List, Optional, Tuple
+
+# (x, y, payload) - x는 정렬 기준(타임스탬프), payload는 호출자가 되돌려 받을 원본 값
+Point = Tuple[float, float, Any]
+
+class LTTBDownsampler:
+    """
+    스트리밍 LTTB 다운샘플러
+
+    전체 점 개수(total)를 미리 알고 있어야 버킷 경계를 계산할 수 있다.
+    메모리는 버킷 2개 분량(현재 버킷 + 다음 버킷)만 사용한다.
+    점은 x 오름차순으로 add() 해야 한다.
+    """
+
+    def __init__(self, total: int, threshold: int):
+        self.total = total
+        self.threshold = threshold
+        # 점 개수가 threshold 이하이면 다운샘플링 없이 그대로 반환
+        self.passthrough = threshold < 3 or total <= threshold
+
+        self.selected: List[Point] = []
+        self.index = 0                      # 다음에 버킷에 배치될 점의 순번
+        self.pending: Optional[Point] = None  # 가장 최근 점 (마지막 점일 수 있으므로 보류)
+        self.bucket_id = 0
+        self.current: List[Point] = []      # 아직 대표점을 고르지 않은 버킷
+        self.following: List[Point] = []    # 그 다음 버킷 (평균값 계산용)
+
+    def add(self, x: float, y: float, payload: Any = None) -> None:
+        point = (x, y, payload)
+        if self.passthrough:
+            self.selected.append(point)
+            return
+
+        if not self.selected:
+            # 첫 번째 점은 항상 포함
+            self.selected.append(point)
+            self.index = 1
+            return
+
+        if self.pending is not None:
+            self._place(self.pending, self.index)
+            self.index += 1
+        self.pending = point
+
+    def result(self) -> List[Point]:
+        """선택된 점 목록 (x 오름차순)"""
+        if self.passthrough or self.pending is None:
+            return self.selected
+
+        last = self.pending
+        if self.following:
+            self._select(self.current, self._average(self.following))
+            self._select(self.following, (last[0], last[1]))
+        else:
+            self._select(self.current, (last[0], last[1]))
+        self.current, self.following = [], []
+        self.pending = None
+
+        self.selected.append(last)
+        return self.selected
+
+    def _bucket_of(self, index: int) -> int:
+        # 버킷 i 범위: [floor(i * every) + 1, floor((i + 1) * every) + 1), every = (total - 2) / (threshold - 2)
+        # 부동소수점 오차가 없도록 정수 연산으로 계산
+        span, buckets = self.total - 2, self.threshold - 2
+        bucket = (index * buckets + span - 1) // span - 1
+        return max(0, min(bucket, buckets - 1))
+
+    def _place(self, point: Point, index: int) -> None:
+        bucket = self._bucket_of(index)
+        while bucket > self.bucket_id + 1:
+            # 다음 버킷까지 모두 채워졌으므로 현재 버킷의 대표점 선택
+            if self.following:
+                self._select(self.current, self._average(self.following))
+            else:
+                self._select(self.current, point[:2])
+            self.current, self.following = self.following, []
+            self.bucket_id += 1
+
+        if bucket == self.bucket_id:
+            self.current.append(point)
+        else:
+            self.following.append(point)
+
+    def _select(self, bucket: List[Point], next_avg: Tuple[float, float]) -> None:
+        """이전 대표점, 다음 버킷 평균과 만드는 삼각형 넓이가 가장 큰 점 선택"""
+        if not bucket:
+            return
+
+        ax, ay = self.selected[-1][0], self.selected[-1][1]
+        cx, cy = next_avg
+        best, best_area = bucket[0], -1.0
+        for point in bucket:
+            area = abs((ax - cx) * (point[1] - ay) - (ax - point[0]) * (cy - ay))
+            if area > best_area:
+                best, best_area = point, area
+        self.selected.append(best)
+
+    @staticmethod
+    def _average(bucket: List[Point]) -> Tuple[float, float]:
+        n = len(bucket)
+        return sum(p[0] for p in bucket) / n, sum(p[1] for p in bucket) / n
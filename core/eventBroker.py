@@ -0,0 +1,137 @@
+# 실시간 이벤트 브로커 (Server-Sent Events)
+# 서비스 계층에서 발생한 이벤트(새 건강 기록, 건강 기록 삭제, 위험도 변경, 새 메모, 요청 승인/거절)를
+# 해당 사용자의 SSE 연결로 전달한다
+#
+# - 연결마다 크기가 제한된 큐를 사용하고, 큐가 가득 차면 가장 오래된 이벤트를 버린다
+#   (느린 클라이언트 때문에 발행하는 쪽이 기다리지 않도록 publish는 await 없이 즉시 반환)
+# - 이벤트를 버린 연결에는 "lagged" 이벤트를 보내 클라이언트가 목록을 다시 조회하도록 한다
+# - 프로세스 메모리 기반이므로 여러 워커로 실행하면 같은 워커에 연결된 사용자에게만 전달된다
+
+import asyncio
+import json
+from datetime import datetime
+from core.config import settings
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+# 이벤트 종류
+HEALTH_RECORD_CREATED = "health_record_created"
+HEALTH_RECORD_DELETED = "health_record_deleted"
+RISK_LEVEL_CHANGED = "risk_level_changed"
+MEMO_CREATED = "memo_created"
+MONITORING_REQUEST_RESPONDED = "monitoring_request_responded"
+LAGGED = "lagged"
+
+class Subscription:
+    """SSE 연결 하나의 이벤트 큐"""
+
+    def __init__(self, user_id: str, queue_size: int):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0  # 큐가 가득 차서 버린 이벤트 수
+
+    def offer(self, message: str) -> None:
+        """이벤트 추가 (가득 차면 가장 오래된 이벤트를 버림)"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+class EventBroker:
+    """사용자 ID별 구독 관리 및 이벤트 전달"""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, user_id: str) -> Subscription:
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+
+    def has_subscribers(self, user_ids: Iterable[str]) -> bool:
+        """이벤트를 받을 연결이 하나라도 있는지 (이벤트 준비 비용을 아끼기 위해 사용)"""
+        return any(user_id in self._subscriptions for user_id in user_ids)
+
+    def publish(self, user_ids: Iterable[str], event: str, data: Dict[str, Any]) -> int:
+        """
+        사용자들의 모든 연결에 이벤트 전달
+
+        Returns:
+            이벤트를 넣은 연결 수
+        """
+        targets = [
+            subscription
+            for user_id in set(user_ids)
+            for subscription in self._subscriptions.get(user_id, ())
+        ]
+        if not targets:
+            return 0
+
+        message = format_event(event, data)
+        for subscription in targets:
+            before = subscription.dropped
+            subscription.offer(message)
+            self.dropped += subscription.dropped - before
+        self.published += 1
+        return len(targets)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "users": len(self._subscriptions),
+            "connections": sum(len(subs) for subs in self._subscriptions.values()),
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+# 프로세스 전체에서 공유하는 브로커
+event_broker = EventBroker(settings.event_queue_size)
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    raise TypeError(f"직렬화할 수 없는 값: {type(value).__name__}")
+
+def format_event(event: str, data: Dict[str, Any]) -> str:
+    """SSE 메시지 형식으로 변환"""
+    payload = json.dumps(data, ensure_ascii=False, default=_json_default)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+async def stream_events(
+    broker: EventBroker,
+    user_id: str,
+    heartbeat_seconds: float
+) -> AsyncIterator[str]:
+    """
+    사용자의 이벤트를 구독해서 SSE 메시지로 내보내는 제너레이터 (StreamingResponse 본문)
+    이벤트가 없으면 heartbeat_seconds 마다 주석 줄을 보내 프록시가 연결을 끊지 않도록 한다
+    스트림을 실제로 보내기 시작할 때 구독하고, 연결이 끊기면 구독을 해제한다
+    """
+    subscription = broker.subscribe(user_id)
+    reported_dropped = 0
+    try:
+        yield ": connected\n\n"
+        while True:
+            try:
+                message: Optional[str] = await asyncio.wait_for(subscription.queue.get(), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                message = None
+
+            if subscription.dropped != reported_dropped:
+                yield format_event(LAGGED, {"dropped": subscription.dropped - reported_dropped})
+                reported_dropped = subscription.dropped
+
+            yield message if message is not None else ": ping\n\n"
+    finally:
+        broker.unsubscribe(subscription)
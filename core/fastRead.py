@@ -0,0 +1,71 @@
+# 검증 없는 빠른 읽기 경로 (FAST_READ_PATH=true 일 때만 사용)
+# DB에서 읽은 문서를 DB 모델/응답 모델 인스턴스를 만들지 않고 바로 JSON 바이트로 직렬화한다
+#
+# - 조회는 응답 필드만 $project 하고 _id는 쿼리 안에서 id로 바꿔서 받는다 (ResponseShape.projection)
+# - 필드 순서, 없는 선택 필드의 기본값, float 필드에 저장된 정수 값은 응답 모델과 같게 맞춘다
+#   (기존 response_model 경로와 같은 JSON - python -m benchmarks.fastReadBenchmark에서 라우트 응답을 바이트 단위로 비교)
+# - 타입 검증을 하지 않으므로 앱의 모델(HealthRecordDB, MemoDB)로 저장한 컬렉션에만 쓴다
+# - orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 같은 형식을 만든다
+
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 변환할 수 없는 값입니다: {type(value).__name__}")
+
+def dumps(content: Any) -> bytes:
+    """dict/list → JSON 바이트 (FastAPI 기본 응답과 같은 형식: 공백 없음, 한글 그대로, datetime은 ISO 8601)"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+class ResponseShape:
+    """
+    응답 모델 필드 구성 (조회 projection + 원본 문서 → 응답 dict 변환)
+
+    Args:
+        model: 응답 모델 (필드 순서/기본값 기준)
+        computed: DB에 저장되지 않는 필드 (조회 후 채움, 예: 작성자 이름)
+    """
+
+    def __init__(self, model: Type[BaseModel], computed: Iterable[str] = ()):
+        computed = set(computed)
+        fields = model.model_fields
+        self.fields = tuple(fields)
+        self.defaults: Dict[str, Any] = {
+            name: field.default for name, field in fields.items() if not field.is_required()
+        }
+        self.float_fields = tuple(
+            name for name, field in fields.items() if field.annotation in (float, Optional[float])
+        )
+        self.projection: Dict[str, Any] = {
+            "_id": 0,
+            **{name: "$_id" if name == "id" else 1 for name in self.fields if name not in computed}
+        }
+
+    def row(self, doc: dict) -> dict:
+        """projection으로 조회한 문서 → 응답 모델 필드 순서의 dict"""
+        defaults = self.defaults
+        row = {name: doc.get(name, defaults.get(name)) for name in self.fields}
+        for name in self.float_fields:
+            if type(row[name]) is int:
+                row[name] = float(row[name])
+        return row
+
+    def rows(self, docs: Iterable[dict]) -> List[dict]:
+        return [self.row(doc) for doc in docs]
+
+class RawJSONResponse(Response):
+    """이미 직렬화한 JSON 바이트를 그대로 보내는 응답"""
+    media_type = "application/json"
@@ -0,0 +1,181 @@
+# MongoDB 인덱스 레지스트리
+# 컬렉션별로 필요한 인덱스를 선언해 두고, 서버 시작 시 없는 인덱스만 생성한다 (여러 번 실행해도 안전)
+# 실제 DB와 선언이 어긋난 부분(누락/옵션 불일치/선언되지 않은 인덱스)을 보고한다
+#
+# 실행 계획만 출력: python -m core.indexRegistry
+# 실제 적용:        python -m core.indexRegistry --apply
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic import BaseModel
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from core.config import settings, HEALTH_RECORDS_TS_COLLECTION
+from typing import Dict, List, Optional, Tuple
+
+class IndexSpec(BaseModel):
+    """선언적 인덱스 정의"""
+    name: str
+    keys: List[Tuple[str, int]]
+    unique: bool = False
+
+    def to_model(self) -> IndexModel:
+        return IndexModel(self.keys, name=self.name, unique=self.unique)
+
+# 건강 기록 인덱스 (일반/시계열 컬렉션 공통)
+# 목록 조회는 (정렬 기준 시각, _id) 내림차순 keyset 페이지네이션을 사용하므로 _id까지 포함한다
+HEALTH_RECORDS_INDEXES = [
+    IndexSpec(name="user_id_created_at", keys=[("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+]
+
+# 시계열 컬렉션에는 기본 _id 인덱스가 없으므로 ID 조회/삭제/중복 확인용 인덱스를 추가 (고유 인덱스는 지원되지 않음)
+HEALTH_RECORDS_TS_INDEXES = HEALTH_RECORDS_INDEXES + [
+    IndexSpec(name="record_id", keys=[("_id", ASCENDING)]),
+]
+
+def timeseries_options(granularity: str) -> dict:
+    """건강 기록 시계열 컬렉션 생성 옵션 (사용자별 시계열, 측정 시각 기준)"""
+    return {"timeseries": {"timeField": "created_at", "metaField": "user_id", "granularity": granularity}}
+
+# 생성 옵션이 필요한 컬렉션 (없으면 이 옵션으로 만든 뒤 인덱스 생성)
+COLLECTION_OPTIONS: Dict[str, dict] = (
+    {HEALTH_RECORDS_TS_COLLECTION: timeseries_options(settings.health_records_granularity)}
+    if settings.health_records_timeseries else {}
+)
+
+# 컬렉션별 인덱스 선언
+INDEX_REGISTRY: Dict[str, List[IndexSpec]] = {
+    settings.health_records_collection: (
+        HEALTH_RECORDS_TS_INDEXES if settings.health_records_timeseries else HEALTH_RECORDS_INDEXES
+    ),
+    "health_daily_stats": [
+        IndexSpec(name="user_id_day", keys=[("user_id", ASCENDING), ("day", ASCENDING)]),
+    ],
+    "monitoring_relations": [
+        IndexSpec(name="patient_id_granted_at", keys=[("patient_id", ASCENDING), ("granted_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexSpec(name="monitor_id_granted_at", keys=[("monitor_id", ASCENDING), ("granted_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexSpec(name="patient_id_monitor_id", keys=[("patient_id", ASCENDING), ("monitor_id", ASCENDING)]),
+    ],
+    "monitoring_requests": [
+        IndexSpec(name="patient_id_status_created_at", keys=[("patient_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexSpec(name="requester_id_created_at", keys=[("requester_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ],
+    "memos": [
+        IndexSpec(name="doctor_id_created_at", keys=[("doctor_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexSpec(name="patient_id_created_at", keys=[("patient_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexSpec(name="doctor_id_patient_id_created_at", keys=[("doctor_id", ASCENDING), ("patient_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ],
+}
+
+class CollectionIndexPlan(BaseModel):
+    """컬렉션 하나의 인덱스 비교 결과"""
+    collection: str
+    create_options: Optional[dict] = None  # 컬렉션이 없어서 이 옵션으로 생성할 예정
+    to_create: List[IndexSpec] = []     # DB에 없는 인덱스 (생성 대상)
+    conflicts: List[str] = []           # 같은 키/이름이지만 옵션이 다른 인덱스 (수동 조치 필요)
+    unmanaged: List[str] = []           # 레지스트리에 선언되지 않은 인덱스 (보고만 함)
+    satisfied: List[str] = []           # 이미 존재하는 인덱스
+
+def _key_pattern(keys) -> Tuple[Tuple[str, int], ...]:
+    return tuple((field, int(direction)) for field, direction in keys)
+
+# 레지스트리와 실제 인덱스 비교
+async def plan_indexes(db: AsyncIOMotorDatabase) -> List[CollectionIndexPlan]:
+    """레지스트리 선언과 DB의 실제 인덱스를 비교한 실행 계획"""
+    plans = []
+    collections = {}
+    if COLLECTION_OPTIONS:
+        async for info in await db.list_collections(filter={"name": {"$in": list(COLLECTION_OPTIONS)}}):
+            collections[info["name"]] = info
+    for collection, specs in INDEX_REGISTRY.items():
+        plan = CollectionIndexPlan(collection=collection)
+
+        options = COLLECTION_OPTIONS.get(collection)
+        if options and collection not in collections:
+            plan.create_options = options
+        elif options and "timeseries" in options and collections[collection].get("type") != "timeseries":
+            plan.conflicts.append(f"{collection}: 시계열 컬렉션이 아닙니다 (python -m core.timeseriesMigration 참고)")
+
+        existing = {}
+        async for index in db[collection].list_indexes():
+            existing[index["name"]] = index
+
+        matched_names = set()
+        for spec in specs:
+            pattern = _key_pattern(spec.keys)
+            # 이름이 달라도 같은 키 패턴이 있으면 직접 만든 인덱스로 보고 그대로 사용
+            same_keys = [
+                name for name, index in existing.items()
+                if _key_pattern(index["key"].items()) == pattern
+            ]
+            if same_keys:
+                name = same_keys[0]
+                matched_names.add(name)
+                if bool(existing[name].get("unique", False)) != spec.unique:
+                    plan.conflicts.append(f"{name}: unique={existing[name].get('unique', False)} (선언: {spec.unique})")
+                else:
+                    plan.satisfied.append(name)
+            elif spec.name in existing:
+                matched_names.add(spec.name)
+                plan.conflicts.append(f"{spec.name}: 키 불일치 {dict(existing[spec.name]['key'])} (선언: {dict(spec.keys)})")
+            else:
+                plan.to_create.append(spec)
+
+        plan.unmanaged = [name for name in existing if name != "_id_" and name not in matched_names]
+        plans.append(plan)
+    return plans
+
+# 누락된 인덱스 생성
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> List[CollectionIndexPlan]:
+    """레지스트리에 선언된 인덱스 중 없는 것만 생성 (기존 인덱스는 삭제/변경하지 않음)"""
+    plans = await plan_indexes(db)
+    for plan in plans:
+        if plan.create_options:
+            await db.create_collection(plan.collection, **plan.create_options)
+        if plan.to_create:
+            await db[plan.collection].create_indexes([spec.to_model() for spec in plan.to_create])
+    return plans
+
+def format_plan(plans: List[CollectionIndexPlan]) -> str:
+    """실행 계획을 사람이 읽을 수 있는 문자열로 변환"""
+    lines = []
+    for plan in plans:
+        lines.append(f"[{plan.collection}]")
+        if plan.create_options:
+            lines.append(f"  + 컬렉션 생성: {plan.create_options}")
+        for spec in plan.to_create:
+            lines.append(f"  + 생성: {spec.name} {dict(spec.keys)}{' (unique)' if spec.unique else ''}")
+        for conflict in plan.conflicts:
+            lines.append(f"  ! 불일치: {conflict}")
+        for name in plan.unmanaged:
+            lines.append(f"  ? 미선언: {name}")
+        for name in plan.satisfied:
+            lines.append(f"  = 유지: {name}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import os
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="MongoDB 인덱스 실행 계획 출력/적용")
+    parser.add_argument("--apply", action="store_true", help="누락된 인덱스를 실제로 생성")
+    args = parser.parse_args()
+
+    async def run():
+        load_dotenv()
+        client = AsyncIOMotorClient(os.getenv("MONGO_URL"))
+        try:
+            db = client[settings.mongo_db_name]
+            plans = await (ensure_indexes(db) if args.apply else plan_indexes(db))
+            print(format_plan(plans))
+            missing = not args.apply and any(plan.to_create or plan.create_options for plan in plans)
+            if missing:
+                print("\n적용하려면 --apply 옵션을 사용하세요.")
+            # 누락(계획 모드)이나 불일치가 있으면 배포 스크립트에서 감지할 수 있도록 종료 코드 1
+            return 1 if missing or any(plan.conflicts for plan in plans) else 0
+        finally:
+            client.close()
+
+    raise SystemExit(asyncio.run(run()))
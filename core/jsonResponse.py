@@ -0,0 +1,53 @@
+# 앱 전체 JSON 응답 클래스 선택 (JSON_RESPONSE)
+#
+# - pydantic (기본값): FastAPI 기본 경로. response_model이 있는 라우트는 pydantic-core(Rust)가 검증한 값을
+#   바로 JSON 바이트로 직렬화(dump_json)하고, response_model이 없는 라우트만 jsonable_encoder + 표준 json을 쓴다
+# - orjson: 모든 라우트를 ORJSONResponse로 응답. response_model 값은 JSON 호환 dict로 변환(dump_python)된 뒤 orjson으로 직렬화된다
+#   (FastAPI는 기본 응답 클래스가 아니면 dump_json을 쓰지 않음 - 어느 쪽이 빠른지는 benchmarks.jsonResponseBenchmark로 확인)
+#
+# 두 방식의 응답 본문은 바이트 단위로 같다 (공백 없음, 한글 그대로, datetime/date는 ISO 8601, Enum은 값).
+# 예외: 1e16 이상/1e-16 미만의 float 지수 표기 (pydantic "1e+16", orjson "1e16") - 현재 스키마 값 범위에서는 나오지 않음
+
+from enum import Enum
+from typing import Any, Type, Union
+
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+JSON_RESPONSE_PYDANTIC = "pydantic"
+JSON_RESPONSE_ORJSON = "orjson"
+
+def _orjson_default(value: Any) -> Any:
+    # datetime/date/Enum/UUID는 orjson이 직접 처리하고, 그 밖의 값만 여기로 온다
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"JSON으로 변환할 수 없는 값입니다: {type(value).__name__}")
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (dict의 Enum/정수 키도 문자열로 변환)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+def json_response_class(name: str) -> Union[Type[JSONResponse], DefaultPlaceholder]:
+    """
+    설정 값 → FastAPI(default_response_class=...)에 넘길 값
+
+    Raises:
+        ValueError: 알 수 없는 이름이거나 orjson이 설치되어 있지 않은 경우
+    """
+    if name == JSON_RESPONSE_PYDANTIC:
+        return Default(JSONResponse)  # FastAPI 기본값 그대로 (response_model 라우트는 dump_json)
+    if name == JSON_RESPONSE_ORJSON:
+        if orjson is None:
+            raise ValueError("JSON_RESPONSE=orjson 을 사용하려면 orjson 패키지를 설치해야 합니다.")
+        return ORJSONResponse
+    raise ValueError(f"알 수 없는 JSON 응답 방식입니다: {name}")
@@ -0,0 +1,276 @@
+# 요청/DB 지표 수집 (Prometheus 텍스트 형식)
+# 라우트별 요청 수, 상태 코드, 처리 중 요청 수, 지연 시간 히스토그램과 요청당 MongoDB 명령 수를 프로세스 메모리에 집계하고
+# GET /metrics 에서 Prometheus 텍스트 형식(0.0.4)으로 내보낸다
+#
+# - 라우트 라벨은 실제 경로가 아닌 라우트 템플릿 (/users/{user_id}) - 사용자 ID마다 시계열이 늘어나지 않음
+# - 매칭되는 라우트가 없는 요청(404 등)은 route="unmatched" 하나로 모음
+# - 요청당 MongoDB 명령 수는 core.mongoInstrumentation의 CommandListener가 RequestContext에 센다
+# - 값은 워커 프로세스별 (다중 워커 실행 시 Prometheus에서 워커별로 수집해서 합산)
+
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.routing import BaseRoute, Mount, Route, Router, compile_path
+
+# 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청당 MongoDB 명령 수 히스토그램 구간
+MONGO_COMMAND_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 매칭되는 라우트가 없는 요청의 route 라벨
+UNMATCHED_ROUTE = "unmatched"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    """라벨 값 조합별로 값을 보관하는 지표 (스레드 안전 - CommandListener는 Motor 실행 스레드에서 호출됨)"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}", *self._samples()]
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    """증가만 하는 값"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+class Gauge(Counter):
+    """증가/감소하는 현재 값"""
+
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+class Histogram(_Metric):
+    """구간별 관측 수 + 합계 + 개수"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], list] = {}  # labels -> [구간별 관측 수..., +Inf 관측 수, 합계]
+
+    def observe(self, *labels: str, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            entry[index] += 1
+            entry[-1] += value
+
+    def count(self, *labels: str) -> int:
+        entry = self._values.get(labels)
+        return sum(entry[:-1]) if entry else 0
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted((labels, list(entry)) for labels, entry in self._values.items())
+        for labels, entry in items:
+            cumulative = 0
+            for bound, observed in zip(self.buckets + (float("inf"),), entry[:-1]):
+                cumulative += observed
+                le = f'le="{_format_value(float(bound))}"'
+                yield f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(entry[-1])}"
+            yield f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}"
+
+class Registry:
+    """내보낼 지표 목록"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """내보내기 직전에 호출할 함수 (캐시 크기처럼 조회 시점에 읽는 값을 Gauge에 반영)"""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        for collect in self._collectors:
+            collect()
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# 프로세스 전체에서 공유하는 지표
+registry = Registry()
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+))
+http_requests_in_progress = registry.register(Gauge(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수", ("method", "route")
+))
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)", ("method", "route")
+))
+http_request_mongo_commands = registry.register(Histogram(
+    "http_request_mongo_commands", "HTTP 요청 하나에서 실행한 MongoDB 명령 수", ("method", "route"), MONGO_COMMAND_BUCKETS
+))
+
+class RequestContext:
+    """처리 중인 요청 정보 (MongoDB 명령 계측에서 읽음 - Motor가 contextvar를 실행 스레드로 복사하므로 같은 객체를 수정)"""
+
+    __slots__ = ("method", "route", "mongo_commands")
+
+    def __init__(self, method: str, route: str):
+        self.method = method
+        self.route = route
+        self.mongo_commands = 0
+
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+def current_request() -> Optional[RequestContext]:
+    """처리 중인 요청 (요청 밖에서 실행된 코드면 None)"""
+    return _request_context.get()
+
+class RouteTemplates:
+    """요청 경로 → 라우트 템플릿 (지표 라벨용, 라우터와 같은 정규식으로 매칭)"""
+
+    def __init__(self):
+        self._static: Dict[str, List[tuple]] = {}  # 경로 변수가 없는 템플릿 -> [(메서드 집합, 템플릿)]
+        self._dynamic: List[tuple] = []           # (정규식, 메서드 집합, 템플릿)
+
+    def add(self, template: str, methods: Optional[Iterable[str]] = None) -> None:
+        methods = frozenset(methods) if methods else None
+        if "{" not in template:
+            self._static.setdefault(template, []).append((methods, template))
+        else:
+            self._dynamic.append((compile_path(template)[0], methods, template))
+
+    def add_routes(self, routes: Iterable[BaseRoute], prefix: str = "") -> None:
+        """경로가 있는 라우트만 등록 (include_router로 포함한 라우터는 add_routes(router.routes, prefix)로 따로 등록)"""
+        for route in routes:
+            path = getattr(route, "path", None)
+            if path is None:
+                continue
+            if isinstance(route, Mount):
+                self._dynamic.append((compile_path(prefix + path + "/{path:path}")[0], None, prefix + path))
+            elif isinstance(route, Route):
+                self.add(prefix + path or "/", route.methods)
+
+    def match(self, method: str, path: str) -> str:
+        """매칭되는 템플릿 (메서드만 다르면 그 템플릿 - 405 응답, 없으면 unmatched)"""
+        partial = None
+        for methods, template in self._static.get(path, ()):
+            if methods is None or method in methods:
+                return template
+            partial = partial or template
+        for regex, methods, template in self._dynamic:
+            if regex.match(path):
+                if methods is None or method in methods:
+                    return template
+                partial = partial or template
+        return partial or UNMATCHED_ROUTE
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 지표 수집 ASGI 미들웨어
+    처리 중 요청 수를 라우트별로 올리기 위해 요청 시작 시 라우트 템플릿을 찾는다
+    (app.router의 라우트 + included의 prefix별 라우터, 첫 요청 때 한 번 구성)
+    """
+
+    def __init__(self, app, router: Router, included: Optional[Dict[str, Router]] = None):
+        self.app = app
+        self.router = router
+        self.included = included or {}
+        self._templates: Optional[RouteTemplates] = None
+
+    def _build_templates(self) -> RouteTemplates:
+        templates = RouteTemplates()
+        templates.add_routes(self.router.routes)
+        for prefix, router in self.included.items():
+            templates.add_routes(router.routes, prefix)
+        return templates
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self._templates is None:
+            self._templates = self._build_templates()
+        method = scope["method"]
+        route = self._templates.match(method, scope["path"])
+        status = [500]  # 응답을 시작하기 전에 예외가 나면 500
+        context = RequestContext(method, route)
+        token = _request_context.set(context)
+        http_requests_in_progress.inc(method, route)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_context.reset(token)
+            http_requests_in_progress.dec(method, route)
+            http_requests_total.inc(method, route, str(status[0]))
+            http_request_duration_seconds.observe(method, route, value=elapsed)
+            http_request_mongo_commands.observe(method, route, value=context.mongo_commands)
+
+# Prometheus 텍스트 형식 출력
+def render_metrics() -> str:
+    return registry.render()
+
+# 응답 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
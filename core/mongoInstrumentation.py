@@ -0,0 +1,336 @@
+# MongoDB 명령 계측 + 느린 쿼리 로그
+# pymongo CommandListener로 모든 명령의 소요 시간을 재고, 명령을 실행한 crud 함수와 요청 라우트를 함께 기록한다
+#
+# - crud 함수: instrument_crud_modules()가 crud 모듈의 async 함수를 감싸 contextvar에 "모듈.함수" 이름을 설정
+#   (Motor는 명령을 실행 스레드에서 보내지만 호출 시점의 contextvar를 복사하므로 리스너에서 읽을 수 있음)
+# - 라우트: core.metrics.MetricsMiddleware가 설정한 RequestContext
+# - 지표: 컬렉션/명령별 명령 수와 소요 시간 히스토그램, crud 함수별 명령 수, 느린 명령 수 (GET /metrics)
+# - 느린 쿼리 로그: 기준 시간(MONGO_SLOW_QUERY_MS) 이상 걸린 명령을 JSON 한 줄로 기록
+#   조건(filter)은 값을 "?"로 가린 형태만 남긴다 (연산자/필드 이름만 보존)
+# - 연결 풀: pymongo ConnectionPoolListener로 서버 주소별 연결 대기 시간/대기 수/사용 중 연결 수 (MONGO_MAX_POOL_SIZE 조정용)
+
+import functools
+import inspect
+import json
+import logging
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from pymongo import monitoring
+
+from core.metrics import Counter, Gauge, Histogram, current_request, registry
+
+# MongoDB 명령 소요 시간 히스토그램 구간 (초)
+MONGO_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# 연결 풀에서 연결을 얻기까지 기다린 시간 히스토그램 구간 (초)
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# crud 함수 밖에서 실행된 명령의 operation 라벨 (인덱스 생성, 마이그레이션 등)
+UNKNOWN_OPERATION = "-"
+
+# 조건 형태에서 값을 가리는 문자열, 형태를 남기는 최대 깊이
+REDACTED = "?"
+SHAPE_MAX_DEPTH = 6
+
+# 컬렉션 이름이 명령 값에 들어 있는 명령 (getMore는 "collection" 필드)
+_COLLECTION_COMMANDS = {
+    "find", "insert", "update", "delete", "aggregate", "count", "distinct",
+    "findAndModify", "createIndexes", "listIndexes", "dropIndexes", "create", "drop", "collStats",
+}
+
+mongo_commands_total = registry.register(Counter(
+    "mongo_commands_total", "MongoDB 명령 수", ("collection", "command", "outcome")
+))
+mongo_command_duration_seconds = registry.register(Histogram(
+    "mongo_command_duration_seconds", "MongoDB 명령 소요 시간", ("collection", "command"), MONGO_LATENCY_BUCKETS
+))
+mongo_operation_commands_total = registry.register(Counter(
+    "mongo_operation_commands_total", "crud 함수별 MongoDB 명령 수", ("operation",)
+))
+mongo_slow_commands_total = registry.register(Counter(
+    "mongo_slow_commands_total", "기준 시간 이상 걸린 MongoDB 명령 수", ("collection", "command")
+))
+
+mongo_pool_max_size = registry.register(Gauge(
+    "mongo_pool_max_size", "연결 풀 최대 연결 수 (maxPoolSize)", ("address",)
+))
+mongo_pool_connections = registry.register(Gauge(
+    "mongo_pool_connections", "연결 풀에 열려 있는 연결 수", ("address",)
+))
+mongo_pool_checked_out = registry.register(Gauge(
+    "mongo_pool_checked_out", "사용 중인(대여된) 연결 수", ("address",)
+))
+mongo_pool_waiting = registry.register(Gauge(
+    "mongo_pool_waiting", "연결 풀에서 연결을 기다리는 작업 수", ("address",)
+))
+mongo_pool_checkout_wait_seconds = registry.register(Histogram(
+    "mongo_pool_checkout_wait_seconds", "연결 풀에서 연결을 얻기까지(또는 실패까지) 기다린 시간", ("address", "outcome"), POOL_WAIT_BUCKETS
+))
+
+# 명령을 실행 중인 crud 함수 ("healthCrud.get_latest_health_record")
+_current_operation: ContextVar[str] = ContextVar("mongo_operation", default=UNKNOWN_OPERATION)
+
+slow_query_logger = logging.getLogger("stroke.mongo.slow_query")
+
+def configure_slow_query_log(log_file: Optional[str] = None) -> None:
+    """느린 쿼리 로그 출력 설정 (log_file이 없으면 표준 에러, 메시지는 JSON 한 줄)"""
+    for handler in list(slow_query_logger.handlers):
+        slow_query_logger.removeHandler(handler)
+        handler.close()
+    handler = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.WARNING)
+    slow_query_logger.propagate = False
+
+# ---------------------------------------------------------------------------
+# crud 함수 표시
+
+def _wrap_coroutine(fn, name: str):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        token = _current_operation.set(name)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _current_operation.reset(token)
+    return wrapper
+
+def _wrap_async_generator(fn, name: str):
+    # yield 사이에는 호출한 쪽 코드가 실행되므로 다음 항목을 가져오는 동안만 설정
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        generator = fn(*args, **kwargs)
+        try:
+            while True:
+                token = _current_operation.set(name)
+                try:
+                    item = await generator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _current_operation.reset(token)
+                yield item
+        finally:
+            await generator.aclose()
+    return wrapper
+
+def instrument_crud_modules(modules: Iterable[Any]) -> int:
+    """
+    모듈에 정의된 async 함수/async 제너레이터를 crud 함수 표시용 래퍼로 교체 (이미 교체된 함수는 건너뜀)
+    서비스는 healthCrud.함수() 처럼 모듈 속성으로 호출하므로 교체가 그대로 적용된다
+
+    Returns:
+        교체한 함수 수
+    """
+    wrapped = 0
+    for module in modules:
+        prefix = module.__name__.rsplit(".", 1)[-1]
+        for attr, fn in list(vars(module).items()):
+            if getattr(fn, "__module__", None) != module.__name__ or getattr(fn, "_mongo_operation", None):
+                continue
+            name = f"{prefix}.{attr}"
+            if inspect.iscoroutinefunction(fn):
+                wrapper = _wrap_coroutine(fn, name)
+            elif inspect.isasyncgenfunction(fn):
+                wrapper = _wrap_async_generator(fn, name)
+            else:
+                continue
+            wrapper._mongo_operation = name
+            setattr(module, attr, wrapper)
+            wrapped += 1
+    return wrapped
+
+# ---------------------------------------------------------------------------
+# 명령 분석
+
+def query_shape(value: Any, depth: int = 0) -> Any:
+    """조건/파이프라인의 형태 (값은 "?", 목록은 서로 다른 형태만 남김)"""
+    if depth >= SHAPE_MAX_DEPTH:
+        return REDACTED
+    if isinstance(value, dict):
+        return {key: query_shape(item, depth + 1) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = query_shape(item, depth + 1)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return REDACTED
+
+def command_collection(command_name: str, command: dict) -> str:
+    """명령 대상 컬렉션 (데이터베이스 단위 명령이면 "-")"""
+    if command_name == "getMore":
+        return str(command.get("collection", "-"))
+    if command_name in _COLLECTION_COMMANDS:
+        target = command.get(command_name)
+        if isinstance(target, str):
+            return target
+    return "-"
+
+def command_shape(command_name: str, command: dict) -> Dict[str, Any]:
+    """느린 쿼리 로그에 남길 명령 형태 (문서 내용/조건 값 제외)"""
+    shape: Dict[str, Any] = {}
+    if command_name in ("find", "count", "distinct", "findAndModify"):
+        condition = command.get("filter", command.get("query"))
+        if condition is not None:
+            shape["filter"] = query_shape(condition)
+        if command.get("sort"):
+            shape["sort"] = dict(command["sort"])  # 필드 이름과 방향만 있음
+        if command_name == "distinct":
+            shape["key"] = command.get("key")
+    elif command_name == "aggregate":
+        shape["pipeline"] = query_shape(command.get("pipeline", []))
+    elif command_name in ("update", "delete"):
+        statements = command.get("updates" if command_name == "update" else "deletes", [])
+        shape["statements"] = len(statements)
+        shape["filter"] = query_shape([statement.get("q", {}) for statement in statements])
+    elif command_name == "insert":
+        shape["documents"] = len(command.get("documents", []))
+    for key in ("limit", "batchSize"):
+        if key in command:
+            shape[key] = command[key]
+    return shape
+
+def returned_documents(command_name: str, reply: dict) -> Optional[int]:
+    """응답 문서 수 (find/aggregate/getMore는 이번 batch, 쓰기는 처리한 문서 수)"""
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        return len(cursor.get("firstBatch", cursor.get("nextBatch", [])))
+    if command_name == "distinct":
+        return len(reply.get("values", []))
+    if command_name == "findAndModify":
+        return 1 if reply.get("value") is not None else 0
+    if "n" in reply:
+        return reply["n"]
+    return None
+
+# ---------------------------------------------------------------------------
+# 리스너
+
+class _PendingCommand:
+    __slots__ = ("command", "collection", "operation", "route")
+
+    def __init__(self, command: dict, collection: str, operation: str, route: Optional[str]):
+        self.command = command
+        self.collection = collection
+        self.operation = operation
+        self.route = route
+
+class MongoCommandListener(monitoring.CommandListener):
+    """
+    MongoDB 명령 계측 (AsyncIOMotorClient(event_listeners=[...])로 등록)
+
+    Args:
+        slow_query_ms: 이 시간(ms) 이상 걸린 명령을 느린 쿼리 로그에 기록 (0 이하면 기록하지 않음)
+    """
+
+    def __init__(self, slow_query_ms: float = 100.0):
+        self.slow_query_micros = slow_query_ms * 1000 if slow_query_ms > 0 else None
+        self._pending: Dict[tuple, _PendingCommand] = {}
+
+    @staticmethod
+    def _key(event) -> tuple:
+        return (event.connection_id, event.request_id)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        request = current_request()
+        if request is not None:
+            request.mongo_commands += 1
+        operation = _current_operation.get()
+        mongo_operation_commands_total.inc(operation)
+        self._pending[self._key(event)] = _PendingCommand(
+            event.command,
+            command_collection(event.command_name, event.command),
+            operation,
+            request.route if request is not None else None
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, "success", event.reply)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, "failure", None, event.failure)
+
+    def _finish(self, event, outcome: str, reply: Optional[dict], failure: Optional[dict] = None) -> None:
+        pending = self._pending.pop(self._key(event), None)
+        collection = pending.collection if pending else "-"
+        command_name = event.command_name
+        mongo_commands_total.inc(collection, command_name, outcome)
+        mongo_command_duration_seconds.observe(collection, command_name, value=event.duration_micros / 1_000_000)
+
+        if self.slow_query_micros is None or event.duration_micros < self.slow_query_micros or pending is None:
+            return
+        mongo_slow_commands_total.inc(collection, command_name)
+        entry = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "duration_ms": round(event.duration_micros / 1000, 2),
+            "database": event.database_name,
+            "collection": collection,
+            "command": command_name,
+            "operation": pending.operation,
+            "route": pending.route,
+            "outcome": outcome,
+            "docs_returned": returned_documents(command_name, reply) if reply else None,
+            **command_shape(command_name, pending.command),
+        }
+        if failure:
+            entry["error"] = failure.get("errmsg")
+        slow_query_logger.warning(json.dumps(entry, ensure_ascii=False, default=str))
+
+# ---------------------------------------------------------------------------
+# 연결 풀 리스너
+
+def _address(event) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+class MongoPoolListener(monitoring.ConnectionPoolListener):
+    """
+    연결 풀 계측 (AsyncIOMotorClient(event_listeners=[...])로 등록)
+    mongo_pool_waiting이 자주 0보다 크거나 대기 시간 분포가 길어지면 풀이 부하에 비해 작은 것
+    (실패 outcome은 timeout(waitQueueTimeoutMS 초과)/connectionError/poolClosed)
+    """
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        max_size = event.options.get("maxPoolSize")
+        if max_size is not None:
+            mongo_pool_max_size.set(_address(event), value=max_size)
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        mongo_pool_connections.inc(_address(event))
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        mongo_pool_connections.dec(_address(event))
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        mongo_pool_waiting.inc(_address(event))
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        address = _address(event)
+        mongo_pool_waiting.dec(address)
+        mongo_pool_checkout_wait_seconds.observe(address, str(event.reason), value=event.duration or 0.0)
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        address = _address(event)
+        mongo_pool_waiting.dec(address)
+        mongo_pool_checked_out.inc(address)
+        mongo_pool_checkout_wait_seconds.observe(address, "success", value=event.duration or 0.0)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        mongo_pool_checked_out.dec(_address(event))
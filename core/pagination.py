@@ -0,0 +1,128 @@
+# 커서 기반(keyset) 페이지네이션 유틸리티
+# (정렬 기준 시각, _id) 쌍을 불투명한 커서 문자열로 주고받으며
+# 목록을 최신순으로 limit 개씩 잘라서 조회한다
+
+import base64
+import json
+from datetime import datetime
+from fastapi import HTTPException, Query, Response
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pydantic import BaseModel
+from typing import Optional, List, Tuple
+
+DEFAULT_PAGE_LIMIT = 100  # 커서 없이 호출한 기존 클라이언트가 받는 첫 페이지 크기
+MAX_PAGE_LIMIT = 500
+
+# 다음 페이지 커서를 담는 응답 헤더 (목록 응답 본문 형태는 기존과 동일하게 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(sort_value: datetime, doc_id: str) -> str:
+    """(정렬 기준 시각, _id)를 커서 문자열로 변환"""
+    raw = json.dumps({"t": sort_value.isoformat(), "id": doc_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """커서 문자열을 (정렬 기준 시각, _id)로 복원"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["t"]), str(data["id"])
+    except Exception:
+        raise ValueError("잘못된 페이지 커서입니다.")
+
+def keyset_filter(query: dict, sort_field: str, after: Optional[str]) -> dict:
+    """after 커서 이후(더 오래된) 문서만 조회하도록 필터 확장"""
+    if not after:
+        return query
+
+    sort_value, doc_id = decode_cursor(after)
+    return {
+        **query,
+        "$or": [
+            {sort_field: {"$lt": sort_value}},
+            {sort_field: sort_value, "_id": {"$lt": doc_id}}
+        ]
+    }
+
+async def find_page(
+    collection: AsyncIOMotorCollection,
+    query: dict,
+    sort_field: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    (sort_field, _id) 내림차순으로 한 페이지 조회
+
+    Returns:
+        (문서 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+    """
+    limit = max(1, min(limit, MAX_PAGE_LIMIT))
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    cursor = collection.find(keyset_filter(query, sort_field, after)) \
+        .sort([(sort_field, -1), ("_id", -1)]) \
+        .limit(limit + 1)
+    docs = await cursor.to_list(length=limit + 1)
+
+    if len(docs) <= limit:
+        return docs, None
+
+    docs = docs[:limit]
+    last = docs[-1]
+    return docs, encode_cursor(last[sort_field], last["_id"])
+
+async def aggregate_page(
+    collection: AsyncIOMotorCollection,
+    query: dict,
+    sort_field: str,
+    projection: dict,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    find_page와 같은 페이지를 집계 파이프라인으로 조회하면서 $project 적용
+    projection은 _id를 id로 바꾸고 sort_field를 포함해야 한다 (core.fastRead.ResponseShape.projection)
+
+    Returns:
+        (projection이 적용된 문서 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+    """
+    limit = max(1, min(limit, MAX_PAGE_LIMIT))
+
+    cursor = collection.aggregate([
+        {"$match": keyset_filter(query, sort_field, after)},
+        {"$sort": {sort_field: -1, "_id": -1}},
+        {"$limit": limit + 1},
+        {"$project": projection}
+    ])
+    docs = await cursor.to_list(length=limit + 1)
+
+    if len(docs) <= limit:
+        return docs, None
+
+    docs = docs[:limit]
+    last = docs[-1]
+    return docs, encode_cursor(last[sort_field], last["id"])
+
+
+class PageParams(BaseModel):
+    """목록 조회 페이지 파라미터"""
+    limit: int = DEFAULT_PAGE_LIMIT
+    after: Optional[str] = None
+
+# 의존성: 페이지 파라미터 (잘못된 커서는 400)
+def get_page_params(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="페이지 크기"),
+    after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값")
+) -> PageParams:
+    if after:
+        try:
+            decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return PageParams(limit=limit, after=after)
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """다음 페이지가 있으면 응답 헤더에 커서 기록"""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,225 @@
+# 비밀번호 해시/검증 (이벤트 루프를 막지 않도록 제한된 스레드 풀에서 실행)
+#
+# - 방식: argon2(argon2-cffi) > bcrypt > scrypt(표준 라이브러리 hashlib) 중 설치된 것 (PASSWORD_HASH_SCHEME=auto)
+#   검증은 저장된 값의 접두어로 방식을 판별하므로 방식을 바꿔도 기존 해시로 로그인할 수 있다
+# - 해시 계산은 한 번에 수십~수백 ms 걸리므로 스레드 풀(PASSWORD_HASH_WORKERS)에서 실행한다 (세 방식 모두 계산 중 GIL을 놓음)
+#   풀에 넘기기 전에 세마포어로 동시 실행 수를 제한해서, 기다리는 작업 수를 지표로 보고 취소된 요청은 스레드를 쓰지 않게 한다
+# - 평문으로 저장된 이전 비밀번호(알려진 접두어가 없는 값)도 검증하고, needs_rehash()로 다시 저장 대상인지 알려준다
+# - 지표(GET /metrics): 대기 중/실행 중 작업 수, 대기 시간, 해시/검증 소요 시간
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from core.config import settings
+from core.metrics import Gauge, Histogram, registry
+
+try:
+    import argon2
+except ImportError:  # 선택 의존성
+    argon2 = None
+
+try:
+    import bcrypt
+except ImportError:  # 선택 의존성
+    bcrypt = None
+
+SCHEME_ARGON2 = "argon2"
+SCHEME_BCRYPT = "bcrypt"
+SCHEME_SCRYPT = "scrypt"
+
+# 방식별 비용 설정 (바꾸면 다음 로그인 때 새 설정으로 다시 저장됨)
+BCRYPT_ROUNDS = 12
+SCRYPT_LOG_N = 15   # n = 2^15, 해시 1회 약 32MB
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_SALT_BYTES = 16
+SCRYPT_KEY_BYTES = 32
+_SCRYPT_MAXMEM = 64 * 1024 * 1024
+
+# 해시/검증 소요 시간 히스토그램 구간 (초)
+PASSWORD_HASH_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+password_hash_waiting = registry.register(Gauge(
+    "password_hash_waiting", "실행 차례를 기다리는 비밀번호 해시/검증 작업 수"
+))
+password_hash_in_progress = registry.register(Gauge(
+    "password_hash_in_progress", "실행 중인 비밀번호 해시/검증 작업 수"
+))
+password_hash_wait_seconds = registry.register(Histogram(
+    "password_hash_wait_seconds", "비밀번호 해시/검증 작업이 실행 차례를 기다린 시간", (), PASSWORD_HASH_BUCKETS
+))
+password_hash_duration_seconds = registry.register(Histogram(
+    "password_hash_duration_seconds", "비밀번호 해시/검증 소요 시간", ("operation",), PASSWORD_HASH_BUCKETS
+))
+
+def available_schemes() -> list:
+    """설치되어 있어 사용할 수 있는 방식 (우선순위 순)"""
+    schemes = []
+    if argon2 is not None:
+        schemes.append(SCHEME_ARGON2)
+    if bcrypt is not None:
+        schemes.append(SCHEME_BCRYPT)
+    schemes.append(SCHEME_SCRYPT)
+    return schemes
+
+def resolve_scheme(name: str) -> str:
+    """설정 값(auto 또는 방식 이름) → 사용할 방식 (지정한 방식의 패키지가 없으면 경고 후 auto)"""
+    schemes = available_schemes()
+    if name == "auto":
+        return schemes[0]
+    if name not in schemes:
+        print(f"⚠️ 비밀번호 해시 방식 {name}에 필요한 패키지가 설치되어 있지 않아 {schemes[0]}을 사용합니다.")
+        return schemes[0]
+    return name
+
+def scheme_of(stored: str) -> Optional[str]:
+    """저장된 값의 방식 (알려진 접두어가 없으면 평문으로 저장된 이전 비밀번호 - None)"""
+    if stored.startswith("$argon2"):
+        return SCHEME_ARGON2
+    if stored.startswith(("$2a$", "$2b$", "$2y$")):
+        return SCHEME_BCRYPT
+    if stored.startswith("$scrypt$"):
+        return SCHEME_SCRYPT
+    return None
+
+# ---------------------------------------------------------------------------
+# scrypt ($scrypt$ln=15,r=8,p=1$<salt>$<key>, base64)
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+def _b64decode(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+def _scrypt(password: str, salt: bytes, log_n: int, r: int, p: int, key_bytes: int) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=2 ** log_n, r=r, p=p, maxmem=_SCRYPT_MAXMEM, dklen=key_bytes)
+
+def _scrypt_params(stored: str) -> tuple:
+    _, _, params, salt, key = stored.split("$")
+    values = dict(item.split("=") for item in params.split(","))
+    return int(values["ln"]), int(values["r"]), int(values["p"]), _b64decode(salt), _b64decode(key)
+
+def _scrypt_hash(password: str) -> str:
+    salt = os.urandom(SCRYPT_SALT_BYTES)
+    key = _scrypt(password, salt, SCRYPT_LOG_N, SCRYPT_R, SCRYPT_P, SCRYPT_KEY_BYTES)
+    return f"$scrypt$ln={SCRYPT_LOG_N},r={SCRYPT_R},p={SCRYPT_P}${_b64encode(salt)}${_b64encode(key)}"
+
+def _scrypt_verify(password: str, stored: str) -> bool:
+    try:
+        log_n, r, p, salt, key = _scrypt_params(stored)
+    except (ValueError, KeyError):
+        return False
+    return hmac.compare_digest(_scrypt(password, salt, log_n, r, p, len(key)), key)
+
+# ---------------------------------------------------------------------------
+
+class PasswordHasher:
+    """
+    비밀번호 해시/검증 (hash/verify는 스레드 풀에서 실행, *_sync는 호출한 스레드에서 바로 실행)
+
+    Args:
+        scheme: 새로 저장할 때 쓰는 방식 (argon2/bcrypt/scrypt)
+        workers: 동시에 실행하는 최대 해시/검증 수 (스레드 수)
+    """
+
+    def __init__(self, scheme: str, workers: int = 4):
+        self.scheme = scheme
+        self.workers = max(1, workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = asyncio.Semaphore(self.workers)
+        self._argon2 = argon2.PasswordHasher() if scheme == SCHEME_ARGON2 else None
+
+    # 동기 버전 --------------------------------------------------------------
+
+    def hash_sync(self, password: str) -> str:
+        """현재 방식으로 해시"""
+        if self.scheme == SCHEME_ARGON2:
+            return self._argon2.hash(password)
+        if self.scheme == SCHEME_BCRYPT:
+            encoded = password.encode()
+            if len(encoded) > 72:
+                raise ValueError("비밀번호는 72바이트 이하여야 합니다.")
+            return bcrypt.hashpw(encoded, bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
+        return _scrypt_hash(password)
+
+    def verify_sync(self, password: str, stored: str) -> bool:
+        """저장된 값(해시 또는 이전 평문)과 비밀번호 비교"""
+        scheme = scheme_of(stored)
+        if scheme is None:
+            return hmac.compare_digest(password.encode(), stored.encode())
+        if scheme == SCHEME_SCRYPT:
+            return _scrypt_verify(password, stored)
+        if scheme == SCHEME_ARGON2:
+            if argon2 is None:
+                raise RuntimeError("argon2 해시를 검증하려면 argon2-cffi 패키지가 필요합니다.")
+            try:
+                return (self._argon2 or argon2.PasswordHasher()).verify(stored, password)
+            except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+                return False
+        if bcrypt is None:
+            raise RuntimeError("bcrypt 해시를 검증하려면 bcrypt 패키지가 필요합니다.")
+        encoded = password.encode()
+        return len(encoded) <= 72 and bcrypt.checkpw(encoded, stored.encode())
+
+    def needs_rehash(self, stored: str) -> bool:
+        """현재 방식/비용 설정으로 다시 저장해야 하는지 (평문, 다른 방식, 이전 비용 설정)"""
+        scheme = scheme_of(stored)
+        if scheme != self.scheme:
+            return True
+        if scheme == SCHEME_ARGON2:
+            return self._argon2.check_needs_rehash(stored)
+        if scheme == SCHEME_BCRYPT:
+            return stored.split("$")[2] != f"{BCRYPT_ROUNDS:02d}"
+        try:
+            log_n, r, p, _, key = _scrypt_params(stored)
+        except (ValueError, KeyError):
+            return True
+        return (log_n, r, p, len(key)) != (SCRYPT_LOG_N, SCRYPT_R, SCRYPT_P, SCRYPT_KEY_BYTES)
+
+    # 비동기 버전 (스레드 풀) ---------------------------------------------------
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", self.hash_sync, password)
+
+    async def verify(self, password: str, stored: str) -> bool:
+        return await self._run("verify", self.verify_sync, password, stored)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # 워커 프로세스에서 처음 쓸 때 생성 (fork 전에 만든 스레드를 물려받지 않음)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def _run(self, operation: str, fn: Callable, *args):
+        queued_at = time.perf_counter()
+        password_hash_waiting.inc()
+        try:
+            await self._slots.acquire()
+        finally:
+            password_hash_waiting.dec()
+        try:
+            started_at = time.perf_counter()
+            password_hash_wait_seconds.observe(value=started_at - queued_at)
+            password_hash_in_progress.inc()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+            finally:
+                password_hash_in_progress.dec()
+                password_hash_duration_seconds.observe(operation, value=time.perf_counter() - started_at)
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료 (다시 쓰면 새로 생성)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# 앱 전체에서 공유하는 해시 도구 (PASSWORD_HASH_SCHEME, PASSWORD_HASH_WORKERS)
+password_hasher = PasswordHasher(resolve_scheme(settings.password_hash_scheme), settings.password_hash_workers)
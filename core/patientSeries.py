@@ -0,0 +1,188 @@
+# 환자 측정 기록 컬럼형(NumPy 배열) 컨테이너
+# 분석(추이, 기간 이동 평균, 이상치)용으로 환자 한 명의 기록을 항목별 배열로 보관하는 모듈
+#
+# - DB 커서의 원본 문서(dict)에서 바로 만들고 기록마다 HealthRecordDB(pydantic) 객체를 만들지 않는다
+# - 기록 한 건은 측정 시각 8바이트 + 항목 6개 x 8바이트 (pydantic 객체 목록보다 훨씬 작음)
+# - 누락된 측정값은 NaN, 모든 계산은 NaN을 제외하고 한다
+# - 측정 시각 오름차순으로 유지한다 (기간 자르기는 이진 탐색)
+#
+# 분석 코드에서 가져다 쓰는 라이브러리이며 아직 이것을 쓰는 서비스/라우트는 없다
+# (통계는 healthStatsCrud 증분 집계, 추이는 healthCrud.get_health_metric_trend 스트리밍 LTTB를 사용)
+# DB에서 만들 때는 healthCrud.iter_health_records의 원본 문서를 PatientSeriesBuilder.add에 넘긴다
+
+import numpy as np
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# 컬럼으로 보관하는 측정 항목
+SERIES_COLUMNS = ("systolic_bp", "diastolic_bp", "glucose_level", "weight_kg", "smoking", "stroke_risk_score")
+
+# 커서를 읽는 동안 이 행 수마다 배열로 변환 (임시 리스트가 차지하는 메모리 제한)
+BUILD_CHUNK_ROWS = 4096
+
+_MS_PER_DAY = 86_400_000
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+def _to_datetime_array(values: Sequence[datetime]) -> np.ndarray:
+    """datetime 리스트를 datetime64[ms] 배열로 변환 (numpy의 datetime 객체 변환보다 몇 배 빠른 정수 경로)"""
+    return np.array([(value - _EPOCH) // _ONE_MS for value in values], dtype=np.int64).view("datetime64[ms]")
+
+def _to_float_array(values: Sequence) -> np.ndarray:
+    """측정값 리스트를 float64 배열로 변환 (None → NaN)"""
+    if None in values:
+        values = [np.nan if value is None else value for value in values]
+    return np.asarray(values, dtype=np.float64)
+
+class PatientSeriesBuilder:
+    """원본 문서를 한 건씩 받아 PatientSeries를 만드는 빌더 (커서 순회용)"""
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self._rows: List[tuple] = []  # (측정 시각, 항목 값...) - 배열로 변환하기 전 임시 보관
+        self._time_chunks: List[np.ndarray] = []
+        self._chunks: Dict[str, List[np.ndarray]] = {name: [] for name in SERIES_COLUMNS}
+
+    def add(self, doc: dict) -> None:
+        get = doc.get
+        self._rows.append((doc["created_at"], *[get(name) for name in SERIES_COLUMNS]))
+        if len(self._rows) >= BUILD_CHUNK_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        times, *columns = zip(*self._rows)
+        self._rows = []
+        self._time_chunks.append(_to_datetime_array(times))
+        for name, values in zip(SERIES_COLUMNS, columns):
+            self._chunks[name].append(_to_float_array(values))
+
+    def build(self) -> "PatientSeries":
+        self._flush()
+        if not self._time_chunks:
+            return PatientSeries.empty(self.user_id)
+
+        created_at = np.concatenate(self._time_chunks)
+        columns = {name: np.concatenate(chunks) for name, chunks in self._chunks.items()}
+        self._time_chunks, self._chunks = [], {name: [] for name in SERIES_COLUMNS}
+
+        # 입력이 정렬되어 있지 않으면 측정 시각 순으로 정렬 (같은 시각은 입력 순서 유지)
+        if created_at.size > 1 and np.any(created_at[1:] < created_at[:-1]):
+            order = np.argsort(created_at, kind="stable")
+            created_at = created_at[order]
+            columns = {name: values[order] for name, values in columns.items()}
+        return PatientSeries(self.user_id, created_at, columns)
+
+class PatientSeries:
+    """환자 한 명의 측정 기록 (측정 시각 오름차순, 항목별 float64 배열)"""
+
+    def __init__(self, user_id: str, created_at: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.user_id = user_id
+        self.created_at = created_at  # datetime64[ms]
+        self.columns = columns
+
+    @classmethod
+    def empty(cls, user_id: str) -> "PatientSeries":
+        return cls(
+            user_id,
+            np.empty(0, dtype="datetime64[ms]"),
+            {name: np.empty(0, dtype=np.float64) for name in SERIES_COLUMNS}
+        )
+
+    @classmethod
+    def from_documents(cls, user_id: str, docs: Iterable[dict]) -> "PatientSeries":
+        """원본 문서 목록으로 생성"""
+        builder = PatientSeriesBuilder(user_id)
+        for doc in docs:
+            builder.add(doc)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return int(self.created_at.size)
+
+    @property
+    def nbytes(self) -> int:
+        """배열이 차지하는 메모리 (바이트)"""
+        return int(self.created_at.nbytes + sum(values.nbytes for values in self.columns.values()))
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self.columns:
+            raise ValueError(f"지원하지 않는 측정 항목입니다: {name}")
+        return self.columns[name]
+
+    def between(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> "PatientSeries":
+        """기간 [start, end] 기록 (배열을 복사하지 않는 view)"""
+        lo = 0 if start is None else int(np.searchsorted(self.created_at, np.datetime64(start, "ms"), side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.created_at, np.datetime64(end, "ms"), side="right"))
+        return PatientSeries(
+            self.user_id,
+            self.created_at[lo:hi],
+            {name: values[lo:hi] for name, values in self.columns.items()}
+        )
+
+    def summary(self, name: str) -> Dict[str, Optional[float]]:
+        """측정 수/평균/최소/최대 (값이 없으면 평균/최소/최대는 None)"""
+        values = self.column(name)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return {"count": 0, "avg": None, "min": None, "max": None}
+        return {
+            "count": int(values.size),
+            "avg": float(values.mean()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+        }
+
+    def rolling_mean(self, name: str, days: float) -> np.ndarray:
+        """
+        측정 시점마다 직전 days일 (t - days, t] 구간의 평균 (구간에 값이 없으면 NaN)
+        누적 합 + 이진 탐색으로 기록 수에 비례하는 시간에 계산
+        """
+        values = self.column(name)
+        valid = ~np.isnan(values)
+        sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+        counts = np.concatenate(([0], np.cumsum(valid)))
+
+        times = self.created_at.astype(np.int64)
+        starts = np.searchsorted(times, times - int(days * _MS_PER_DAY), side="right")
+        ends = np.arange(1, len(self) + 1)
+
+        window_counts = counts[ends] - counts[starts]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(window_counts > 0, (sums[ends] - sums[starts]) / window_counts, np.nan)
+
+    def trend_per_day(self, name: str) -> Optional[float]:
+        """최소제곱 직선의 하루당 변화량 (값이 2개 미만이거나 측정 시각이 모두 같으면 None)"""
+        values = self.column(name)
+        valid = ~np.isnan(values)
+        if valid.sum() < 2:
+            return None
+
+        days = (self.created_at[valid] - self.created_at[valid][0]).astype(np.int64) / _MS_PER_DAY
+        if np.ptp(days) == 0:
+            return None
+        slope, _ = np.polyfit(days, values[valid], 1)
+        return float(slope)
+
+    def anomalies(self, name: str, window: int = 20, threshold: float = 3.0) -> np.ndarray:
+        """
+        직전 window개 측정값의 평균에서 표준편차의 threshold배 이상 벗어난 기록의 위치
+        (직전 값이 window개 미만이거나 표준편차가 0이면 판정하지 않음)
+        """
+        values = self.column(name)
+        positions = np.flatnonzero(~np.isnan(values))
+        series = values[positions]
+        if series.size <= window:
+            return np.empty(0, dtype=np.int64)
+
+        sums = np.concatenate(([0.0], np.cumsum(series)))
+        squares = np.concatenate(([0.0], np.cumsum(series * series)))
+        current = np.arange(window, series.size)
+        mean = (sums[current] - sums[current - window]) / window
+        variance = np.maximum((squares[current] - squares[current - window]) / window - mean * mean, 0.0)
+        std = np.sqrt(variance)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            flagged = (std > 0) & (np.abs(series[current] - mean) >= threshold * std)
+        return positions[current[flagged]]
@@ -38,20 +38,74 @@ def calculate_stroke_risk(
     10. 혈당 수치 (최대 10점)
     """
     
-    risk_score = 0.0
+    static_score = calculate_static_risk(
+        age=age,
+        sex=sex,
+        stroke_history=stroke_history,
+        hypertension=hypertension,
+        heart_disease=heart_disease,
+        diabetes=diabetes
+    )
+    dynamic_score = calculate_dynamic_risk(
+        smoking_history=smoking_history,
+        systolic_bp=systolic_bp,
+        diastolic_bp=diastolic_bp,
+        weight_kg=weight_kg,
+        height_cm=height_cm,
+        glucose_level=glucose_level,
+        smoking=smoking
+    )
+    
+    return combine_risk_score(static_score, dynamic_score)
+
+
+def combine_risk_score(static_score: float, dynamic_score: float) -> float:
+    """고정/변동 위험 요인 점수를 합산한 최종 점수 (0-100점)"""
+    risk_score = static_score + dynamic_score
     
-    # 1. 나이 (최대 20점)
-    # 40세 미만: 0점, 40-50: 5점, 50-60: 10점, 60-70: 15점, 70+: 20점
+    # 최종 점수는 0-100 사이로 제한
+    risk_score = min(risk_score, 100.0)
+    
+    return round(risk_score, 1)
+
+
+def get_age_bracket(age: int) -> int:
+    """
+    나이 구간 (위험도 점수 기준)
+    
+    Returns:
+        0: 40세 미만, 1: 40-50, 2: 50-60, 3: 60-70, 4: 70+
+    """
     if age < 40:
-        risk_score += 0
+        return 0
     elif age < 50:
-        risk_score += 5
+        return 1
     elif age < 60:
-        risk_score += 10
+        return 2
     elif age < 70:
-        risk_score += 15
+        return 3
     else:
-        risk_score += 20
+        return 4
+
+
+def calculate_static_risk(
+    age: int,
+    sex: str,
+    stroke_history: bool = False,
+    hypertension: bool = False,
+    heart_disease: bool = False,
+    diabetes: bool = False
+) -> float:
+    """
+    고정 위험 요인 점수 (측정할 때마다 바뀌지 않는 부분)
+    
+    나이 구간, 성별, 질병력만으로 결정되므로 사용자별로 미리 계산해 둘 수 있다.
+    """
+    risk_score = 0.0
+    
+    # 1. 나이 (최대 20점)
+    # 40세 미만: 0점, 40-50: 5점, 50-60: 10점, 60-70: 15점, 70+: 20점
+    risk_score += (0, 5, 10, 15, 20)[get_age_bracket(age)]
     
     # 2. 성별 (남성 가산 5점)
     if sex == "M":
@@ -73,6 +127,25 @@ def calculate_stroke_risk(
     if diabetes:
         risk_score += 10
     
+    return risk_score
+
+
+def calculate_dynamic_risk(
+    smoking_history: str = "NON_SMOKER",
+    systolic_bp: Optional[int] = None,
+    diastolic_bp: Optional[int] = None,
+    weight_kg: Optional[float] = None,
+    height_cm: Optional[int] = None,
+    glucose_level: Optional[int] = None,
+    smoking: Optional[int] = None
+) -> float:
+    """
+    변동 위험 요인 점수 (측정 데이터마다 다시 계산하는 부분)
+    
+    흡연, 혈압, BMI, 혈당 점수의 합 (0-100 제한 전 값)
+    """
+    risk_score = 0.0
+    
     # 7. 흡연 이력 및 현재 흡연량 (최대 15점)
     if smoking_history == "SMOKER" or (smoking and smoking > 0):
         # 현재 흡연자
@@ -132,10 +205,7 @@ def calculate_stroke_risk(
             # 공복혈당장애
             risk_score += 4
     
-    # 최종 점수는 0-100 사이로 제한
-    risk_score = min(risk_score, 100.0)
-    
-    return round(risk_score, 1)
+    return risk_score
 
 
 def get_risk_level(risk_score: float) -> str:
@@ -158,9 +228,9 @@ def get_risk_level(risk_score: float) -> str:
         return "매우 높음"
 
 
-def calculate_age(birth_date: date) -> int:
-    """생년월일로 나이 계산"""
-    today = datetime.now().date()
+def calculate_age(birth_date: date, on: Optional[date] = None) -> int:
+    """생년월일로 나이 계산 (on: 기준 날짜, 없으면 오늘)"""
+    today = on or datetime.now().date()
     age = today.year - birth_date.year
     # 생일이 지나지 않았으면 -1
     if today.month < birth_date.month or (today.month == birth_date.month and today.day < birth_date.day):
@@ -0,0 +1,211 @@
+# 건강 기록 시계열 컬렉션 이전 도구
+# 기존 health_records(일반 컬렉션)의 기록을 health_records_ts(MongoDB 시계열 컬렉션)로 복사한다
+# 일반 컬렉션을 시계열 컬렉션으로 바로 바꾸거나 이름을 바꿀 수 없으므로 새 컬렉션에 복사하는 방식
+#
+# - _id 순서로 batch_size 개씩 복사하고, batch마다 마지막 _id를 체크포인트(migrations 컬렉션)에 기록
+# - 중단 후 다시 실행하면 체크포인트 이후부터 이어서 복사 (첫 batch는 이미 복사된 ID를 건너뜀)
+# - 한 번 끝까지 복사한 뒤 다시 실행하면 기존 컬렉션 전체를 다시 훑어서 시계열 컬렉션에 없는 _id를 모두 복사
+#   (그 사이 저장된 기록의 _id가 체크포인트보다 작을 수 있음 - 가져오기 ID <uuid4>:<줄 번호>, 직접 지정한 ID 등)
+# - 복사가 끝나면 양쪽 기록 수와 저장 크기를 비교해서 출력
+#
+# 절차:
+#   1. python -m core.timeseriesMigration              (서버 실행 중에도 가능)
+#   2. 기록 저장/삭제를 잠시 멈추고 한 번 더 실행해서 그 사이 저장된 기록까지 복사 (복사 후 삭제된 기록은 반영되지 않음)
+#   3. HEALTH_RECORDS_TIMESERIES=true 로 서버 재시작
+#   4. 확인 후 python -m core.timeseriesMigration --drop-source 로 기존 컬렉션 삭제
+#      (기존 컬렉션의 모든 _id가 시계열 컬렉션에 있을 때만 삭제)
+#
+# 시계열 컬렉션의 ID 조회/삭제는 MongoDB 7.0 이상이 필요하다
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from datetime import datetime
+from core.config import HEALTH_RECORDS_COLLECTION, HEALTH_RECORDS_TS_COLLECTION
+from core.indexRegistry import HEALTH_RECORDS_TS_INDEXES, timeseries_options
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+# 체크포인트 문서 ID (migrations 컬렉션)
+MIGRATION_ID = "health_records_timeseries"
+
+async def _collection_info(db: AsyncIOMotorDatabase, name: str) -> Optional[dict]:
+    async for info in await db.list_collections(filter={"name": name}):
+        return info
+    return None
+
+async def ensure_timeseries_collection(db: AsyncIOMotorDatabase, granularity: str) -> None:
+    """시계열 컬렉션과 인덱스가 없으면 생성 (같은 이름의 일반 컬렉션이 있으면 ValueError)"""
+    info = await _collection_info(db, HEALTH_RECORDS_TS_COLLECTION)
+    if info is None:
+        await db.create_collection(HEALTH_RECORDS_TS_COLLECTION, **timeseries_options(granularity))
+    elif info.get("type") != "timeseries":
+        raise ValueError(f"{HEALTH_RECORDS_TS_COLLECTION} 컬렉션이 이미 있지만 시계열 컬렉션이 아닙니다.")
+
+    await db[HEALTH_RECORDS_TS_COLLECTION].create_indexes([spec.to_model() for spec in HEALTH_RECORDS_TS_INDEXES])
+
+async def storage_stats(db: AsyncIOMotorDatabase, name: str) -> Dict[str, int]:
+    """컬렉션 저장 크기 (데이터/인덱스, 바이트)"""
+    stats = {"storage_size": 0, "index_size": 0}
+    async for row in db[name].aggregate([{"$collStats": {"storageStats": {}}}]):
+        storage = row.get("storageStats", {})
+        stats["storage_size"] += storage.get("storageSize", 0)
+        stats["index_size"] += storage.get("totalIndexSize", 0)
+    return stats
+
+# 기존 컬렉션 → 시계열 컬렉션 복사
+async def migrate_health_records(
+    db: AsyncIOMotorDatabase,
+    granularity: str,
+    batch_size: int = 5000,
+    on_progress: Optional[Callable[[int], Awaitable[None]]] = None,
+    full_scan: bool = False
+) -> Dict[str, int]:
+    """
+    체크포인트 이후의 기록을 시계열 컬렉션으로 복사
+    이전 실행이 끝까지 복사했거나 full_scan이면 기존 컬렉션 전체를 훑어서 시계열 컬렉션에 없는 기록만 복사
+
+    Returns:
+        {"copied": 이번 실행에서 복사한 수, "source": 기존 기록 수, "target": 시계열 컬렉션 기록 수}
+    """
+    await ensure_timeseries_collection(db, granularity)
+    source = db[HEALTH_RECORDS_COLLECTION]
+    target = db[HEALTH_RECORDS_TS_COLLECTION]
+
+    checkpoint = await db.migrations.find_one({"_id": MIGRATION_ID}) or {}
+    full_scan = full_scan or checkpoint.get("completed", False)
+    last_id = None if full_scan else checkpoint.get("last_id")
+    # 체크포인트 기록 전에 중단되었다면 첫 batch 일부가 이미 복사되어 있을 수 있음
+    verify_next = last_id is not None or await target.estimated_document_count() > 0
+
+    copied = 0
+    while True:
+        query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+        docs = await source.find(query).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        if not docs:
+            break
+
+        # 시계열 컬렉션은 _id 중복을 막지 않으므로 이미 있는 기록은 직접 걸러낸다
+        if verify_next or full_scan:
+            existing = await _existing_ids(target, [doc["_id"] for doc in docs])
+            docs_to_copy = [doc for doc in docs if doc["_id"] not in existing]
+            verify_next = False
+        else:
+            docs_to_copy = docs
+
+        if docs_to_copy:
+            await target.insert_many(docs_to_copy, ordered=False)
+        copied += len(docs_to_copy)
+        last_id = docs[-1]["_id"]
+        await db.migrations.update_one(
+            {"_id": MIGRATION_ID},
+            {"$set": {"last_id": last_id, "updated_at": datetime.now()}, "$inc": {"copied": len(docs_to_copy)}},
+            upsert=True
+        )
+        if on_progress:
+            await on_progress(copied)
+
+    # 끝까지 복사함 - 다음 실행은 전체를 다시 훑음
+    await db.migrations.update_one(
+        {"_id": MIGRATION_ID},
+        {"$set": {"completed": True, "updated_at": datetime.now()}},
+        upsert=True
+    )
+    return {
+        "copied": copied,
+        "source": await source.count_documents({}),
+        "target": await target.count_documents({}),
+    }
+
+async def _existing_ids(collection, ids: List) -> Set:
+    """ids 중 컬렉션에 있는 _id 집합"""
+    return set(await collection.distinct("_id", {"_id": {"$in": ids}}))
+
+# 복사되지 않은 기록 확인
+async def find_missing_ids(db: AsyncIOMotorDatabase, batch_size: int = 5000, sample_size: int = 10) -> Tuple[int, List]:
+    """
+    기존 컬렉션의 _id 중 시계열 컬렉션에 없는 것 (기록 수가 아니라 _id로 비교)
+
+    Returns:
+        (없는 기록 수, 예시 _id 최대 sample_size개)
+    """
+    source = db[HEALTH_RECORDS_COLLECTION]
+    target = db[HEALTH_RECORDS_TS_COLLECTION]
+    missing = 0
+    samples = []
+    last_id = None
+    while True:
+        query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+        ids = [doc["_id"] for doc in await source.find(query, {"_id": 1}).sort("_id", 1).limit(batch_size).to_list(length=batch_size)]
+        if not ids:
+            break
+        existing = await _existing_ids(target, ids)
+        for doc_id in ids:
+            if doc_id not in existing:
+                missing += 1
+                if len(samples) < sample_size:
+                    samples.append(doc_id)
+        last_id = ids[-1]
+    return missing, samples
+
+# 기존 컬렉션 삭제
+async def drop_source(db: AsyncIOMotorDatabase) -> None:
+    """
+    기존 컬렉션의 모든 _id가 시계열 컬렉션에 있을 때만 기존 컬렉션과 체크포인트 삭제 (아니면 ValueError)
+    전환 후 시계열 컬렉션에 새로 저장된 기록은 비교에 영향을 주지 않음
+    """
+    missing, samples = await find_missing_ids(db)
+    if missing:
+        examples = ", ".join(str(doc_id) for doc_id in samples)
+        raise ValueError(f"시계열 컬렉션에 없는 기록이 {missing}건 있습니다 (예: {examples}). 먼저 이전을 다시 실행하세요.")
+
+    await db.drop_collection(HEALTH_RECORDS_COLLECTION)
+    await db.migrations.delete_one({"_id": MIGRATION_ID})
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import os
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from core.config import settings
+
+    parser = argparse.ArgumentParser(description="health_records → 시계열 컬렉션(health_records_ts) 이전")
+    parser.add_argument("--granularity", choices=["seconds", "minutes", "hours"], default=settings.health_records_granularity,
+                        help="시계열 컬렉션 granularity (컬렉션을 새로 만들 때만 적용)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="한 번에 복사하는 기록 수")
+    parser.add_argument("--full", action="store_true", help="체크포인트와 관계없이 기존 컬렉션 전체를 다시 훑어서 없는 기록 복사")
+    parser.add_argument("--drop-source", action="store_true", help="기존 기록이 모두 복사되었으면 기존 컬렉션 삭제")
+    args = parser.parse_args()
+
+    def _mb(size: int) -> str:
+        return f"{size / (1 << 20):,.1f}MB"
+
+    async def run():
+        load_dotenv()
+        client = AsyncIOMotorClient(os.getenv("MONGO_URL"))
+        db = client[settings.mongo_db_name]
+        try:
+            if args.drop_source:
+                await drop_source(db)
+                print(f"✅ {HEALTH_RECORDS_COLLECTION} 컬렉션 삭제 완료")
+                return 0
+
+            async def progress(copied: int):
+                print(f"  ... {copied:,}건 복사", flush=True)
+
+            result = await migrate_health_records(db, args.granularity, args.batch_size, progress, full_scan=args.full)
+            print(f"✅ 복사 {result['copied']:,}건 (기존 {result['source']:,}건 / 시계열 {result['target']:,}건)")
+            for name in (HEALTH_RECORDS_COLLECTION, HEALTH_RECORDS_TS_COLLECTION):
+                stats = await storage_stats(db, name)
+                print(f"  {name}: 데이터 {_mb(stats['storage_size'])}, 인덱스 {_mb(stats['index_size'])}")
+            missing, _ = await find_missing_ids(db, args.batch_size)
+            if missing:
+                print(f"⚠️ 복사되지 않은 기록이 {missing:,}건 있습니다. 기록 저장을 멈춘 상태에서 다시 실행하세요.")
+                return 1
+            return 0
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        finally:
+            client.close()
+
+    raise SystemExit(asyncio.run(run()))
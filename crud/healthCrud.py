@@ -1,10 +1,35 @@
 # DB와 직접 상호작용하는 Health CRUD 함수들
 # 시계열 건강 측정 데이터
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
 from models.healthModel import HealthRecordDB
-from typing import Optional, List
+from crud import healthStatsCrud
+from core.config import settings
+from core.pagination import find_page, aggregate_page, DEFAULT_PAGE_LIMIT
+from core.downsampler import LTTBDownsampler
+from typing import Optional, List, Tuple, Dict, Iterable, AsyncIterator
 from bson import ObjectId
+from pymongo.errors import BulkWriteError
+from datetime import datetime
+
+def records_collection(db: AsyncIOMotorDatabase) -> AsyncIOMotorCollection:
+    """건강 기록 컬렉션 (설정에 따라 일반 컬렉션 또는 시계열 컬렉션)"""
+    return db[settings.health_records_collection]
+
+async def _find_existing_ids(db: AsyncIOMotorDatabase, docs: List[dict]) -> Dict[int, str]:
+    """
+    시계열 컬렉션은 _id 고유 인덱스가 없으므로 저장 전에 이미 있는(또는 목록 안에서 겹치는) ID를 찾음
+    오류 메시지는 일반 컬렉션의 중복 키 오류(E11000)와 같은 형태로 맞춘다
+    """
+    ids = [doc["_id"] for doc in docs]
+    existing = set(await records_collection(db).distinct("_id", {"_id": {"$in": ids}}))
+
+    errors = {}
+    for i, doc_id in enumerate(ids):
+        if doc_id in existing:
+            errors[i] = f"E11000 duplicate key error: _id {doc_id}"
+        existing.add(doc_id)
+    return errors
 
 # 건강 측정 데이터 생성
 async def create_health_record(db: AsyncIOMotorDatabase, health_record: HealthRecordDB) -> HealthRecordDB:
@@ -13,22 +38,125 @@ async def create_health_record(db: AsyncIOMotorDatabase, health_record: HealthRe
     if health_dict["_id"] == "":
         health_dict["_id"] = str(ObjectId())
     
-    await db.health_records.insert_one(health_dict)
+    await records_collection(db).insert_one(health_dict)
+    await healthStatsCrud.apply_created_records(db, [health_dict])
     return health_record
 
+# 건강 측정 데이터 여러 건 생성
+async def create_health_records(db: AsyncIOMotorDatabase, health_records: List[HealthRecordDB]) -> Dict[int, str]:
+    """
+    여러 건을 insert_many 한 번으로 저장 (ordered=False: 일부가 실패해도 나머지는 저장)
+
+    Returns:
+        저장에 실패한 항목 {목록 내 순번: 오류 메시지} (모두 성공하면 빈 dict)
+    """
+    if not health_records:
+        return {}
+
+    docs = []
+    for health_record in health_records:
+        health_dict = health_record.model_dump(by_alias=True)
+        if health_dict["_id"] == "":
+            health_dict["_id"] = str(ObjectId())
+        docs.append(health_dict)
+
+    errors = await _find_existing_ids(db, docs) if settings.health_records_timeseries else {}
+    positions = [i for i in range(len(docs)) if i not in errors]
+    if positions:
+        try:
+            await records_collection(db).insert_many([docs[i] for i in positions], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                errors[positions[error["index"]]] = error.get("errmsg", "저장 실패")
+
+    # 저장에 성공한 기록만 통계에 반영
+    await healthStatsCrud.apply_created_records(db, [doc for i, doc in enumerate(docs) if i not in errors])
+    return errors
+
 # 사용자 ID로 건강 측정 데이터 조회
-async def get_health_records_by_user_id(db: AsyncIOMotorDatabase, user_id: str) -> List[HealthRecordDB]:
-    """특정 사용자의 모든 건강 측정 데이터 조회 (최신순)"""
-    records = []
-    cursor = db.health_records.find({"user_id": user_id}).sort("created_at", -1)
+async def get_health_records_by_user_id(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[HealthRecordDB], Optional[str]]:
+    """특정 사용자의 건강 측정 데이터 한 페이지 조회 (최신순) + 다음 페이지 커서"""
+    docs, next_cursor = await find_page(records_collection(db), {"user_id": user_id}, "created_at", limit, after)
+    return [HealthRecordDB(**record) for record in docs], next_cursor
+
+# 사용자 ID로 건강 측정 데이터 조회 (projection 적용 원본 문서, 빠른 읽기 경로)
+async def get_health_record_rows(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    projection: dict,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """get_health_records_by_user_id와 같은 페이지를 HealthRecordDB 없이 projection 적용 문서로 조회"""
+    return await aggregate_page(records_collection(db), {"user_id": user_id}, "created_at", projection, limit, after)
+
+# 사용자 건강 측정 데이터 전체 순회 (내보내기용)
+async def iter_health_records(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    batch_size: int = 1000
+) -> AsyncIterator[dict]:
+    """
+    기간 내 건강 측정 데이터를 오래된 순으로 하나씩 반환 (원본 문서 dict)
+    커서에서 batch_size 개씩 받아오므로 기록 수와 관계없이 메모리 사용량이 일정하다
+    """
+    query = {"user_id": user_id}
+    if start or end:
+        query["created_at"] = {}
+        if start:
+            query["created_at"]["$gte"] = start
+        if end:
+            query["created_at"]["$lte"] = end
+
+    cursor = records_collection(db).find(query).sort([("created_at", 1), ("_id", 1)]).batch_size(batch_size)
     async for record in cursor:
-        records.append(HealthRecordDB(**record))
-    return records
+        yield record
+
+# 측정 항목 추이 조회 (다운샘플링)
+async def get_health_metric_trend(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    metric: str,
+    max_points: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> Tuple[int, List[Tuple[datetime, float]]]:
+    """
+    기간 내 측정 항목 값을 LTTB로 최대 max_points 개까지 줄여서 조회 (오래된 순)
+    커서를 스트리밍하며 계산하므로 기록 수와 관계없이 메모리 사용량이 일정하다
+
+    Returns:
+        (기간 내 전체 측정 수, [(측정 시각, 값), ...])
+    """
+    query = {"user_id": user_id, metric: {"$ne": None}}
+    if start or end:
+        query["created_at"] = {}
+        if start:
+            query["created_at"]["$gte"] = start
+        if end:
+            query["created_at"]["$lte"] = end
+
+    total = await records_collection(db).count_documents(query)
+    sampler = LTTBDownsampler(total, max_points)
+
+    cursor = records_collection(db).find(query, {"_id": 0, "created_at": 1, metric: 1}).sort("created_at", 1)
+    async for record in cursor:
+        created_at = record["created_at"]
+        sampler.add(created_at.timestamp(), float(record[metric]), created_at)
+
+    return total, [(created_at, value) for _, value, created_at in sampler.result()]
 
 # 건강 측정 데이터 ID로 조회
 async def get_health_record_by_id(db: AsyncIOMotorDatabase, record_id: str) -> Optional[HealthRecordDB]:
     """ID로 건강 측정 데이터 조회"""
-    record = await db.health_records.find_one({"_id": record_id})
+    record = await records_collection(db).find_one({"_id": record_id})
     if record:
         return HealthRecordDB(**record)
     return None
@@ -36,7 +164,7 @@ async def get_health_record_by_id(db: AsyncIOMotorDatabase, record_id: str) -> O
 # 최신 건강 측정 데이터 조회
 async def get_latest_health_record(db: AsyncIOMotorDatabase, user_id: str) -> Optional[HealthRecordDB]:
     """사용자의 가장 최근 건강 측정 데이터 조회"""
-    record = await db.health_records.find_one(
+    record = await records_collection(db).find_one(
         {"user_id": user_id},
         sort=[("created_at", -1)]
     )
@@ -44,11 +172,57 @@ async def get_latest_health_record(db: AsyncIOMotorDatabase, user_id: str) -> Op
         return HealthRecordDB(**record)
     return None
 
+# 최신 건강 측정 데이터 조회 (projection 적용 원본 문서, 빠른 읽기 경로)
+async def get_latest_health_record_row(db: AsyncIOMotorDatabase, user_id: str, projection: dict) -> Optional[dict]:
+    """사용자의 가장 최근 건강 측정 데이터를 projection 적용 문서로 조회"""
+    cursor = records_collection(db).aggregate([
+        {"$match": {"user_id": user_id}},
+        {"$sort": {"created_at": -1}},
+        {"$limit": 1},
+        {"$project": projection}
+    ])
+    docs = await cursor.to_list(length=1)
+    return docs[0] if docs else None
+
+# 여러 사용자의 최신 측정 데이터 + 측정 수 조회
+async def get_latest_records_summary(
+    db: AsyncIOMotorDatabase,
+    user_ids: Iterable[str]
+) -> Dict[str, Tuple[HealthRecordDB, int]]:
+    """
+    사용자별 최신 건강 측정 데이터와 전체 측정 수를 집계 파이프라인 한 번으로 조회
+    (user_id, created_at, _id) 인덱스 순서로 정렬하므로 사용자별 첫 문서가 최신 기록이다
+
+    Returns:
+        {user_id: (최신 기록, 측정 수)} - 기록이 없는 사용자는 포함되지 않음
+    """
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+
+    pipeline = [
+        {"$match": {"user_id": {"$in": user_ids}}},
+        {"$sort": {"user_id": 1, "created_at": -1, "_id": -1}},
+        {"$group": {
+            "_id": "$user_id",
+            "latest": {"$first": "$$ROOT"},
+            "count": {"$sum": 1}
+        }}
+    ]
+
+    summary = {}
+    async for group in records_collection(db).aggregate(pipeline):
+        summary[group["_id"]] = (HealthRecordDB(**group["latest"]), group["count"])
+    return summary
+
 # 건강 측정 데이터 삭제
 async def delete_health_record(db: AsyncIOMotorDatabase, record_id: str) -> Optional[HealthRecordDB]:
     """건강 측정 데이터 삭제"""
-    record = await db.health_records.find_one({"_id": record_id})
+    record = await records_collection(db).find_one({"_id": record_id})
     if record:
-        result = await db.health_records.delete_one({"_id": record_id})
-        return HealthRecordDB(**record) if result.deleted_count > 0 else None
+        result = await records_collection(db).delete_one({"_id": record_id})
+        if result.deleted_count == 0:
+            return None
+        await healthStatsCrud.apply_deleted_record(db, record)
+        return HealthRecordDB(**record)
     return None
\ No newline at end of file
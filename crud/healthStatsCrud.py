@@ -0,0 +1,278 @@
+# DB와 직접 상호작용하는 건강 통계 CRUD 함수들
+# 건강 기록을 저장/삭제할 때마다 사용자별 통계를 증분 갱신해서,
+# 통계 조회가 전체 기록 수와 관계없이 문서 몇 개만 읽도록 한다
+#
+# - health_stats:       사용자별 전체 기간 통계 (_id = user_id)
+# - health_daily_stats: 사용자별 일별 통계 (_id = "user_id:YYYY-MM-DD") - 7/30/90일 등 기간 통계는 일별 문서를 합산
+#
+# 통계 형식: {"count": 측정 수, "metrics": {항목: {"n": 값이 있는 측정 수, "sum", "min", "max"}}}
+# 합계/개수는 $inc, 최소/최대는 $min/$max로 원자적으로 갱신한다
+# 삭제 시 최소/최대는 되돌릴 수 없으므로 해당 날짜(필요하면 전체 기간)를 원본 기록에서 다시 계산한다
+# 동시 저장/삭제 등으로 어긋난 통계는 rebuild_health_stats로 원본에서 다시 만든다
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from core.config import settings
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 통계를 유지하는 측정 항목
+STATS_METRICS = ("systolic_bp", "diastolic_bp", "glucose_level", "weight_kg", "stroke_risk_score")
+
+def day_key(value: datetime) -> str:
+    """일별 통계 키 (저장된 측정 시각 기준 날짜)"""
+    return value.date().isoformat()
+
+def _daily_id(user_id: str, day: str) -> str:
+    return f"{user_id}:{day}"
+
+class _Accumulator:
+    """기록 여러 건을 합쳐 한 번의 $inc/$min/$max 갱신으로 만드는 누적기"""
+
+    def __init__(self):
+        self.count = 0
+        self.metrics: Dict[str, Dict[str, float]] = {}
+        self.first_at: Optional[datetime] = None
+        self.last_at: Optional[datetime] = None
+
+    def add(self, record: dict) -> None:
+        self.count += 1
+        created_at = record["created_at"]
+        self.first_at = created_at if self.first_at is None else min(self.first_at, created_at)
+        self.last_at = created_at if self.last_at is None else max(self.last_at, created_at)
+
+        for metric in STATS_METRICS:
+            value = record.get(metric)
+            if value is None:
+                continue
+            stats = self.metrics.get(metric)
+            if stats is None:
+                self.metrics[metric] = {"n": 1, "sum": value, "min": value, "max": value}
+            else:
+                stats["n"] += 1
+                stats["sum"] += value
+                stats["min"] = min(stats["min"], value)
+                stats["max"] = max(stats["max"], value)
+
+    def to_update(self, now: datetime) -> dict:
+        inc = {"count": self.count}
+        min_values = {}
+        max_values = {}
+        for metric, stats in self.metrics.items():
+            inc[f"metrics.{metric}.n"] = stats["n"]
+            inc[f"metrics.{metric}.sum"] = stats["sum"]
+            min_values[f"metrics.{metric}.min"] = stats["min"]
+            max_values[f"metrics.{metric}.max"] = stats["max"]
+        min_values["first_at"] = self.first_at
+        max_values["last_at"] = self.last_at
+        return {"$inc": inc, "$min": min_values, "$max": max_values, "$set": {"updated_at": now}}
+
+# 저장된 기록을 통계에 반영
+async def apply_created_records(db: AsyncIOMotorDatabase, records: Iterable[dict]) -> None:
+    """
+    새로 저장된 기록(원본 문서 dict)을 전체 기간/일별 통계에 더함
+    같은 사용자·같은 날짜의 기록은 먼저 합쳐서 문서마다 갱신 1번으로 처리
+    """
+    lifetime: Dict[str, _Accumulator] = {}
+    daily: Dict[Tuple[str, str], _Accumulator] = {}
+    for record in records:
+        user_id = record["user_id"]
+        lifetime.setdefault(user_id, _Accumulator()).add(record)
+        daily.setdefault((user_id, day_key(record["created_at"])), _Accumulator()).add(record)
+
+    if not lifetime:
+        return
+
+    now = datetime.now()
+    daily_updates = []
+    for (user_id, day), acc in daily.items():
+        update = acc.to_update(now)
+        update["$setOnInsert"] = {"user_id": user_id, "day": day}
+        daily_updates.append(UpdateOne({"_id": _daily_id(user_id, day)}, update, upsert=True))
+
+    await db.health_daily_stats.bulk_write(daily_updates, ordered=False)
+    await db.health_stats.bulk_write(
+        [UpdateOne({"_id": user_id}, acc.to_update(now), upsert=True) for user_id, acc in lifetime.items()],
+        ordered=False
+    )
+
+def _stats_group_stage(group_id) -> dict:
+    """원본 기록에서 통계를 계산하는 $group 단계"""
+    stage = {
+        "_id": group_id,
+        "count": {"$sum": 1},
+        "first_at": {"$min": "$created_at"},
+        "last_at": {"$max": "$created_at"},
+    }
+    for metric in STATS_METRICS:
+        stage[f"{metric}__n"] = {"$sum": {"$cond": [{"$gt": [f"${metric}", None]}, 1, 0]}}
+        stage[f"{metric}__sum"] = {"$sum": f"${metric}"}
+        stage[f"{metric}__min"] = {"$min": f"${metric}"}
+        stage[f"{metric}__max"] = {"$max": f"${metric}"}
+    return {"$group": stage}
+
+def _metrics_from_group(row: dict) -> Dict[str, dict]:
+    return {
+        metric: {
+            "n": row[f"{metric}__n"],
+            "sum": row[f"{metric}__sum"],
+            "min": row[f"{metric}__min"],
+            "max": row[f"{metric}__max"],
+        }
+        for metric in STATS_METRICS
+        if row[f"{metric}__n"]
+    }
+
+async def _recompute(db: AsyncIOMotorDatabase, query: dict) -> Optional[dict]:
+    """조건에 맞는 원본 기록 전체의 통계 (기록이 없으면 None)"""
+    rows = await db[settings.health_records_collection].aggregate([{"$match": query}, _stats_group_stage(None)]).to_list(length=1)
+    return rows[0] if rows else None
+
+def _extremes_update(row: dict) -> dict:
+    """다시 계산한 최소/최대/첫·마지막 측정 시각으로 덮어쓰는 $set"""
+    values = {"first_at": row["first_at"], "last_at": row["last_at"]}
+    for metric, stats in _metrics_from_group(row).items():
+        values[f"metrics.{metric}.min"] = stats["min"]
+        values[f"metrics.{metric}.max"] = stats["max"]
+    return values
+
+def _touches_extremes(stats: Optional[dict], record: dict) -> bool:
+    """삭제한 기록 값이 현재 최소/최대(또는 첫·마지막 측정 시각)와 같은지"""
+    if not stats:
+        return False
+    if record["created_at"] in (stats.get("first_at"), stats.get("last_at")):
+        return True
+    for metric in STATS_METRICS:
+        value = record.get(metric)
+        current = stats.get("metrics", {}).get(metric)
+        if value is not None and current and value in (current.get("min"), current.get("max")):
+            return True
+    return False
+
+async def _subtract(db: AsyncIOMotorDatabase, collection, doc_id: str, record: dict, query: dict) -> None:
+    """통계 문서 하나에서 기록 1건을 빼고, 필요하면 최소/최대를 원본에서 다시 계산"""
+    inc = {"count": -1}
+    for metric in STATS_METRICS:
+        value = record.get(metric)
+        if value is not None:
+            inc[f"metrics.{metric}.n"] = -1
+            inc[f"metrics.{metric}.sum"] = -value
+
+    stats = await collection.find_one_and_update(
+        {"_id": doc_id},
+        {"$inc": inc, "$set": {"updated_at": datetime.now()}}
+    )
+    if not stats:
+        return
+
+    if stats["count"] <= 1:
+        await collection.delete_one({"_id": doc_id, "count": {"$lte": 0}})
+        return
+
+    if _touches_extremes(stats, record):
+        row = await _recompute(db, query)
+        if row:
+            metrics = _metrics_from_group(row)
+            unset = {f"metrics.{metric}": "" for metric in STATS_METRICS if metric not in metrics}
+            update = {"$set": _extremes_update(row)}
+            if unset:
+                update["$unset"] = unset
+            await collection.update_one({"_id": doc_id}, update)
+
+# 삭제된 기록을 통계에서 제외
+async def apply_deleted_record(db: AsyncIOMotorDatabase, record: dict) -> None:
+    """삭제된 기록(원본 문서 dict)을 전체 기간/일별 통계에서 뺌"""
+    user_id = record["user_id"]
+    day = day_key(record["created_at"])
+    day_start = datetime.fromisoformat(day)
+
+    await _subtract(
+        db, db.health_daily_stats, _daily_id(user_id, day), record,
+        {"user_id": user_id, "created_at": {"$gte": day_start, "$lt": day_start + timedelta(days=1)}}
+    )
+    await _subtract(db, db.health_stats, user_id, record, {"user_id": user_id})
+
+# 통계 조회
+async def get_health_stats(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    since: date
+) -> Tuple[Optional[dict], List[dict]]:
+    """
+    전체 기간 통계 + since 이후 일별 통계 (날짜 오름차순)
+    읽는 문서 수는 기록 수가 아니라 기간(일 수)에만 비례한다
+    """
+    lifetime = await db.health_stats.find_one({"_id": user_id})
+    cursor = db.health_daily_stats.find({"user_id": user_id, "day": {"$gte": since.isoformat()}}).sort("day", 1)
+    daily = await cursor.to_list(length=None)
+    return lifetime, daily
+
+# 통계 다시 만들기
+async def rebuild_health_stats(db: AsyncIOMotorDatabase, user_id: str) -> Tuple[int, int]:
+    """
+    사용자의 원본 기록 전체로 전체 기간/일별 통계를 다시 만듦 (어긋난 통계 보정)
+
+    Returns:
+        (다시 만들기 전 측정 수, 다시 만든 후 측정 수)
+    """
+    previous = await db.health_stats.find_one({"_id": user_id})
+    before = previous["count"] if previous else 0
+
+    pipeline = [
+        {"$match": {"user_id": user_id}},
+        _stats_group_stage({"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}}),
+        {"$sort": {"_id": 1}},
+    ]
+    rows = await db[settings.health_records_collection].aggregate(pipeline).to_list(length=None)
+
+    now = datetime.now()
+    daily_docs = [
+        {
+            "_id": _daily_id(user_id, row["_id"]),
+            "user_id": user_id,
+            "day": row["_id"],
+            "count": row["count"],
+            "first_at": row["first_at"],
+            "last_at": row["last_at"],
+            "metrics": _metrics_from_group(row),
+            "updated_at": now,
+        }
+        for row in rows
+    ]
+
+    await db.health_daily_stats.delete_many({"user_id": user_id})
+    if not daily_docs:
+        await db.health_stats.delete_one({"_id": user_id})
+        return before, 0
+
+    await db.health_daily_stats.insert_many(daily_docs)
+
+    # 전체 기간 통계는 일별 통계를 합쳐서 계산
+    lifetime = {
+        "_id": user_id,
+        "count": sum(doc["count"] for doc in daily_docs),
+        "first_at": daily_docs[0]["first_at"],
+        "last_at": daily_docs[-1]["last_at"],
+        "metrics": {},
+        "updated_at": now,
+    }
+    for doc in daily_docs:
+        for metric, stats in doc["metrics"].items():
+            total = lifetime["metrics"].get(metric)
+            if total is None:
+                lifetime["metrics"][metric] = dict(stats)
+            else:
+                total["n"] += stats["n"]
+                total["sum"] += stats["sum"]
+                total["min"] = min(total["min"], stats["min"])
+                total["max"] = max(total["max"], stats["max"])
+
+    await db.health_stats.replace_one({"_id": user_id}, lifetime, upsert=True)
+    return before, lifetime["count"]
+
+# 통계 대상 사용자 목록
+async def get_stats_user_ids(db: AsyncIOMotorDatabase) -> List[str]:
+    """기록이 있거나 통계 문서가 남아 있는 사용자 ID 전체"""
+    record_users = await db[settings.health_records_collection].distinct("user_id")
+    stats_users = await db.health_stats.distinct("_id")
+    return sorted(set(record_users) | set(stats_users))
@@ -0,0 +1,20 @@
+# DB와 직접 상호작용하는 Import 작업 CRUD 함수들
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from models.importModel import ImportJobDB
+from typing import Optional
+
+# 가져오기 작업 조회
+async def get_import_job(db: AsyncIOMotorDatabase, job_id: str) -> Optional[ImportJobDB]:
+    """작업 ID로 가져오기 작업 조회"""
+    job_data = await db.import_jobs.find_one({"_id": job_id})
+    if job_data:
+        return ImportJobDB(**job_data)
+    return None
+
+# 가져오기 작업 저장 (체크포인트)
+async def save_import_job(db: AsyncIOMotorDatabase, job: ImportJobDB) -> ImportJobDB:
+    """가져오기 작업 상태 저장 (없으면 생성)"""
+    job_dict = job.model_dump(by_alias=True)
+    await db.import_jobs.replace_one({"_id": job.id}, job_dict, upsert=True)
+    return job
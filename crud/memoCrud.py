@@ -2,7 +2,8 @@
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from models.memoModel import MemoDB
-from typing import Optional, List
+from core.pagination import find_page, aggregate_page, DEFAULT_PAGE_LIMIT
+from typing import Optional, List, Tuple
 from datetime import datetime
 
 # 메모 생성
@@ -20,39 +21,65 @@ async def get_memo_by_id(db: AsyncIOMotorDatabase, memo_id: str) -> Optional[Mem
         return MemoDB(**memo_data)
     return None
 
+# 메모 ID로 조회 (projection 적용 원본 문서, 빠른 읽기 경로)
+async def get_memo_row(db: AsyncIOMotorDatabase, memo_id: str, projection: dict) -> Optional[dict]:
+    """ID로 메모를 projection 적용 문서로 조회"""
+    docs = await db.memos.aggregate([{"$match": {"_id": memo_id}}, {"$project": projection}]).to_list(length=1)
+    return docs[0] if docs else None
+
+# 의사/환자 조건으로 메모 조회 (projection 적용 원본 문서, 빠른 읽기 경로)
+async def get_memo_rows(
+    db: AsyncIOMotorDatabase,
+    projection: dict,
+    doctor_id: Optional[str] = None,
+    patient_id: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """지정한 의사/환자 조건의 메모 한 페이지를 MemoDB 없이 projection 적용 문서로 조회 (최신순)"""
+    query = {}
+    if doctor_id:
+        query["doctor_id"] = doctor_id
+    if patient_id:
+        query["patient_id"] = patient_id
+    return await aggregate_page(db.memos, query, "created_at", projection, limit, after)
+
 # 특정 의사가 작성한 메모 조회
-async def get_memos_by_doctor(db: AsyncIOMotorDatabase, doctor_id: str) -> List[MemoDB]:
-    """특정 의사가 작성한 모든 메모 조회"""
-    memos = []
-    cursor = db.memos.find({"doctor_id": doctor_id}).sort("created_at", -1)
-    async for memo_data in cursor:
-        memos.append(MemoDB(**memo_data))
-    return memos
+async def get_memos_by_doctor(
+    db: AsyncIOMotorDatabase,
+    doctor_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MemoDB], Optional[str]]:
+    """특정 의사가 작성한 메모 한 페이지 조회 (최신순) + 다음 페이지 커서"""
+    docs, next_cursor = await find_page(db.memos, {"doctor_id": doctor_id}, "created_at", limit, after)
+    return [MemoDB(**memo_data) for memo_data in docs], next_cursor
 
 # 특정 환자에 대한 메모 조회
-async def get_memos_by_patient(db: AsyncIOMotorDatabase, patient_id: str) -> List[MemoDB]:
-    """특정 환자에 대한 모든 메모 조회"""
-    memos = []
-    cursor = db.memos.find({"patient_id": patient_id}).sort("created_at", -1)
-    async for memo_data in cursor:
-        memos.append(MemoDB(**memo_data))
-    return memos
+async def get_memos_by_patient(
+    db: AsyncIOMotorDatabase,
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MemoDB], Optional[str]]:
+    """특정 환자에 대한 메모 한 페이지 조회 (최신순) + 다음 페이지 커서"""
+    docs, next_cursor = await find_page(db.memos, {"patient_id": patient_id}, "created_at", limit, after)
+    return [MemoDB(**memo_data) for memo_data in docs], next_cursor
 
 # 특정 의사가 특정 환자에 대해 작성한 메모 조회
 async def get_memos_by_doctor_and_patient(
     db: AsyncIOMotorDatabase, 
     doctor_id: str, 
-    patient_id: str
-) -> List[MemoDB]:
-    """특정 의사가 특정 환자에 대해 작성한 메모 조회"""
-    memos = []
-    cursor = db.memos.find({
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MemoDB], Optional[str]]:
+    """특정 의사가 특정 환자에 대해 작성한 메모 한 페이지 조회 (최신순) + 다음 페이지 커서"""
+    docs, next_cursor = await find_page(db.memos, {
         "doctor_id": doctor_id,
         "patient_id": patient_id
-    }).sort("created_at", -1)
-    async for memo_data in cursor:
-        memos.append(MemoDB(**memo_data))
-    return memos
+    }, "created_at", limit, after)
+    return [MemoDB(**memo_data) for memo_data in docs], next_cursor
 
 # 메모 삭제
 async def delete_memo(db: AsyncIOMotorDatabase, memo_id: str) -> bool:
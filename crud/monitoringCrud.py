@@ -3,8 +3,10 @@
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from models.monitoringModel import MonitoringRequestDB, MonitoringRelationDB
 from schemas.monitoringSchema import MonitoringStatus
-from typing import Optional, List
+from core.pagination import find_page, DEFAULT_PAGE_LIMIT
+from typing import Optional, List, Tuple
 from bson import ObjectId
+from pymongo import ReturnDocument
 from datetime import datetime
 
 # ==================== MonitoringRequest ====================
@@ -28,17 +30,18 @@ async def get_request_by_id(db: AsyncIOMotorDatabase, request_id: str) -> Option
     return None
 
 # 환자가 받은 대기 중인 요청 조회
-async def get_pending_requests_for_patient(db: AsyncIOMotorDatabase, patient_id: str) -> List[MonitoringRequestDB]:
-    """특정 환자가 받은 대기 중인 모니터링 요청 목록"""
-    requests = []
-    cursor = db.monitoring_requests.find({
+async def get_pending_requests_for_patient(
+    db: AsyncIOMotorDatabase,
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MonitoringRequestDB], Optional[str]]:
+    """특정 환자가 받은 대기 중인 모니터링 요청 목록 (한 페이지) + 다음 페이지 커서"""
+    docs, next_cursor = await find_page(db.monitoring_requests, {
         "patient_id": patient_id,
         "status": MonitoringStatus.PENDING
-    }).sort("created_at", -1)
-    
-    async for request_data in cursor:
-        requests.append(MonitoringRequestDB(**request_data))
-    return requests
+    }, "created_at", limit, after)
+    return [MonitoringRequestDB(**request_data) for request_data in docs], next_cursor
 
 # 요청 상태 업데이트
 async def update_request_status(
@@ -59,16 +62,17 @@ async def update_request_status(
     return result.modified_count > 0
 
 # 요청자가 보낸 요청 조회
-async def get_requests_by_requester(db: AsyncIOMotorDatabase, requester_id: str) -> List[MonitoringRequestDB]:
-    """특정 사용자가 보낸 모든 모니터링 요청"""
-    requests = []
-    cursor = db.monitoring_requests.find({
+async def get_requests_by_requester(
+    db: AsyncIOMotorDatabase,
+    requester_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MonitoringRequestDB], Optional[str]]:
+    """특정 사용자가 보낸 모니터링 요청 (한 페이지) + 다음 페이지 커서"""
+    docs, next_cursor = await find_page(db.monitoring_requests, {
         "requester_id": requester_id
-    }).sort("created_at", -1)
-    
-    async for request_data in cursor:
-        requests.append(MonitoringRequestDB(**request_data))
-    return requests
+    }, "created_at", limit, after)
+    return [MonitoringRequestDB(**request_data) for request_data in docs], next_cursor
 
 # 요청 삭제
 async def delete_request_by_id(db: AsyncIOMotorDatabase, request_id: str) -> bool:
@@ -99,25 +103,36 @@ async def create_monitoring_relation(db: AsyncIOMotorDatabase, relation: Monitor
     return relation
 
 # 환자의 모니터링 관계 조회
-async def get_relations_by_patient(db: AsyncIOMotorDatabase, patient_id: str) -> List[MonitoringRelationDB]:
-    """특정 환자의 승인된 모니터링 관계 목록"""
-    relations = []
-    cursor = db.monitoring_relations.find({
+async def get_relations_by_patient(
+    db: AsyncIOMotorDatabase,
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MonitoringRelationDB], Optional[str]]:
+    """특정 환자의 승인된 모니터링 관계 목록 (한 페이지) + 다음 페이지 커서"""
+    docs, next_cursor = await find_page(db.monitoring_relations, {
         "patient_id": patient_id
-    }).sort("granted_at", -1)
-    
-    async for relation_data in cursor:
-        relations.append(MonitoringRelationDB(**relation_data))
-    return relations
+    }, "granted_at", limit, after)
+    return [MonitoringRelationDB(**relation_data) for relation_data in docs], next_cursor
 
 # 모니터링하는 사용자의 환자 목록
-async def get_patients_by_monitor(db: AsyncIOMotorDatabase, monitor_id: str) -> List[MonitoringRelationDB]:
-    """특정 의사/보호자가 모니터링하는 환자 목록"""
-    relations = []
-    cursor = db.monitoring_relations.find({
+async def get_patients_by_monitor(
+    db: AsyncIOMotorDatabase,
+    monitor_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MonitoringRelationDB], Optional[str]]:
+    """특정 의사/보호자가 모니터링하는 환자 목록 (한 페이지) + 다음 페이지 커서"""
+    docs, next_cursor = await find_page(db.monitoring_relations, {
         "monitor_id": monitor_id
-    }).sort("granted_at", -1)
-    
+    }, "granted_at", limit, after)
+    return [MonitoringRelationDB(**relation_data) for relation_data in docs], next_cursor
+
+# 모니터링하는 사용자의 전체 환자 관계 (대시보드용)
+async def get_all_relations_by_monitor(db: AsyncIOMotorDatabase, monitor_id: str) -> List[MonitoringRelationDB]:
+    """특정 의사/보호자의 모든 모니터링 관계 (최근 승인순)"""
+    relations = []
+    cursor = db.monitoring_relations.find({"monitor_id": monitor_id}).sort([("granted_at", -1), ("_id", -1)])
     async for relation_data in cursor:
         relations.append(MonitoringRelationDB(**relation_data))
     return relations
@@ -125,11 +140,63 @@ async def get_patients_by_monitor(db: AsyncIOMotorDatabase, monitor_id: str) ->
 # 특정 관계 존재 확인
 async def relation_exists(db: AsyncIOMotorDatabase, patient_id: str, monitor_id: str) -> bool:
     """환자-모니터 간 관계가 이미 존재하는지 확인"""
-    relation = await db.monitoring_relations.find_one({
+    relation = await db.monitoring_relations.find_one(
+        {"patient_id": patient_id, "monitor_id": monitor_id},
+        {"_id": 1}  # patient_id_monitor_id 인덱스로 확인
+    )
+    return relation is not None
+
+# 전체 관계 (환자, 모니터) 쌍 조회
+async def get_all_relation_pairs(db: AsyncIOMotorDatabase) -> List[Tuple[str, str]]:
+    """모든 모니터링 관계의 (patient_id, monitor_id) 목록 (관계 그래프 적재용)"""
+    pairs = []
+    cursor = db.monitoring_relations.find({}, {"_id": 0, "patient_id": 1, "monitor_id": 1})
+    async for relation_data in cursor:
+        pairs.append((relation_data["patient_id"], relation_data["monitor_id"]))
+    return pairs
+
+# ==================== MonitoringRelation 변경 기록 ====================
+# 관계 그래프(relationGraphService)를 워커끼리 맞추기 위한 변경 순번 + 변경 내역
+# 순번은 counters 컬렉션의 문서 하나에서 $inc로 발급하고, 변경 내역의 _id로 쓴다
+
+RELATION_CHANGE_COUNTER = "monitoring_relation_changes"
+
+# 관계 추가/해제 기록
+async def record_relation_change(db: AsyncIOMotorDatabase, patient_id: str, monitor_id: str, added: bool) -> int:
+    """관계 변경을 다음 순번으로 기록하고 순번 반환"""
+    counter = await db.counters.find_one_and_update(
+        {"_id": RELATION_CHANGE_COUNTER},
+        {"$inc": {"seq": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    seq = counter["seq"]
+    await db.monitoring_relation_changes.insert_one({
+        "_id": seq,
         "patient_id": patient_id,
-        "monitor_id": monitor_id
+        "monitor_id": monitor_id,
+        "added": added,
+        "changed_at": datetime.now()
     })
-    return relation is not None
+    return seq
+
+# 마지막으로 발급된 변경 순번
+async def get_relation_change_seq(db: AsyncIOMotorDatabase) -> int:
+    """지금까지 발급된 마지막 변경 순번 (없으면 0)"""
+    counter = await db.counters.find_one({"_id": RELATION_CHANGE_COUNTER})
+    return counter["seq"] if counter else 0
+
+# 순번 이후의 변경 내역
+async def get_relation_changes(db: AsyncIOMotorDatabase, after_seq: int, limit: int = 1000) -> List[dict]:
+    """after_seq보다 큰 순번의 변경 내역 (순번 순서, 최대 limit건)"""
+    cursor = db.monitoring_relation_changes.find({"_id": {"$gt": after_seq}}).sort("_id", 1).limit(limit)
+    return await cursor.to_list(length=limit)
+
+# 오래된 변경 내역 삭제
+async def delete_relation_changes_before(db: AsyncIOMotorDatabase, before: datetime) -> int:
+    """before 이전에 기록된 변경 내역 삭제, 삭제한 수 반환"""
+    result = await db.monitoring_relation_changes.delete_many({"changed_at": {"$lt": before}})
+    return result.deleted_count
 
 # 모니터링 관계 삭제
 async def delete_monitoring_relation(db: AsyncIOMotorDatabase, relation_id: str) -> bool:
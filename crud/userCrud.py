@@ -1,10 +1,29 @@
 # DB와 직접 상호작용하는 User CRUD 함수들
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from models.userModel import UserDB
-from typing import Optional
+from models.userModel import UserDB, UserRiskFieldsDB, UserSummaryDB
+from core.cache import TTLCache
+from core.config import settings
+from typing import Optional, Dict, Iterable
 from datetime import datetime
 
+# 사용자 조회 캐시 (user_id -> UserDB)
+# 사용자 문서는 자주 바뀌지 않으므로 get_user_by_id 결과를 보관하고, 수정/삭제 시 무효화한다
+# 여러 워커 프로세스로 실행하면 다른 워커의 수정은 TTL이 지나야 반영된다 (로그인은 캐시를 쓰지 않음)
+_user_cache: Optional[TTLCache] = (
+    TTLCache(settings.user_cache_max_size, settings.user_cache_ttl_seconds)
+    if settings.user_cache_enabled else None
+)
+
+def invalidate_user_cache(user_id: str) -> None:
+    """사용자 조회 캐시에서 제거"""
+    if _user_cache is not None:
+        _user_cache.invalidate(user_id)
+
+def get_user_cache_stats() -> Optional[Dict[str, int]]:
+    """사용자 조회 캐시 카운터 (캐시 비활성화 시 None)"""
+    return _user_cache.stats() if _user_cache is not None else None
+
 # 사용자 생성
 async def create_user(db: AsyncIOMotorDatabase, user: UserDB) -> UserDB:
     """새로운 사용자를 DB에 저장"""
@@ -17,16 +36,68 @@ async def create_user(db: AsyncIOMotorDatabase, user: UserDB) -> UserDB:
             user_dict["birth_date"] = datetime.combine(birth_date, datetime.min.time())
     
     await db.users.insert_one(user_dict)
+    invalidate_user_cache(user.id)
     return user
 
 # 사용자 ID로 조회
-async def get_user_by_id(db: AsyncIOMotorDatabase, user_id: str) -> Optional[UserDB]:
-    """ID로 사용자 조회"""
+async def get_user_by_id(db: AsyncIOMotorDatabase, user_id: str, use_cache: bool = True) -> Optional[UserDB]:
+    """ID로 사용자 조회 (캐시 우선, use_cache=False면 항상 DB에서 조회)"""
+    if use_cache and _user_cache is not None:
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            # 호출자가 수정해도 캐시된 객체가 바뀌지 않도록 복사본 반환
+            return cached.model_copy(deep=True)
+
+    # 조회 중에 수정/삭제로 무효화되면 조회한 문서를 캐시에 넣지 않음
+    token = _user_cache.token(user_id) if _user_cache is not None else None
     user_data = await db.users.find_one({"_id": user_id})
     if user_data:
-        return UserDB(**user_data)
+        user = UserDB(**user_data)
+        if _user_cache is not None:
+            _user_cache.set(user_id, user.model_copy(deep=True), token)
+        return user
     return None
 
+# 위험도 프로필 계산용 필드 projection
+RISK_FIELDS_PROJECTION = {name: 1 for name in UserRiskFieldsDB.model_fields if name != "id"}
+
+# 위험도 프로필 계산용 필드 조회
+async def get_risk_fields_by_id(db: AsyncIOMotorDatabase, user_id: str) -> Optional[UserRiskFieldsDB]:
+    """ID로 위험도 계산에 필요한 필드만 조회 (캐시를 거치지 않음)"""
+    user_data = await db.users.find_one({"_id": user_id}, RISK_FIELDS_PROJECTION)
+    return UserRiskFieldsDB(**user_data) if user_data else None
+
+# 여러 사용자의 위험도 프로필 계산용 필드 조회
+async def get_risk_fields_by_ids(db: AsyncIOMotorDatabase, user_ids: Iterable[str]) -> Dict[str, UserRiskFieldsDB]:
+    """ID 목록으로 위험도 계산에 필요한 필드만 조회 ($in 한 번)"""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+    
+    users = {}
+    async for user_data in db.users.find({"_id": {"$in": user_ids}}, RISK_FIELDS_PROJECTION):
+        users[user_data["_id"]] = UserRiskFieldsDB(**user_data)
+    return users
+
+# 여러 사용자 이름/역할 한 번에 조회
+async def get_user_summaries_by_ids(db: AsyncIOMotorDatabase, user_ids: Iterable[str]) -> Dict[str, UserSummaryDB]:
+    """ID 목록으로 사용자 이름/역할 조회 ($in 한 번, 필요한 필드만 projection)"""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+    
+    users = {}
+    cursor = db.users.find({"_id": {"$in": user_ids}}, {"name": 1, "role": 1})
+    async for user_data in cursor:
+        users[user_data["_id"]] = UserSummaryDB(**user_data)
+    return users
+
+# 사용자 이름/역할 조회
+async def get_user_summary_by_id(db: AsyncIOMotorDatabase, user_id: str) -> Optional[UserSummaryDB]:
+    """ID로 사용자 이름/역할 조회 (필요한 필드만 projection)"""
+    user_data = await db.users.find_one({"_id": user_id}, {"name": 1, "role": 1})
+    return UserSummaryDB(**user_data) if user_data else None
+
 # 모든 사용자 조회
 async def get_all_users(db: AsyncIOMotorDatabase) -> list[UserDB]:
     """모든 사용자 조회"""
@@ -49,10 +120,22 @@ async def update_user(db: AsyncIOMotorDatabase, user_id: str, update_data: dict)
         {"_id": user_id},
         {"$set": update_data}
     )
+    invalidate_user_cache(user_id)
+    return result.modified_count > 0
+
+# 비밀번호 교체 (로그인 시 다시 해시)
+async def replace_password(db: AsyncIOMotorDatabase, user_id: str, current: str, new: str) -> bool:
+    """저장된 비밀번호가 current 그대로일 때만 new로 교체 (그 사이 비밀번호가 바뀌었으면 교체하지 않음)"""
+    result = await db.users.update_one(
+        {"_id": user_id, "password": current},
+        {"$set": {"password": new}}
+    )
+    invalidate_user_cache(user_id)
     return result.modified_count > 0
 
 # 사용자 삭제
 async def delete_user(db: AsyncIOMotorDatabase, user_id: str) -> bool:
     """사용자 삭제"""
     result = await db.users.delete_one({"_id": user_id})
+    invalidate_user_cache(user_id)
     return result.deleted_count > 0
@@ -2,39 +2,100 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from fastapi import Request
 
 from motor.motor_asyncio import AsyncIOMotorClient
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+import asyncio
 import os
 from dotenv import load_dotenv
 
-from controller import healthController, memoController, monitoringController, userController
+from controller import healthController, memoController, monitoringController, userController, adminController
+from core.pagination import NEXT_CURSOR_HEADER
+from core.indexRegistry import ensure_indexes
+from crud.userCrud import get_user_cache_stats
+from core.config import settings
+from core.passwordHasher import password_hasher
+from core.jsonResponse import json_response_class, JSON_RESPONSE_PYDANTIC
+from core.bodyLimit import BodySizeLimitMiddleware
+from core.metrics import MetricsMiddleware, render_metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from core.mongoInstrumentation import MongoCommandListener, MongoPoolListener, configure_slow_query_log, instrument_crud_modules
+from crud import healthCrud, healthStatsCrud, importCrud, memoCrud, monitoringCrud, userCrud
+from services.riskProfileService import get_risk_profile_cache_stats
+from services.relationGraphService import relation_graph, load_relation_graph, run_reconcile_loop
 
 # MongoDB 설정 (로컬 DB 기준)
 load_dotenv()
 MONGO_URL = os.getenv("MONGO_URL")
-client = AsyncIOMotorClient(MONGO_URL)
-db = client.stroke_db  # 'stroke_db'라는 데이터베이스 사용
+
+# MongoDB 명령/연결 풀 계측 (소요 시간, 실행한 crud 함수/요청 라우트, 느린 쿼리 로그, 연결 대기)
+event_listeners = []
+if settings.metrics_enabled:
+    instrument_crud_modules([healthCrud, healthStatsCrud, importCrud, memoCrud, monitoringCrud, userCrud])
+    configure_slow_query_log(settings.mongo_slow_query_log_file)
+    event_listeners.append(MongoCommandListener(settings.mongo_slow_query_ms))
+    event_listeners.append(MongoPoolListener())
+
+def create_mongo_client() -> AsyncIOMotorClient:
+    """MONGO_URL + 연결 풀/타임아웃/압축/읽기 설정(MONGO_*)으로 MongoDB 클라이언트 생성"""
+    return AsyncIOMotorClient(MONGO_URL, event_listeners=event_listeners, **settings.mongo_client_options())
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시 실행
+    # 클라이언트는 워커 프로세스가 시작될 때 만든다 (다중 워커 실행 시 fork 전에 만든 연결 풀을 물려받지 않음)
+    client = create_mongo_client()
+    db = client[settings.mongo_db_name]  # 기본값: 'stroke_db' 데이터베이스 사용
     app.mongodb_client = client
     app.mongodb = db
-    print("✅ MongoDB Connected!")
+    print(f"✅ MongoDB Connected! (maxPoolSize={settings.mongo_max_pool_size}, readPreference={settings.mongo_read_preference})")
+    
+    # 인덱스 확인 및 누락된 인덱스 생성
+    index_plans = await ensure_indexes(db)
+    created = sum(len(plan.to_create) for plan in index_plans)
+    print(f"✅ MongoDB 인덱스 확인 완료 (생성: {created}개)")
+    for plan in index_plans:
+        for conflict in plan.conflicts:
+            print(f"⚠️ 인덱스 불일치 [{plan.collection}] {conflict}")
+        for name in plan.unmanaged:
+            print(f"⚠️ 레지스트리에 없는 인덱스 [{plan.collection}] {name}")
+    
+    # 모니터링 관계 그래프 적재 + 주기적 재조정
+    await load_relation_graph(db)
+    print(f"✅ 모니터링 관계 그래프 적재 완료 ({relation_graph.size()}건)")
+    reconcile_task = asyncio.create_task(
+        run_reconcile_loop(db, settings.relation_graph_reconcile_seconds)
+    )
     yield
     # 종료 시 실행
+    reconcile_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await reconcile_task
+    password_hasher.shutdown()
     app.mongodb_client.close()
     print("❌ MongoDB Disconnected")
 
-app = FastAPI(lifespan=lifespan)
+# 앱 전체 JSON 응답 클래스 (JSON_RESPONSE, 응답 본문은 어느 쪽이든 같음)
+try:
+    default_response_class = json_response_class(settings.json_response)
+except ValueError as e:
+    print(f"⚠️ {e} 기본 JSON 응답을 사용합니다.")
+    default_response_class = json_response_class(JSON_RESPONSE_PYDANTIC)
+
+app = FastAPI(lifespan=lifespan, default_response_class=default_response_class)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Jinja2 Templates 설정
 templates = Jinja2Templates(directory="templates")
 
+# 요청 본문 크기 제한 (본문을 파싱하기 전에 확인)
+# 나중에 추가한 미들웨어가 바깥쪽이므로 CORS보다 먼저 추가해서 413 응답에도 CORS 헤더가 붙게 한다
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    limits={"/health/records/batch": settings.health_batch_max_bytes}
+)
+
 # CORS 설정 (프론트엔드 연결을 위해 필수)
 app.add_middleware(
     CORSMiddleware,
@@ -42,19 +103,49 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],  # 목록 조회 다음 페이지 커서
 )
 
 # 컨트롤러 등록 (라우터 연결)
-app.include_router(userController.router, prefix="/users", tags=["Users"])
-app.include_router(healthController.router, prefix="/health", tags=["Health"])
-app.include_router(monitoringController.router, prefix="/monitoring", tags=["Monitoring"])
-app.include_router(memoController.router, prefix="/memos", tags=["Memos"])
+CONTROLLERS = [
+    ("/users", userController.router, ["Users"]),
+    ("/health", healthController.router, ["Health"]),
+    ("/monitoring", monitoringController.router, ["Monitoring"]),
+    ("/memos", memoController.router, ["Memos"]),
+    ("/admin", adminController.router, ["Admin"]),
+]
+for prefix, router, tags in CONTROLLERS:
+    app.include_router(router, prefix=prefix, tags=tags)
+
+# 라우트별 요청 수/상태 코드/처리 중 요청 수/지연 시간/MongoDB 명령 수 수집 (GET /metrics)
+if settings.metrics_enabled:
+    app.add_middleware(
+        MetricsMiddleware,
+        router=app.router,
+        included={prefix: router for prefix, router, _ in CONTROLLERS}
+    )
 
 # 루트 엔드포인트
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
     return templates.TemplateResponse("login.html", {"request": request})
 
+# 프로세스 내 캐시 상태 (hit/miss/eviction 카운터, 워커 프로세스별 값)
+@app.get("/system/cache-stats", tags=["System"])
+async def cache_stats():
+    return {
+        "user": get_user_cache_stats(),
+        "risk_profile": get_risk_profile_cache_stats(),
+        "relation_graph": {"size": relation_graph.size()}
+    }
+
+# 요청/DB 지표 (Prometheus 텍스트 형식, 워커 프로세스별 값)
+@app.get("/metrics", tags=["System"], include_in_schema=False)
+async def metrics():
+    if not settings.metrics_enabled:
+        return PlainTextResponse("metrics disabled\n", status_code=404)
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
 # HTML 페이지 라우트
 @app.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
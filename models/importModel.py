@@ -0,0 +1,21 @@
+# DB와 상호작용하는 과거 기록 가져오기(import) 작업 모델을 정의
+# 중단된 가져오기를 이어서 진행할 수 있도록 처리한 줄 수(체크포인트)를 저장한다
+
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List
+
+class ImportJobDB(BaseModel):
+    id: str = Field(..., alias="_id")   # 작업 ID (이어서 진행할 때 같은 ID 사용)
+    format: str                         # ndjson | csv
+    status: str = "RUNNING"             # RUNNING | COMPLETED | FAILED
+    lines_done: int = 0                 # 저장까지 끝난 마지막 줄 번호 (체크포인트)
+    inserted: int = 0
+    duplicates: int = 0                 # 이미 가져온 행 (재실행 시)
+    failed: int = 0
+    errors: List[dict] = []             # [{"line": 줄 번호, "error": 메시지}] (최대 100개)
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    
+    class Config:
+        populate_by_name = True  # id와 _id 모두 허용
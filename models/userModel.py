@@ -40,4 +40,28 @@ class UserDB(BaseModel):
     measured_at: datetime = Field(default_factory=datetime.now)
     
     class Config:
-        populate_by_name = True  # id와 _id 모두 허용
\ No newline at end of file
+        populate_by_name = True  # id와 _id 모두 허용
+
+class UserRiskFieldsDB(BaseModel):
+    """위험도 프로필 계산에 필요한 필드만 조회용 (기본값은 UserDB와 같음)"""
+    id: str = Field(..., alias="_id")
+    sex: sexEnum = sexEnum.MALE
+    birth_date: date = Field(default_factory=date.today)
+    height_cm: int = 170
+    stroke_history: bool = False
+    hypertension: bool = False
+    heart_disease: bool = False
+    diabetes: bool = False
+    smoking_history: smokingEnum = smokingEnum.NON_SMOKER
+    
+    class Config:
+        populate_by_name = True  # id와 _id 모두 허용
+
+class UserSummaryDB(BaseModel):
+    """이름/역할만 필요한 조회용 (비밀번호, 건강 프로필 제외)"""
+    id: str = Field(..., alias="_id")
+    name: str
+    role: UserRole
+    
+    class Config:
+        populate_by_name = True  # id와 _id 모두 허용
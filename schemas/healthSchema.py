@@ -2,8 +2,9 @@
 # 시계열 건강 측정 데이터
 
 from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from enum import Enum
+from typing import Optional, List, Dict, Any
 
 class HealthRecordInput(BaseModel):
     """건강 측정 데이터 입력"""
@@ -20,3 +21,78 @@ class HealthRecordResponse(HealthRecordInput):
     created_at: datetime
     stroke_risk_score: Optional[float] = None  # 뇌졸중 위험도 점수
     stroke_risk_level: Optional[str] = None    # 위험도 등급
+
+class HealthRecordBatchItem(HealthRecordInput):
+    """일괄 등록용 건강 측정 데이터 (기기에 쌓인 측정은 측정 시각을 함께 보냄)"""
+    created_at: Optional[datetime] = None  # 측정 시각 (없으면 서버 수신 시각)
+
+class HealthRecordImport(HealthRecordBatchItem):
+    """과거 기록 가져오기 한 행 (측정 시각 필수)"""
+    created_at: datetime
+
+class HealthRecordBatchInput(BaseModel):
+    """건강 측정 데이터 일괄 등록 (여러 사용자 가능)"""
+    # 항목별로 검증해서 잘못된 항목만 실패 처리하므로 dict로 받음 (형식은 HealthRecordBatchItem)
+    records: List[Dict[str, Any]]
+
+class HealthRecordBatchItemResult(BaseModel):
+    """일괄 등록 항목별 결과"""
+    index: int                                  # 요청 records 내 순번
+    success: bool
+    record: Optional[HealthRecordResponse] = None
+    error: Optional[str] = None
+
+class HealthRecordBatchResponse(BaseModel):
+    """건강 측정 데이터 일괄 등록 결과"""
+    total: int
+    succeeded: int
+    failed: int
+    results: List[HealthRecordBatchItemResult]  # 요청 순서와 동일
+
+class ExportFormat(str, Enum):
+    """건강 기록 내보내기 형식"""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+class TrendMetric(str, Enum):
+    """추이 그래프로 조회할 수 있는 측정 항목"""
+    STROKE_RISK_SCORE = "stroke_risk_score"
+    SYSTOLIC_BP = "systolic_bp"
+    DIASTOLIC_BP = "diastolic_bp"
+    GLUCOSE_LEVEL = "glucose_level"
+    WEIGHT_KG = "weight_kg"
+    SMOKING = "smoking"
+
+class TrendPoint(BaseModel):
+    """추이 그래프의 한 점"""
+    created_at: datetime
+    value: float
+
+class HealthTrendResponse(BaseModel):
+    """다운샘플링된 측정 항목 추이"""
+    user_id: str
+    metric: TrendMetric
+    total_count: int            # 기간 내 전체 측정 수 (다운샘플링 전)
+    points: List[TrendPoint]    # 최대 points 개 (오래된 순)
+
+class MetricStats(BaseModel):
+    """측정 항목 하나의 통계"""
+    count: int                  # 값이 있는 측정 수
+    avg: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+class HealthStatsWindow(BaseModel):
+    """기간 통계 (start_date ~ 오늘)"""
+    start_date: date
+    count: int                          # 기간 내 측정 수
+    metrics: Dict[str, MetricStats]     # 측정 항목별 통계 (값이 없는 항목은 제외)
+
+class HealthStatsResponse(BaseModel):
+    """사용자 건강 통계 (측정 기록 저장/삭제 시 증분 갱신)"""
+    user_id: str
+    total_count: int                        # 전체 측정 수
+    first_at: Optional[datetime] = None     # 첫 측정 시각
+    last_at: Optional[datetime] = None      # 마지막 측정 시각
+    lifetime: Dict[str, MetricStats]        # 전체 기간 측정 항목별 통계
+    windows: Dict[str, HealthStatsWindow]   # "7d", "30d", "90d", "month"(이번 달)
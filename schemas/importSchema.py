@@ -0,0 +1,24 @@
+# client와 server 간에 주고받는 import(과거 기록 가져오기) 스키마 정의
+
+from pydantic import BaseModel
+from enum import Enum
+from typing import List
+
+class ImportFormat(str, Enum):
+    NDJSON = "ndjson"   # 한 줄에 JSON 객체 하나
+    CSV = "csv"         # 첫 줄은 헤더 (컬럼 이름은 필드 이름과 동일)
+
+class ImportRowError(BaseModel):
+    line: int           # 파일 내 줄 번호 (1부터)
+    error: str
+
+class ImportReport(BaseModel):
+    """가져오기 작업 결과"""
+    job_id: str                 # 중단된 경우 같은 job_id로 다시 요청하면 이어서 진행
+    format: ImportFormat
+    status: str                 # RUNNING | COMPLETED | FAILED
+    lines_processed: int        # 저장까지 끝난 줄 수 (체크포인트)
+    inserted: int
+    duplicates: int             # 이미 가져온 행 (재실행 시 건너뜀)
+    failed: int
+    errors: List[ImportRowError]  # 실패한 행 (최대 100개)
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 
 class MemoBase(BaseModel):
     doctor_id: str
@@ -13,4 +14,5 @@ class MemoCreate(MemoBase):
 
 class MemoResponse(MemoBase):
     id: str
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+    doctor_name: Optional[str] = None  # 작성자(의사) 이름 (목록 조회는 include_author=true 일 때만 포함)
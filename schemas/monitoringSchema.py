@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from datetime import datetime
 from enum import Enum
 from typing import Optional
+from schemas.healthSchema import HealthRecordResponse
 
 class MonitoringStatus(str, Enum):
     PENDING = "PENDING"      # 대기 중
@@ -40,4 +41,13 @@ class MonitoringRelationResponse(BaseModel):
     monitor_id: str          # 모니터링하는 사용자 ID
     monitor_name: str
     monitor_role: str        # DOCTOR/CAREGIVER
-    granted_at: datetime     # 승인된 시간
\ No newline at end of file
+    granted_at: datetime     # 승인된 시간
+
+class PatientDashboardItem(BaseModel):
+    """모니터 대시보드의 환자 한 명 요약"""
+    relation_id: str                                    # 모니터링 관계 ID (해제용)
+    patient_id: str
+    patient_name: str
+    granted_at: datetime
+    record_count: int                                   # 전체 건강 측정 수
+    latest_record: Optional[HealthRecordResponse] = None  # 가장 최근 측정 (없으면 None)
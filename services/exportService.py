@@ -0,0 +1,105 @@
+# ExportService
+# 환자(또는 환자 여러 명)의 전체 건강 기록을 CSV/NDJSON으로 내보내는 모듈
+# Motor 커서를 한 건씩 읽어 바로 직렬화하므로 기록 수와 관계없이 메모리 사용량이 일정하다
+# (목록 조회처럼 HealthRecordDB/HealthRecordResponse 리스트를 만들지 않음)
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from schemas.healthSchema import ExportFormat
+from crud import healthCrud, monitoringCrud
+from services import relationGraphService
+from typing import AsyncIterator, List, Optional
+
+# 내보내는 컬럼 (CSV 헤더 순서)
+EXPORT_COLUMNS = [
+    "id", "user_id", "created_at",
+    "weight_kg", "systolic_bp", "diastolic_bp", "glucose_level", "smoking",
+    "stroke_risk_score", "stroke_risk_level"
+]
+
+# 응답으로 내보내는 단위 (이 크기만큼 모이면 전송)
+FLUSH_BYTES = 64 * 1024
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+def _row(record: dict) -> dict:
+    row = {column: record.get("_id" if column == "id" else column) for column in EXPORT_COLUMNS}
+    if isinstance(row["created_at"], datetime):
+        row["created_at"] = row["created_at"].isoformat()
+    return row
+
+def media_type(export_format: ExportFormat, compress: bool) -> str:
+    return "application/gzip" if compress else MEDIA_TYPES[export_format]
+
+def export_filename(name: str, export_format: ExportFormat, compress: bool) -> str:
+    return f"{name}.{export_format.value}" + (".gz" if compress else "")
+
+# 모니터링 권한으로 내보낼 환자 목록 확인
+async def resolve_monitor_cohort(
+    db: AsyncIOMotorDatabase,
+    monitor_id: str,
+    patient_ids: Optional[List[str]] = None
+) -> List[str]:
+    """patient_ids가 없으면 모니터링 중인 전체 환자, 있으면 모두 모니터링 중인지 확인"""
+    if not patient_ids:
+        relations = await monitoringCrud.get_all_relations_by_monitor(db, monitor_id)
+        return sorted({rel.patient_id for rel in relations})
+
+    patient_ids = sorted(set(patient_ids))
+    for patient_id in patient_ids:
+        if not await relationGraphService.is_monitoring(db, patient_id, monitor_id):
+            raise ValueError(f"{patient_id} 환자에 대한 모니터링 권한이 없습니다.")
+    return patient_ids
+
+# 건강 기록 내보내기 (StreamingResponse 본문)
+async def export_health_records(
+    db: AsyncIOMotorDatabase,
+    user_ids: List[str],
+    export_format: ExportFormat,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    compress: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    사용자 순서대로, 사용자별로는 오래된 순으로 기록을 직렬화해서 바이트 청크로 반환
+    compress면 gzip으로 압축하면서 내보냄
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31: gzip 헤더
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, lineterminator="\n") if export_format == ExportFormat.CSV else None
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(data) if compressor else data
+
+    if writer:
+        writer.writeheader()
+
+    for user_id in user_ids:
+        async for record in healthCrud.iter_health_records(db, user_id, start, end):
+            row = _row(record)
+            if writer:
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(row, ensure_ascii=False))
+                buffer.write("\n")
+
+            if buffer.tell() >= FLUSH_BYTES:
+                chunk = drain()
+                if chunk:
+                    yield chunk
+
+    chunk = drain()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
@@ -2,42 +2,54 @@
 # health record 관련 비즈니스 로직을 처리하는 모듈
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from schemas.healthSchema import HealthRecordInput, HealthRecordResponse
+from schemas.healthSchema import (
+    HealthRecordInput,
+    HealthRecordResponse,
+    HealthRecordBatchInput,
+    HealthRecordBatchItem,
+    HealthRecordBatchItemResult,
+    HealthRecordBatchResponse,
+    HealthTrendResponse,
+    TrendMetric,
+    TrendPoint
+)
 from models.healthModel import HealthRecordDB
-from crud import healthCrud, userCrud
-from core.riskCalculator import calculate_stroke_risk, get_risk_level, calculate_age
-from typing import Optional, List
+from crud import healthCrud
+from services import riskProfileService, relationGraphService
+from core.riskCalculator import calculate_dynamic_risk, combine_risk_score, get_risk_level
+from core.batchRiskCalculator import calculate_stroke_risk_batch
+from core.config import settings
+from core.pagination import DEFAULT_PAGE_LIMIT
+from core.fastRead import ResponseShape, dumps
+from core.eventBroker import event_broker, HEALTH_RECORD_CREATED, HEALTH_RECORD_DELETED, RISK_LEVEL_CHANGED
+from pydantic import ValidationError
+from typing import Optional, List, Set, Tuple, Dict
 from bson import ObjectId
 from datetime import datetime
 
+# 빠른 읽기 경로 응답 형태 (FAST_READ_PATH)
+HEALTH_RECORD_SHAPE = ResponseShape(HealthRecordResponse)
+
 # 건강 기록 생성
 async def create_health_record(db: AsyncIOMotorDatabase, health_input: HealthRecordInput) -> HealthRecordResponse:
     """새로운 건강 기록 생성 (시계열 측정 데이터) + 위험도 계산"""
     
-    # 사용자 정보 조회 (위험도 계산을 위해 필요)
-    user = await userCrud.get_user_by_id(db, health_input.user_id)
-    if not user:
+    # 사용자 위험도 프로필 조회 (고정 위험 요인 점수는 사용자별로 캐시됨)
+    profile = await riskProfileService.get_risk_profile(db, health_input.user_id)
+    if not profile:
         raise ValueError("사용자를 찾을 수 없습니다.")
     
-    # 나이 계산
-    age = calculate_age(user.birth_date) if user.birth_date else 50
-    
-    # 위험도 계산
-    risk_score = calculate_stroke_risk(
-        age=age,
-        sex=user.sex.value if hasattr(user.sex, 'value') else user.sex,
-        stroke_history=user.stroke_history,
-        hypertension=user.hypertension,
-        heart_disease=user.heart_disease,
-        diabetes=user.diabetes,
-        smoking_history=user.smoking_history.value if hasattr(user.smoking_history, 'value') else user.smoking_history,
+    # 위험도 계산 (측정 데이터에 따라 바뀌는 변동 요인만 계산)
+    dynamic_score = calculate_dynamic_risk(
+        smoking_history=profile.smoking_history,
         systolic_bp=health_input.systolic_bp,
         diastolic_bp=health_input.diastolic_bp,
         weight_kg=health_input.weight_kg,
-        height_cm=user.height_cm,
+        height_cm=profile.height_cm,
         glucose_level=health_input.glucose_level,
         smoking=health_input.smoking
     )
+    risk_score = combine_risk_score(profile.static_score, dynamic_score)
     
     risk_level = get_risk_level(risk_score)
     
@@ -55,11 +67,18 @@ async def create_health_record(db: AsyncIOMotorDatabase, health_input: HealthRec
         created_at=datetime.now()
     )
     
+    # 실시간 이벤트 수신자 (환자 본인 + 모니터)
+    # 위험도 등급 변경 확인용 직전 기록은 이벤트를 받을 연결이 있을 때만 조회
+    recipients = await relationGraphService.event_recipients(db, health_input.user_id)
+    previous = None
+    if event_broker.has_subscribers(recipients):
+        previous = await healthCrud.get_latest_health_record(db, health_input.user_id)
+    
     # DB 저장
     created = await healthCrud.create_health_record(db, health_db)
     
     # 응답 변환
-    return HealthRecordResponse(
+    response = HealthRecordResponse(
         id=created.id,
         user_id=created.user_id,
         weight_kg=created.weight_kg,
@@ -71,11 +90,193 @@ async def create_health_record(db: AsyncIOMotorDatabase, health_input: HealthRec
         stroke_risk_level=created.stroke_risk_level,
         created_at=created.created_at
     )
+    
+    # 실시간 이벤트 발행
+    event_broker.publish(recipients, HEALTH_RECORD_CREATED, response.model_dump())
+    if previous and previous.stroke_risk_level != created.stroke_risk_level:
+        event_broker.publish(recipients, RISK_LEVEL_CHANGED, {
+            "user_id": created.user_id,
+            "record_id": created.id,
+            "previous_level": previous.stroke_risk_level,
+            "stroke_risk_level": created.stroke_risk_level,
+            "stroke_risk_score": created.stroke_risk_score
+        })
+    
+    return response
+
+def _to_response(record: HealthRecordDB) -> HealthRecordResponse:
+    return HealthRecordResponse(
+        id=record.id,
+        user_id=record.user_id,
+        weight_kg=record.weight_kg,
+        systolic_bp=record.systolic_bp,
+        diastolic_bp=record.diastolic_bp,
+        glucose_level=record.glucose_level,
+        smoking=record.smoking,
+        stroke_risk_score=record.stroke_risk_score,
+        stroke_risk_level=record.stroke_risk_level,
+        created_at=record.created_at
+    )
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    field = ".".join(str(loc) for loc in first["loc"])
+    return f"{field}: {first['msg']}" if field else first["msg"]
+
+def _local_naive(value: datetime) -> datetime:
+    """시간대가 있는 시각은 서버 로컬 시각으로 변환 (기존 기록은 datetime.now() 기준)"""
+    return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+
+# 측정 데이터 목록 위험도 일괄 계산
+async def score_health_records(
+    db: AsyncIOMotorDatabase,
+    items: List[HealthRecordBatchItem],
+    record_ids: Optional[List[str]] = None
+) -> List[Optional[HealthRecordDB]]:
+    """
+    사용자 프로필을 한 번에 조회하고 위험도를 일괄 계산해서 저장할 기록 생성 (저장은 하지 않음)
+
+    Args:
+        record_ids: 기록 ID (없으면 새 ObjectId)
+
+    Returns:
+        items와 같은 순서의 기록 목록 (사용자가 없는 항목은 None)
+    """
+    profiles = await riskProfileService.get_risk_profiles(db, {item.user_id for item in items})
+    scorable = [(i, item, profiles[item.user_id]) for i, item in enumerate(items) if item.user_id in profiles]
+    
+    records: List[Optional[HealthRecordDB]] = [None] * len(items)
+    if not scorable:
+        return records
+    
+    # 측정 시각 (과거 기록은 측정 당시 나이로 계산)
+    now = datetime.now()
+    created_at = [_local_naive(item.created_at) if item.created_at else now for _, item, _ in scorable]
+    
+    # calculate_stroke_risk와 결과 동일
+    scores, levels = calculate_stroke_risk_batch(
+        age=[riskProfileService.get_profile_age(profile, at.date()) for (_, _, profile), at in zip(scorable, created_at)],
+        sex=[profile.sex for _, _, profile in scorable],
+        stroke_history=[profile.stroke_history for _, _, profile in scorable],
+        hypertension=[profile.hypertension for _, _, profile in scorable],
+        heart_disease=[profile.heart_disease for _, _, profile in scorable],
+        diabetes=[profile.diabetes for _, _, profile in scorable],
+        smoking_history=[profile.smoking_history for _, _, profile in scorable],
+        systolic_bp=[item.systolic_bp for _, item, _ in scorable],
+        diastolic_bp=[item.diastolic_bp for _, item, _ in scorable],
+        weight_kg=[item.weight_kg for _, item, _ in scorable],
+        height_cm=[profile.height_cm for _, _, profile in scorable],
+        glucose_level=[item.glucose_level for _, item, _ in scorable],
+        smoking=[item.smoking for _, item, _ in scorable]
+    )
+    
+    for n, (i, item, _) in enumerate(scorable):
+        records[i] = HealthRecordDB(
+            id=record_ids[i] if record_ids else str(ObjectId()),
+            user_id=item.user_id,
+            weight_kg=item.weight_kg,
+            systolic_bp=item.systolic_bp,
+            diastolic_bp=item.diastolic_bp,
+            glucose_level=item.glucose_level,
+            smoking=item.smoking,
+            stroke_risk_score=float(scores[n]),
+            stroke_risk_level=str(levels[n]),
+            created_at=created_at[n]
+        )
+    return records
+
+class BatchTooLargeError(ValueError):
+    """일괄 생성 요청의 기록 수가 HEALTH_BATCH_MAX_RECORDS를 넘은 경우"""
+
+# 건강 기록 일괄 생성
+async def create_health_records_batch(db: AsyncIOMotorDatabase, batch: HealthRecordBatchInput) -> HealthRecordBatchResponse:
+    """
+    여러 사용자의 건강 기록을 한 번에 생성
+    - 항목별 검증 → 사용자 프로필 한 번에 조회 → 위험도 일괄 계산 → insert_many 한 번
+    - 잘못된 항목이나 없는 사용자는 해당 항목만 실패 처리
+    """
+    if len(batch.records) > settings.health_batch_max_records:
+        raise BatchTooLargeError(f"한 번에 최대 {settings.health_batch_max_records}건까지 등록할 수 있습니다.")
+    
+    results: Dict[int, HealthRecordBatchItemResult] = {}
+    
+    # 항목별 검증
+    items: List[Tuple[int, HealthRecordBatchItem]] = []
+    for index, raw in enumerate(batch.records):
+        try:
+            items.append((index, HealthRecordBatchItem.model_validate(raw)))
+        except ValidationError as e:
+            results[index] = HealthRecordBatchItemResult(index=index, success=False, error=_validation_message(e))
+    
+    # 사용자 프로필 한 번에 조회 + 위험도 일괄 계산
+    scored = await score_health_records(db, [item for _, item in items])
+    scorable = []
+    records: List[HealthRecordDB] = []
+    for (index, _), record in zip(items, scored):
+        if record:
+            scorable.append(index)
+            records.append(record)
+        else:
+            results[index] = HealthRecordBatchItemResult(index=index, success=False, error="사용자를 찾을 수 없습니다.")
+    
+    # 이벤트 수신자와 등급 변경 비교용 직전 기록 (저장 전에 조회)
+    targets = await _event_targets(db, {record.user_id for record in records})
+    
+    # insert_many 한 번 (ordered=False)
+    errors = await healthCrud.create_health_records(db, records)
+    created = []
+    for i, index in enumerate(scorable):
+        if i in errors:
+            results[index] = HealthRecordBatchItemResult(index=index, success=False, error=errors[i])
+        else:
+            created.append(records[i])
+            results[index] = HealthRecordBatchItemResult(index=index, success=True, record=_to_response(records[i]))
+    
+    _publish_batch_events(created, targets)
+    
+    succeeded = len(created)
+    return HealthRecordBatchResponse(
+        total=len(batch.records),
+        succeeded=succeeded,
+        failed=len(batch.records) - succeeded,
+        results=[results[index] for index in range(len(batch.records))]
+    )
+
+async def _event_targets(db: AsyncIOMotorDatabase, user_ids) -> Dict[str, Tuple[Set[str], Optional[HealthRecordDB]]]:
+    """이벤트를 받을 연결이 있는 사용자만 (수신자, 최신 기록) 조회 (최신 기록은 위험도 등급 변경 비교용)"""
+    targets = {}
+    for user_id in user_ids:
+        recipients = await relationGraphService.event_recipients(db, user_id)
+        if event_broker.has_subscribers(recipients):
+            targets[user_id] = (recipients, await healthCrud.get_latest_health_record(db, user_id))
+    return targets
+
+def _publish_batch_events(created: List[HealthRecordDB], targets: Dict[str, Tuple[Set[str], Optional[HealthRecordDB]]]) -> None:
+    """사용자별로 측정 시각 순서대로 이벤트 발행 (직전 최신 기록보다 새 기록만 등급 변경 비교)"""
+    for user_id, (recipients, last) in targets.items():
+        for record in sorted((r for r in created if r.user_id == user_id), key=lambda r: r.created_at):
+            event_broker.publish(recipients, HEALTH_RECORD_CREATED, _to_response(record).model_dump())
+            if last and record.created_at < last.created_at:
+                continue
+            if last and last.stroke_risk_level != record.stroke_risk_level:
+                event_broker.publish(recipients, RISK_LEVEL_CHANGED, {
+                    "user_id": user_id,
+                    "record_id": record.id,
+                    "previous_level": last.stroke_risk_level,
+                    "stroke_risk_level": record.stroke_risk_level,
+                    "stroke_risk_score": record.stroke_risk_score
+                })
+            last = record
 
 # 사용자의 건강 기록 목록 조회
-async def get_user_health_records(db: AsyncIOMotorDatabase, user_id: str) -> List[HealthRecordResponse]:
-    """특정 사용자의 건강 기록 목록 조회"""
-    health_list = await healthCrud.get_health_records_by_user_id(db, user_id)
+async def get_user_health_records(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[HealthRecordResponse], Optional[str]]:
+    """특정 사용자의 건강 기록 목록 조회 (한 페이지) + 다음 페이지 커서"""
+    health_list, next_cursor = await healthCrud.get_health_records_by_user_id(db, user_id, limit, after)
     
     return [
         HealthRecordResponse(
@@ -91,7 +292,18 @@ async def get_user_health_records(db: AsyncIOMotorDatabase, user_id: str) -> Lis
             created_at=h.created_at
         )
         for h in health_list
-    ]
+    ], next_cursor
+
+# 건강 기록 목록 조회 (빠른 읽기 경로)
+async def get_user_health_records_json(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[bytes, Optional[str]]:
+    """get_user_health_records와 같은 응답을 모델 없이 JSON 바이트로 조회 + 다음 페이지 커서"""
+    docs, next_cursor = await healthCrud.get_health_record_rows(db, user_id, HEALTH_RECORD_SHAPE.projection, limit, after)
+    return dumps(HEALTH_RECORD_SHAPE.rows(docs)), next_cursor
 
 # 최신 건강 기록 조회
 async def get_latest_health_record(db: AsyncIOMotorDatabase, user_id: str) -> Optional[HealthRecordResponse]:
@@ -113,6 +325,14 @@ async def get_latest_health_record(db: AsyncIOMotorDatabase, user_id: str) -> Op
         created_at=latest.created_at
     )
 
+# 최신 건강 기록 조회 (빠른 읽기 경로)
+async def get_latest_health_record_json(db: AsyncIOMotorDatabase, user_id: str) -> Optional[bytes]:
+    """get_latest_health_record와 같은 응답을 모델 없이 JSON 바이트로 조회 (기록이 없으면 None)"""
+    doc = await healthCrud.get_latest_health_record_row(db, user_id, HEALTH_RECORD_SHAPE.projection)
+    if not doc:
+        return None
+    return dumps(HEALTH_RECORD_SHAPE.row(doc))
+
 # 건강 기록 삭제
 async def delete_health_record(db: AsyncIOMotorDatabase, record_id: str) -> Optional[HealthRecordResponse]:
     """건강 기록 삭제"""
@@ -120,6 +340,13 @@ async def delete_health_record(db: AsyncIOMotorDatabase, record_id: str) -> Opti
     if not deleted_record:
         return None
     
+    # 실시간 이벤트 발행 (대시보드의 측정 횟수/최신 기록 갱신용)
+    recipients = await relationGraphService.event_recipients(db, deleted_record.user_id)
+    event_broker.publish(recipients, HEALTH_RECORD_DELETED, {
+        "user_id": deleted_record.user_id,
+        "record_id": deleted_record.id
+    })
+    
     return HealthRecordResponse(
         id=deleted_record.id,
         user_id=deleted_record.user_id,
@@ -137,18 +364,31 @@ async def delete_health_record(db: AsyncIOMotorDatabase, record_id: str) -> Opti
 async def get_monitored_patient_records(
     db: AsyncIOMotorDatabase, 
     monitor_id: str, 
-    patient_id: str
-) -> List[HealthRecordResponse]:
-    """모니터링 권한이 있는 사용자가 환자의 건강 기록 조회"""
-    from crud import monitoringCrud
-    
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[HealthRecordResponse], Optional[str]]:
+    """모니터링 권한이 있는 사용자가 환자의 건강 기록 조회 (한 페이지) + 다음 페이지 커서"""
     # 모니터링 관계 확인
-    relation_exists = await monitoringCrud.relation_exists(db, patient_id, monitor_id)
-    if not relation_exists:
+    if not await relationGraphService.is_monitoring(db, patient_id, monitor_id):
         raise ValueError("해당 환자에 대한 모니터링 권한이 없습니다.")
     
     # 권한이 확인되면 건강 기록 조회
-    return await get_user_health_records(db, patient_id)
+    return await get_user_health_records(db, patient_id, limit, after)
+
+# 모니터링 권한으로 환자 건강 기록 조회 (빠른 읽기 경로)
+async def get_monitored_patient_records_json(
+    db: AsyncIOMotorDatabase,
+    monitor_id: str,
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[bytes, Optional[str]]:
+    """get_monitored_patient_records와 같은 응답을 모델 없이 JSON 바이트로 조회 + 다음 페이지 커서"""
+    if not await relationGraphService.is_monitoring(db, patient_id, monitor_id):
+        raise ValueError("해당 환자에 대한 모니터링 권한이 없습니다.")
+    
+    return await get_user_health_records_json(db, patient_id, limit, after)
 
 # 모니터링 권한으로 환자 최신 건강 기록 조회
 async def get_monitored_patient_latest_record(
@@ -157,12 +397,57 @@ async def get_monitored_patient_latest_record(
     patient_id: str
 ) -> Optional[HealthRecordResponse]:
     """모니터링 권한이 있는 사용자가 환자의 최신 건강 기록 조회"""
-    from crud import monitoringCrud
-    
     # 모니터링 관계 확인
-    relation_exists = await monitoringCrud.relation_exists(db, patient_id, monitor_id)
-    if not relation_exists:
+    if not await relationGraphService.is_monitoring(db, patient_id, monitor_id):
         raise ValueError("해당 환자에 대한 모니터링 권한이 없습니다.")
     
     # 권한이 확인되면 최신 건강 기록 조회
-    return await get_latest_health_record(db, patient_id)
\ No newline at end of file
+    return await get_latest_health_record(db, patient_id)
+
+# 모니터링 권한으로 환자 최신 건강 기록 조회 (빠른 읽기 경로)
+async def get_monitored_patient_latest_record_json(
+    db: AsyncIOMotorDatabase,
+    monitor_id: str,
+    patient_id: str
+) -> Optional[bytes]:
+    """get_monitored_patient_latest_record와 같은 응답을 모델 없이 JSON 바이트로 조회"""
+    if not await relationGraphService.is_monitoring(db, patient_id, monitor_id):
+        raise ValueError("해당 환자에 대한 모니터링 권한이 없습니다.")
+    
+    return await get_latest_health_record_json(db, patient_id)
+
+# 측정 항목 추이 조회 (그래프용)
+async def get_health_trend(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    metric: TrendMetric,
+    max_points: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> HealthTrendResponse:
+    """기간 내 측정 항목 추이를 최대 max_points 개의 점으로 다운샘플링해서 조회"""
+    total, points = await healthCrud.get_health_metric_trend(db, user_id, metric.value, max_points, start, end)
+    
+    return HealthTrendResponse(
+        user_id=user_id,
+        metric=metric,
+        total_count=total,
+        points=[TrendPoint(created_at=created_at, value=value) for created_at, value in points]
+    )
+
+# 모니터링 권한으로 환자 측정 항목 추이 조회
+async def get_monitored_patient_trend(
+    db: AsyncIOMotorDatabase,
+    monitor_id: str,
+    patient_id: str,
+    metric: TrendMetric,
+    max_points: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> HealthTrendResponse:
+    """모니터링 권한이 있는 사용자가 환자의 측정 항목 추이 조회"""
+    # 모니터링 관계 확인
+    if not await relationGraphService.is_monitoring(db, patient_id, monitor_id):
+        raise ValueError("해당 환자에 대한 모니터링 권한이 없습니다.")
+    
+    return await get_health_trend(db, patient_id, metric, max_points, start, end)
@@ -0,0 +1,153 @@
+# HealthStatsService
+# 사용자별 건강 통계(평균/최소/최대/측정 수) 조회와 통계 다시 만들기를 처리하는 모듈
+# 통계는 healthCrud에서 기록을 저장/삭제할 때 증분 갱신되고(healthStatsCrud),
+# 조회는 전체 기간 문서 1개 + 최근 일별 문서(최대 90여 개)만 읽어 기간별 통계를 합산한다
+#
+# 통계 다시 만들기: python -m services.healthStatsService [--user-id USER_ID ...]
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from schemas.healthSchema import HealthStatsResponse, HealthStatsWindow, MetricStats
+from crud import healthStatsCrud
+from services import riskProfileService, relationGraphService
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+# 기간 통계 (이름 -> 오늘 포함 일 수)
+STATS_WINDOWS = {"7d": 7, "30d": 30, "90d": 90}
+
+# 체중 통계에서 계산하는 BMI 항목 이름
+BMI_METRIC = "bmi"
+
+def _window_starts(today: date) -> Dict[str, date]:
+    starts = {name: today - timedelta(days=days - 1) for name, days in STATS_WINDOWS.items()}
+    starts["month"] = today.replace(day=1)
+    return starts
+
+def _merge(total: Dict[str, dict], metrics: Dict[str, dict]) -> None:
+    for metric, stats in metrics.items():
+        if not stats.get("n"):
+            continue
+        merged = total.get(metric)
+        if merged is None:
+            total[metric] = {"n": stats["n"], "sum": stats["sum"], "min": stats["min"], "max": stats["max"]}
+        else:
+            merged["n"] += stats["n"]
+            merged["sum"] += stats["sum"]
+            merged["min"] = min(merged["min"], stats["min"])
+            merged["max"] = max(merged["max"], stats["max"])
+
+def _to_metric_stats(metrics: Dict[str, dict], height_cm: Optional[int]) -> Dict[str, MetricStats]:
+    """
+    누적 값(n, sum, min, max)을 응답 형식으로 변환
+    BMI는 현재 키로 체중 통계에서 계산 (키가 같으면 BMI는 체중에 비례하므로 평균/최소/최대가 그대로 대응)
+    """
+    result = {}
+    for metric, stats in metrics.items():
+        if not stats.get("n"):
+            continue
+        result[metric] = MetricStats(
+            count=stats["n"],
+            avg=round(stats["sum"] / stats["n"], 1),
+            min=stats["min"],
+            max=stats["max"]
+        )
+
+    weight = result.get("weight_kg")
+    if weight and height_cm:
+        scale = (height_cm / 100) ** 2
+        result[BMI_METRIC] = MetricStats(
+            count=weight.count,
+            avg=round(metrics["weight_kg"]["sum"] / metrics["weight_kg"]["n"] / scale, 1),
+            min=round(weight.min / scale, 1),
+            max=round(weight.max / scale, 1)
+        )
+    return result
+
+# 건강 통계 조회
+async def get_health_stats(db: AsyncIOMotorDatabase, user_id: str) -> HealthStatsResponse:
+    """전체 기간 + 최근 7/30/90일, 이번 달 통계 (기록이 없으면 측정 수 0)"""
+    today = datetime.now().date()
+    starts = _window_starts(today)
+    lifetime, daily = await healthStatsCrud.get_health_stats(db, user_id, min(starts.values()))
+
+    profile = await riskProfileService.get_risk_profile(db, user_id)
+    height_cm = profile.height_cm if profile else None
+
+    windows = {}
+    for name, start in starts.items():
+        start_key = start.isoformat()
+        count = 0
+        metrics: Dict[str, dict] = {}
+        for day in daily:
+            if day["day"] >= start_key:
+                count += day["count"]
+                _merge(metrics, day.get("metrics", {}))
+        windows[name] = HealthStatsWindow(
+            start_date=start,
+            count=count,
+            metrics=_to_metric_stats(metrics, height_cm)
+        )
+
+    lifetime = lifetime or {}
+    return HealthStatsResponse(
+        user_id=user_id,
+        total_count=lifetime.get("count", 0),
+        first_at=lifetime.get("first_at"),
+        last_at=lifetime.get("last_at"),
+        lifetime=_to_metric_stats(lifetime.get("metrics", {}), height_cm),
+        windows=windows
+    )
+
+# 모니터링 권한으로 환자 건강 통계 조회
+async def get_monitored_patient_stats(
+    db: AsyncIOMotorDatabase,
+    monitor_id: str,
+    patient_id: str
+) -> HealthStatsResponse:
+    """모니터링 권한이 있는 사용자가 환자의 건강 통계 조회"""
+    if not await relationGraphService.is_monitoring(db, patient_id, monitor_id):
+        raise ValueError("해당 환자에 대한 모니터링 권한이 없습니다.")
+
+    return await get_health_stats(db, patient_id)
+
+# 건강 통계 다시 만들기
+async def rebuild_health_stats(db: AsyncIOMotorDatabase, user_ids: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    원본 기록으로 통계를 다시 만듦 (user_ids가 없으면 전체 사용자)
+
+    Returns:
+        {"users": 처리한 사용자 수, "drifted": 측정 수가 어긋나 있던 사용자 수, "records": 전체 측정 수}
+    """
+    user_ids = user_ids or await healthStatsCrud.get_stats_user_ids(db)
+    drifted = 0
+    records = 0
+    for user_id in user_ids:
+        before, after = await healthStatsCrud.rebuild_health_stats(db, user_id)
+        if before != after:
+            drifted += 1
+        records += after
+    return {"users": len(user_ids), "drifted": drifted, "records": records}
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import os
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from core.config import settings
+
+    parser = argparse.ArgumentParser(description="원본 건강 기록으로 사용자별 건강 통계 다시 만들기")
+    parser.add_argument("--user-id", action="append", help="대상 사용자 ID (여러 번 지정 가능, 없으면 전체)")
+    args = parser.parse_args()
+
+    async def run():
+        load_dotenv()
+        client = AsyncIOMotorClient(os.getenv("MONGO_URL"))
+        try:
+            result = await rebuild_health_stats(client[settings.mongo_db_name], args.user_id)
+        finally:
+            client.close()
+        print(f"✅ 완료: 사용자 {result['users']}명, 측정 수가 어긋나 있던 사용자 {result['drifted']}명, 전체 측정 {result['records']}건")
+
+    asyncio.run(run())
@@ -0,0 +1,256 @@
+# ImportService
+# 과거 건강 기록(NDJSON/CSV)을 스트리밍으로 가져오는 모듈
+# 관리자 API(POST /admin/import/health-records)와 CLI가 같은 코드를 사용한다
+#
+# - 파일 전체를 메모리에 올리지 않고 줄 단위로 읽어서 chunk 단위로 위험도 계산 + insert_many
+# - 저장 중인 chunk는 최대 1개 (저장이 끝나기 전에는 다음 chunk를 쌓기만 하고 더 쓰지 않음)
+# - chunk 저장이 끝날 때마다 처리한 줄 번호를 체크포인트로 기록하고,
+#   같은 job_id로 다시 실행하면 체크포인트 이후 줄부터 이어서 진행
+# - 기록 ID를 "job_id:줄 번호"로 정해서, 체크포인트 직전에 중단되어 다시 쓰는 행은 중복으로 건너뜀
+#
+# 실행: python -m services.importService records.ndjson [--format csv] [--job-id JOB_ID]
+
+import asyncio
+import codecs
+import csv
+import json
+import uuid
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic import ValidationError
+from schemas.healthSchema import HealthRecordImport
+from schemas.importSchema import ImportFormat, ImportReport, ImportRowError
+from models.importModel import ImportJobDB
+from crud import healthCrud, importCrud
+from services import healthService
+from core.config import settings
+from typing import AsyncIterator, List, Optional, Tuple
+
+# 작업에 저장하는 실패 행 최대 개수 (실패 수는 모두 셈)
+MAX_REPORTED_ERRORS = 100
+
+# CSV 필수 컬럼
+CSV_COLUMNS = list(HealthRecordImport.model_fields)
+
+class _Chunk:
+    """저장 단위 (유효한 행 + 실패한 행, 마지막 줄 번호)"""
+
+    def __init__(self):
+        self.items: List[Tuple[int, HealthRecordImport]] = []
+        self.errors: List[Tuple[int, str]] = []
+        self.last_line = 0
+
+# 바이트 스트림을 줄 단위 문자열로 변환
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """UTF-8 바이트 청크를 줄 단위로 변환 (청크 경계에서 잘린 줄/문자 처리, BOM 제거)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+def _parse_csv_header(line: str) -> List[str]:
+    header = [column.strip() for column in next(csv.reader([line]))]
+    missing = [column for column in CSV_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"CSV 헤더에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+    return header
+
+def _parse_row(import_format: ImportFormat, line: str, header: Optional[List[str]]) -> dict:
+    if import_format == ImportFormat.NDJSON:
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError("JSON 객체가 아닙니다.")
+        return row
+
+    values = next(csv.reader([line]))
+    if len(values) != len(header):
+        raise ValueError(f"컬럼 수가 헤더와 다릅니다 ({len(values)}/{len(header)})")
+    # 빈 칸은 누락으로 처리
+    return {column: value for column, value in zip(header, values) if value != ""}
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        first = error.errors()[0]
+        field = ".".join(str(loc) for loc in first["loc"])
+        return f"{field}: {first['msg']}" if field else first["msg"]
+    return str(error)
+
+def _add_error(job: ImportJobDB, line: int, message: str) -> None:
+    job.failed += 1
+    if len(job.errors) < MAX_REPORTED_ERRORS:
+        job.errors.append({"line": line, "error": message})
+
+def to_report(job: ImportJobDB) -> ImportReport:
+    return ImportReport(
+        job_id=job.id,
+        format=job.format,
+        status=job.status,
+        lines_processed=job.lines_done,
+        inserted=job.inserted,
+        duplicates=job.duplicates,
+        failed=job.failed,
+        errors=[ImportRowError(**error) for error in job.errors]
+    )
+
+async def _write_chunk(db: AsyncIOMotorDatabase, job: ImportJobDB, chunk: _Chunk) -> None:
+    """chunk 하나 위험도 계산 + 저장 후 체크포인트 기록"""
+    items = [item for _, item in chunk.items]
+    record_ids = [f"{job.id}:{line}" for line, _ in chunk.items]
+    scored = await healthService.score_health_records(db, items, record_ids) if items else []
+
+    records, lines = [], []
+    for (line, _), record in zip(chunk.items, scored):
+        if record:
+            records.append(record)
+            lines.append(line)
+        else:
+            chunk.errors.append((line, "사용자를 찾을 수 없습니다."))
+
+    write_errors = await healthCrud.create_health_records(db, records)
+    for i, line in enumerate(lines):
+        message = write_errors.get(i)
+        if message is None:
+            job.inserted += 1
+        elif "E11000" in message:
+            job.duplicates += 1
+        else:
+            chunk.errors.append((line, message))
+
+    for line, message in sorted(chunk.errors):
+        _add_error(job, line, message)
+
+    job.lines_done = max(job.lines_done, chunk.last_line)
+    job.updated_at = datetime.now()
+    await importCrud.save_import_job(db, job)
+
+# 가져오기 실행
+async def import_health_records(
+    db: AsyncIOMotorDatabase,
+    lines: AsyncIterator[str],
+    import_format: ImportFormat,
+    job_id: Optional[str] = None,
+    chunk_size: Optional[int] = None
+) -> ImportReport:
+    """
+    줄 단위 입력에서 건강 기록을 읽어 저장
+
+    Args:
+        job_id: 이어서 진행할 작업 ID (없으면 새 작업)
+        chunk_size: insert_many 한 번에 쓰는 행 수 (기본값: 설정의 import_chunk_size)
+    """
+    chunk_size = chunk_size or settings.import_chunk_size
+
+    job = await importCrud.get_import_job(db, job_id) if job_id else None
+    if job and job.format != import_format.value:
+        raise ValueError(f"작업 {job_id}의 형식({job.format})과 요청 형식이 다릅니다.")
+    if not job:
+        job = ImportJobDB(id=job_id or str(uuid.uuid4()), format=import_format.value)
+
+    resume_after = job.lines_done
+    job.status = "RUNNING"
+    await importCrud.save_import_job(db, job)
+
+    header: Optional[List[str]] = None
+    chunk = _Chunk()
+    writing: Optional[asyncio.Task] = None
+    line_no = 0
+    try:
+        async for line in lines:
+            line_no += 1
+            if import_format == ImportFormat.CSV and header is None:
+                header = _parse_csv_header(line)
+                continue
+            if line_no <= resume_after:
+                continue
+
+            chunk.last_line = line_no
+            if line.strip():
+                try:
+                    chunk.items.append((line_no, HealthRecordImport.model_validate(_parse_row(import_format, line, header))))
+                except (ValueError, ValidationError) as e:
+                    chunk.errors.append((line_no, _error_message(e)))
+
+            if len(chunk.items) + len(chunk.errors) >= chunk_size:
+                # 이전 chunk 저장이 끝날 때까지 대기 (저장 중인 chunk는 최대 1개)
+                if writing:
+                    await writing
+                writing = asyncio.create_task(_write_chunk(db, job, chunk))
+                chunk = _Chunk()
+
+        if writing:
+            await writing
+            writing = None
+        if chunk.last_line:
+            await _write_chunk(db, job, chunk)
+
+        job.lines_done = max(job.lines_done, line_no)
+        job.status = "COMPLETED"
+    except BaseException:
+        # 저장 중이던 chunk까지는 체크포인트에 남기고 실패 처리
+        if writing:
+            try:
+                await writing
+            except Exception:
+                pass
+        job.status = "FAILED"
+        job.updated_at = datetime.now()
+        await importCrud.save_import_job(db, job)
+        raise
+
+    job.updated_at = datetime.now()
+    await importCrud.save_import_job(db, job)
+    return to_report(job)
+
+# 가져오기 작업 상태 조회
+async def get_import_report(db: AsyncIOMotorDatabase, job_id: str) -> Optional[ImportReport]:
+    job = await importCrud.get_import_job(db, job_id)
+    return to_report(job) if job else None
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="과거 건강 기록 가져오기 (NDJSON/CSV)")
+    parser.add_argument("path", help="가져올 파일 경로")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat], help="파일 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--job-id", help="이어서 진행할 작업 ID (처음 실행 시 지정하면 그 ID로 생성)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="insert_many 한 번에 쓰는 행 수")
+    args = parser.parse_args()
+
+    import_format = ImportFormat(args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson"))
+
+    async def read_file(path: str, block_size: int = 1 << 16) -> AsyncIterator[bytes]:
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    break
+                yield block
+
+    async def run():
+        load_dotenv()
+        client = AsyncIOMotorClient(os.getenv("MONGO_URL"))
+        job_id = args.job_id or str(uuid.uuid4())
+        print(f"작업 ID: {job_id} (중단되면 --job-id {job_id} 로 다시 실행)")
+        try:
+            report = await import_health_records(
+                client[settings.mongo_db_name], iter_lines(read_file(args.path)), import_format, job_id, args.chunk_size
+            )
+        finally:
+            client.close()
+
+        print(f"✅ 완료: 저장 {report.inserted}건, 중복 {report.duplicates}건, 실패 {report.failed}건 ({report.lines_processed}줄)")
+        for error in report.errors:
+            print(f"  ! {error.line}행: {error.error}")
+
+    asyncio.run(run())
@@ -5,22 +5,80 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from schemas.memoSchema import MemoCreate, MemoResponse
 from models.memoModel import MemoDB
 from crud import memoCrud, userCrud
-from typing import Optional, List
+from services import relationGraphService
+from core.pagination import DEFAULT_PAGE_LIMIT
+from core.fastRead import ResponseShape, dumps
+from core.eventBroker import event_broker, MEMO_CREATED
+from typing import Optional, List, Tuple
 from datetime import datetime
 import uuid
 
+# 빠른 읽기 경로 응답 형태 (FAST_READ_PATH) - 작성자 이름은 조회 후 채움
+MEMO_SHAPE = ResponseShape(MemoResponse, computed=("doctor_name",))
+
+# 메모 목록 응답 변환
+async def _to_responses(db: AsyncIOMotorDatabase, memos: List[MemoDB], include_author: bool) -> List[MemoResponse]:
+    """메모 목록을 응답으로 변환 (include_author면 작성자 이름을 한 번에 조회해서 포함)"""
+    doctors = await userCrud.get_user_summaries_by_ids(db, [memo.doctor_id for memo in memos]) if include_author else {}
+    
+    result = []
+    for memo in memos:
+        doctor = doctors.get(memo.doctor_id)
+        result.append(MemoResponse(
+            id=memo.id,
+            doctor_id=memo.doctor_id,
+            doctor_name=doctor.name if doctor else None,
+            patient_id=memo.patient_id,
+            content=memo.content,
+            created_at=memo.created_at
+        ))
+    return result
+
+# 메모 목록 조회 조건 확인
+async def _check_memo_filter(db: AsyncIOMotorDatabase, doctor_id: Optional[str], patient_id: Optional[str]) -> None:
+    """목록 조회 대상 의사/환자 확인 (둘 다 지정하면 한 번에 조회)"""
+    if doctor_id and patient_id:
+        users = await userCrud.get_user_summaries_by_ids(db, [doctor_id, patient_id])
+        
+        # 의사 확인
+        doctor = users.get(doctor_id)
+        if not doctor or doctor.role != "DOCTOR":
+            raise ValueError("유효하지 않은 의사입니다.")
+        
+        # 환자 확인
+        patient = users.get(patient_id)
+        if not patient or patient.role != "PATIENT":
+            raise ValueError("유효하지 않은 환자입니다.")
+    elif doctor_id:
+        # 의사 확인
+        doctor = await userCrud.get_user_summary_by_id(db, doctor_id)
+        if not doctor:
+            raise ValueError("존재하지 않는 의사입니다.")
+        if doctor.role != "DOCTOR":
+            raise ValueError("의사만 조회할 수 있습니다.")
+    elif patient_id:
+        # 환자 확인
+        patient = await userCrud.get_user_summary_by_id(db, patient_id)
+        if not patient:
+            raise ValueError("존재하지 않는 환자입니다.")
+        if patient.role != "PATIENT":
+            raise ValueError("환자에 대해서만 조회할 수 있습니다.")
+
 # 메모 생성
 async def create_memo(db: AsyncIOMotorDatabase, memo_data: MemoCreate) -> MemoResponse:
     """새로운 메모 생성"""
+    # 의사/환자 한 번에 조회
+    users = await userCrud.get_user_summaries_by_ids(db, [memo_data.doctor_id, memo_data.patient_id])
+    
     # 의사 확인
-    doctor = await userCrud.get_user_by_id(db, memo_data.doctor_id)
+    doctor = users.get(memo_data.doctor_id)
     if not doctor:
         raise ValueError("존재하지 않는 의사입니다.")
     if doctor.role != "DOCTOR":
         raise ValueError("의사만 메모를 작성할 수 있습니다.")
     
     # 환자 확인
-    patient = await userCrud.get_user_by_id(db, memo_data.patient_id)
+    patient = users.get(memo_data.patient_id)
     if not patient:
         raise ValueError("존재하지 않는 환자입니다.")
     if patient.role != "PATIENT":
@@ -40,13 +98,20 @@ async def create_memo(db: AsyncIOMotorDatabase, memo_data: MemoCreate) -> MemoRe
     created_memo = await memoCrud.create_memo(db, memo_db)
     
     # 응답
-    return MemoResponse(
+    response = MemoResponse(
         id=created_memo.id,
         doctor_id=created_memo.doctor_id,
+        doctor_name=doctor.name,
         patient_id=created_memo.patient_id,
         content=created_memo.content,
         created_at=created_memo.created_at
     )
+    
+    # 실시간 이벤트 발행 (환자 + 환자의 모니터)
+    recipients = await relationGraphService.event_recipients(db, created_memo.patient_id)
+    event_broker.publish(recipients, MEMO_CREATED, response.model_dump())
+    
+    return response
 
 # 메모 조회 (ID로)
 async def get_memo(db: AsyncIOMotorDatabase, memo_id: str) -> Optional[MemoResponse]:
@@ -64,77 +129,76 @@ async def get_memo(db: AsyncIOMotorDatabase, memo_id: str) -> Optional[MemoRespo
     )
 
 # 특정 의사가 작성한 메모 목록 조회
-async def get_memos_by_doctor(db: AsyncIOMotorDatabase, doctor_id: str) -> List[MemoResponse]:
-    """특정 의사가 작성한 모든 메모 조회"""
-    # 의사 확인
-    doctor = await userCrud.get_user_by_id(db, doctor_id)
-    if not doctor:
-        raise ValueError("존재하지 않는 의사입니다.")
-    if doctor.role != "DOCTOR":
-        raise ValueError("의사만 조회할 수 있습니다.")
+async def get_memos_by_doctor(
+    db: AsyncIOMotorDatabase,
+    doctor_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None,
+    include_author: bool = False
+) -> Tuple[List[MemoResponse], Optional[str]]:
+    """특정 의사가 작성한 메모 조회 (한 페이지) + 다음 페이지 커서"""
+    await _check_memo_filter(db, doctor_id, None)
     
-    memos = await memoCrud.get_memos_by_doctor(db, doctor_id)
-    return [
-        MemoResponse(
-            id=memo.id,
-            doctor_id=memo.doctor_id,
-            patient_id=memo.patient_id,
-            content=memo.content,
-            created_at=memo.created_at
-        )
-        for memo in memos
-    ]
+    memos, next_cursor = await memoCrud.get_memos_by_doctor(db, doctor_id, limit, after)
+    return await _to_responses(db, memos, include_author), next_cursor
 
 # 특정 환자에 대한 메모 목록 조회
-async def get_memos_by_patient(db: AsyncIOMotorDatabase, patient_id: str) -> List[MemoResponse]:
-    """특정 환자에 대한 모든 메모 조회"""
-    # 환자 확인
-    patient = await userCrud.get_user_by_id(db, patient_id)
-    if not patient:
-        raise ValueError("존재하지 않는 환자입니다.")
-    if patient.role != "PATIENT":
-        raise ValueError("환자에 대해서만 조회할 수 있습니다.")
+async def get_memos_by_patient(
+    db: AsyncIOMotorDatabase,
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None,
+    include_author: bool = False
+) -> Tuple[List[MemoResponse], Optional[str]]:
+    """특정 환자에 대한 메모 조회 (한 페이지) + 다음 페이지 커서"""
+    await _check_memo_filter(db, None, patient_id)
     
-    memos = await memoCrud.get_memos_by_patient(db, patient_id)
-    return [
-        MemoResponse(
-            id=memo.id,
-            doctor_id=memo.doctor_id,
-            patient_id=memo.patient_id,
-            content=memo.content,
-            created_at=memo.created_at
-        )
-        for memo in memos
-    ]
+    memos, next_cursor = await memoCrud.get_memos_by_patient(db, patient_id, limit, after)
+    return await _to_responses(db, memos, include_author), next_cursor
 
 # 특정 의사가 특정 환자에 대해 작성한 메모 조회
 async def get_memos_by_doctor_and_patient(
     db: AsyncIOMotorDatabase, 
     doctor_id: str, 
-    patient_id: str
-) -> List[MemoResponse]:
-    """특정 의사가 특정 환자에 대해 작성한 메모 조회"""
-    # 의사 확인
-    doctor = await userCrud.get_user_by_id(db, doctor_id)
-    if not doctor or doctor.role != "DOCTOR":
-        raise ValueError("유효하지 않은 의사입니다.")
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None,
+    include_author: bool = False
+) -> Tuple[List[MemoResponse], Optional[str]]:
+    """특정 의사가 특정 환자에 대해 작성한 메모 조회 (한 페이지) + 다음 페이지 커서"""
+    await _check_memo_filter(db, doctor_id, patient_id)
     
-    # 환자 확인
-    patient = await userCrud.get_user_by_id(db, patient_id)
-    if not patient or patient.role != "PATIENT":
-        raise ValueError("유효하지 않은 환자입니다.")
+    memos, next_cursor = await memoCrud.get_memos_by_doctor_and_patient(db, doctor_id, patient_id, limit, after)
+    return await _to_responses(db, memos, include_author), next_cursor
+
+# 메모 조회 (ID로, 빠른 읽기 경로)
+async def get_memo_json(db: AsyncIOMotorDatabase, memo_id: str) -> Optional[bytes]:
+    """get_memo와 같은 응답을 모델 없이 JSON 바이트로 조회 (없으면 None)"""
+    doc = await memoCrud.get_memo_row(db, memo_id, MEMO_SHAPE.projection)
+    if not doc:
+        return None
+    return dumps(MEMO_SHAPE.row(doc))
+
+# 메모 목록 조회 (빠른 읽기 경로)
+async def get_memos_json(
+    db: AsyncIOMotorDatabase,
+    doctor_id: Optional[str] = None,
+    patient_id: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None,
+    include_author: bool = False
+) -> Tuple[bytes, Optional[str]]:
+    """get_memos_by_doctor/patient/doctor_and_patient와 같은 응답을 모델 없이 JSON 바이트로 조회 + 다음 페이지 커서"""
+    await _check_memo_filter(db, doctor_id, patient_id)
     
-    memos = await memoCrud.get_memos_by_doctor_and_patient(db, doctor_id, patient_id)
-    return [
-        MemoResponse(
-            id=memo.id,
-            doctor_id=memo.doctor_id,
-            patient_id=memo.patient_id,
-            content=memo.content,
-            created_at=memo.created_at
-        )
-        for memo in memos
-    ]
+    docs, next_cursor = await memoCrud.get_memo_rows(db, MEMO_SHAPE.projection, doctor_id, patient_id, limit, after)
+    rows = MEMO_SHAPE.rows(docs)
+    if include_author:
+        doctors = await userCrud.get_user_summaries_by_ids(db, [row["doctor_id"] for row in rows])
+        for row in rows:
+            doctor = doctors.get(row["doctor_id"])
+            row["doctor_name"] = doctor.name if doctor else None
+    return dumps(rows), next_cursor
 
 # 메모 삭제
 async def delete_memo(db: AsyncIOMotorDatabase, memo_id: str, doctor_id: str) -> bool:
@@ -1,17 +1,23 @@
 # MonitoringService에 대응
 # monitoring 관련 비즈니스 로직을 처리하는 모듈
 
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from schemas.monitoringSchema import (
     MonitoringRequestCreate, 
     MonitoringRequestResponse, 
     MonitoringApproval,
     MonitoringRelationResponse,
-    MonitoringStatus
+    MonitoringStatus,
+    PatientDashboardItem
 )
+from schemas.healthSchema import HealthRecordResponse
 from models.monitoringModel import MonitoringRequestDB, MonitoringRelationDB
-from crud import monitoringCrud, userCrud
-from typing import Optional, List
+from crud import monitoringCrud, healthCrud, userCrud
+from services import relationGraphService
+from core.pagination import DEFAULT_PAGE_LIMIT
+from core.eventBroker import event_broker, MONITORING_REQUEST_RESPONDED
+from typing import Optional, List, Tuple
 from bson import ObjectId
 from datetime import datetime
 
@@ -22,8 +28,9 @@ async def create_monitoring_request(
     request_data: MonitoringRequestCreate
 ) -> MonitoringRequestResponse:
     """새로운 모니터링 요청 생성"""
-    # 환자와 요청자 확인
-    patient = await userCrud.get_user_by_id(db, request_data.patient_id)
+    # 환자와 요청자 확인 (한 번에 조회)
+    users = await userCrud.get_user_summaries_by_ids(db, [request_data.patient_id, request_data.requester_id])
+    patient = users.get(request_data.patient_id)
     if not patient:
         raise ValueError("환자를 찾을 수 없습니다.")
     
@@ -31,7 +38,7 @@ async def create_monitoring_request(
     if patient.role != "PATIENT":
         raise ValueError("환자 역할의 사용자에게만 요청할 수 있습니다.")
     
-    requester = await userCrud.get_user_by_id(db, request_data.requester_id)
+    requester = users.get(request_data.requester_id)
     if not requester:
         raise ValueError("요청자를 찾을 수 없습니다.")
     
@@ -49,7 +56,7 @@ async def create_monitoring_request(
         raise ValueError("이미 대기 중인 요청이 존재합니다.")
     
     # 이미 관계가 존재하는지 확인
-    relation_exists = await monitoringCrud.relation_exists(
+    relation_exists = await relationGraphService.is_monitoring(
         db, 
         request_data.patient_id, 
         request_data.requester_id
@@ -85,14 +92,17 @@ async def create_monitoring_request(
 
 async def get_pending_requests_for_patient(
     db: AsyncIOMotorDatabase, 
-    patient_id: str
-) -> List[MonitoringRequestResponse]:
-    """환자가 받은 대기 중인 모니터링 요청 목록"""
-    requests = await monitoringCrud.get_pending_requests_for_patient(db, patient_id)
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MonitoringRequestResponse], Optional[str]]:
+    """환자가 받은 대기 중인 모니터링 요청 목록 (한 페이지) + 다음 페이지 커서"""
+    requests, next_cursor = await monitoringCrud.get_pending_requests_for_patient(db, patient_id, limit, after)
+    requesters = await userCrud.get_user_summaries_by_ids(db, [req.requester_id for req in requests])
     
     result = []
     for req in requests:
-        requester = await userCrud.get_user_by_id(db, req.requester_id)
+        requester = requesters.get(req.requester_id)
         if requester:
             result.append(MonitoringRequestResponse(
                 id=req.id,
@@ -106,18 +116,21 @@ async def get_pending_requests_for_patient(
                 responded_at=req.responded_at
             ))
     
-    return result
+    return result, next_cursor
 
 async def get_requests_by_requester(
     db: AsyncIOMotorDatabase, 
-    requester_id: str
-) -> List[MonitoringRequestResponse]:
-    """의사/보호자가 보낸 모니터링 요청 목록"""
-    requests = await monitoringCrud.get_requests_by_requester(db, requester_id)
+    requester_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MonitoringRequestResponse], Optional[str]]:
+    """의사/보호자가 보낸 모니터링 요청 목록 (한 페이지) + 다음 페이지 커서"""
+    requests, next_cursor = await monitoringCrud.get_requests_by_requester(db, requester_id, limit, after)
+    patients = await userCrud.get_user_summaries_by_ids(db, [req.patient_id for req in requests])
     
     result = []
     for req in requests:
-        patient = await userCrud.get_user_by_id(db, req.patient_id)
+        patient = patients.get(req.patient_id)
         if patient:
             result.append(MonitoringRequestResponse(
                 id=req.id,
@@ -131,7 +144,7 @@ async def get_requests_by_requester(
                 responded_at=req.responded_at
             ))
     
-    return result
+    return result, next_cursor
 
 async def approve_monitoring_request(
     db: AsyncIOMotorDatabase, 
@@ -163,13 +176,15 @@ async def approve_monitoring_request(
             granted_at=datetime.now()
         )
         await monitoringCrud.create_monitoring_relation(db, relation)
+        await relationGraphService.add_relation(db, relation.patient_id, relation.monitor_id)
     
     # 업데이트된 요청 조회
     updated_request = await monitoringCrud.get_request_by_id(db, approval_data.request_id)
-    patient = await userCrud.get_user_by_id(db, updated_request.patient_id)
-    requester = await userCrud.get_user_by_id(db, updated_request.requester_id)
+    users = await userCrud.get_user_summaries_by_ids(db, [updated_request.patient_id, updated_request.requester_id])
+    patient = users.get(updated_request.patient_id)
+    requester = users.get(updated_request.requester_id)
     
-    return MonitoringRequestResponse(
+    response = MonitoringRequestResponse(
         id=updated_request.id,
         patient_id=updated_request.patient_id,
         patient_name=patient.name if patient else "",
@@ -180,19 +195,39 @@ async def approve_monitoring_request(
         created_at=updated_request.created_at,
         responded_at=updated_request.responded_at
     )
+    
+    # 실시간 이벤트 발행 (요청자 + 환자)
+    event_broker.publish(
+        [updated_request.requester_id, updated_request.patient_id],
+        MONITORING_REQUEST_RESPONDED,
+        response.model_dump()
+    )
+    
+    return response
+
+# ==================== 실시간 이벤트 ====================
+
+async def validate_event_subscriber(db: AsyncIOMotorDatabase, user_id: str) -> None:
+    """실시간 이벤트 구독자 확인 (존재하는 사용자만 구독 가능)"""
+    user = await userCrud.get_user_summary_by_id(db, user_id)
+    if not user:
+        raise ValueError("사용자를 찾을 수 없습니다.")
 
 # ==================== 모니터링 관계 ====================
 
 async def get_patient_relations(
     db: AsyncIOMotorDatabase, 
-    patient_id: str
-) -> List[MonitoringRelationResponse]:
-    """환자의 승인된 모니터링 관계 목록"""
-    relations = await monitoringCrud.get_relations_by_patient(db, patient_id)
+    patient_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MonitoringRelationResponse], Optional[str]]:
+    """환자의 승인된 모니터링 관계 목록 (한 페이지) + 다음 페이지 커서"""
+    relations, next_cursor = await monitoringCrud.get_relations_by_patient(db, patient_id, limit, after)
+    monitors = await userCrud.get_user_summaries_by_ids(db, [rel.monitor_id for rel in relations])
     
     result = []
     for rel in relations:
-        monitor = await userCrud.get_user_by_id(db, rel.monitor_id)
+        monitor = monitors.get(rel.monitor_id)
         if monitor:
             result.append(MonitoringRelationResponse(
                 id=rel.id,
@@ -204,18 +239,21 @@ async def get_patient_relations(
                 granted_at=rel.granted_at
             ))
     
-    return result
+    return result, next_cursor
 
 async def get_my_patients(
     db: AsyncIOMotorDatabase, 
-    monitor_id: str
-) -> List[MonitoringRelationResponse]:
-    """의사/보호자가 모니터링하는 환자 목록"""
-    relations = await monitoringCrud.get_patients_by_monitor(db, monitor_id)
+    monitor_id: str,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    after: Optional[str] = None
+) -> Tuple[List[MonitoringRelationResponse], Optional[str]]:
+    """의사/보호자가 모니터링하는 환자 목록 (한 페이지) + 다음 페이지 커서"""
+    relations, next_cursor = await monitoringCrud.get_patients_by_monitor(db, monitor_id, limit, after)
+    patients = await userCrud.get_user_summaries_by_ids(db, [rel.patient_id for rel in relations])
     
     result = []
     for rel in relations:
-        patient = await userCrud.get_user_by_id(db, rel.patient_id)
+        patient = patients.get(rel.patient_id)
         if patient:
             result.append(MonitoringRelationResponse(
                 id=rel.id,
@@ -227,6 +265,58 @@ async def get_my_patients(
                 granted_at=rel.granted_at
             ))
     
+    return result, next_cursor
+
+async def get_monitor_dashboard(
+    db: AsyncIOMotorDatabase,
+    monitor_id: str
+) -> List[PatientDashboardItem]:
+    """
+    모니터링 중인 모든 환자의 최신 측정/위험도 요약 (위험도 높은 순)
+    환자별 조회 대신 관계 조회 1번 + 사용자 조회 1번 + 집계 1번으로 처리
+    """
+    relations = await monitoringCrud.get_all_relations_by_monitor(db, monitor_id)
+    patient_ids = [rel.patient_id for rel in relations]
+    
+    patients, summary = await asyncio.gather(
+        userCrud.get_user_summaries_by_ids(db, patient_ids),
+        healthCrud.get_latest_records_summary(db, patient_ids)
+    )
+    
+    result = []
+    seen = set()
+    for rel in relations:
+        patient = patients.get(rel.patient_id)
+        if not patient or rel.patient_id in seen:
+            continue
+        seen.add(rel.patient_id)
+        
+        latest, count = summary.get(rel.patient_id, (None, 0))
+        result.append(PatientDashboardItem(
+            relation_id=rel.id,
+            patient_id=rel.patient_id,
+            patient_name=patient.name,
+            granted_at=rel.granted_at,
+            record_count=count,
+            latest_record=HealthRecordResponse(
+                id=latest.id,
+                user_id=latest.user_id,
+                weight_kg=latest.weight_kg,
+                systolic_bp=latest.systolic_bp,
+                diastolic_bp=latest.diastolic_bp,
+                glucose_level=latest.glucose_level,
+                smoking=latest.smoking,
+                stroke_risk_score=latest.stroke_risk_score,
+                stroke_risk_level=latest.stroke_risk_level,
+                created_at=latest.created_at
+            ) if latest else None
+        ))
+    
+    # 위험도 높은 환자부터 (측정 기록이 없는 환자는 마지막)
+    def risk_of(item: PatientDashboardItem) -> Optional[float]:
+        return item.latest_record.stroke_risk_score if item.latest_record else None
+    
+    result.sort(key=lambda item: (risk_of(item) is None, -(risk_of(item) or 0)))
     return result
 
 async def delete_monitoring_relation(
@@ -241,6 +331,7 @@ async def delete_monitoring_relation(
     
     # 관계 삭제
     deleted = await monitoringCrud.delete_monitoring_relation(db, relation_id)
+    await relationGraphService.remove_relation(db, relation.patient_id, relation.monitor_id)
     
     # 해당 관계와 연결된 요청도 삭제
     if relation.request_id:
@@ -0,0 +1,211 @@
+# 모니터링 관계 그래프 (모니터링 권한 확인 + 실시간 이벤트 수신자 인덱스)
+# 환자 → 모니터, 모니터 → 환자 양방향 집합을 프로세스 메모리에 보관해서
+# 모니터링 권한 확인(is_monitoring)과 이벤트 수신자 찾기(event_recipients)를 DB 조회 없이 집합 조회로 처리한다
+#
+# - 서버 시작 시 전체 관계를 읽어 적재하고, 이 워커의 승인/해제는 즉시 반영
+# - 승인/해제는 monitoring_relation_changes 컬렉션에 순번과 함께 기록하고, 각 워커는 조회 전에
+#   마지막으로 확인한 지 RELATION_GRAPH_MAX_STALENESS_SECONDS가 지났으면 그 뒤의 변경만 읽어 반영한다
+#   (다른 워커에서 해제된 관계는 최대 이 시간까지만 남음, 그 사이 조회는 DB를 거치지 않음)
+# - 변경 내역이 비어 있으면(오래되어 삭제됨, 기록 전에 워커가 중단됨) 전체를 다시 적재
+# - RELATION_GRAPH_RECONCILE_SECONDS 마다 전체를 다시 맞추고 오래된 변경 내역을 정리 (안전망)
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from crud import monitoringCrud
+from core.config import settings
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 변경 내역 보관 기간 (재조정 때 이보다 오래된 내역 삭제)
+CHANGE_RETENTION = timedelta(days=1)
+# 순번이 비어 있는 상태가 이보다 오래 가면 기록이 끝나지 않은 것으로 보고 전체 재적재 (초)
+CHANGE_GAP_TIMEOUT_SECONDS = 5.0
+# 동기화 한 번에 읽는 변경 내역 수
+CHANGE_BATCH_SIZE = 1000
+
+class RelationGraph:
+    """환자-모니터 양방향 인접 집합"""
+
+    def __init__(self):
+        self._monitors_by_patient: Dict[str, Set[str]] = {}
+        self._patients_by_monitor: Dict[str, Set[str]] = {}
+        # 전체 재적재 중에 들어온 변경 (재적재 결과에 덮어써지지 않도록 적재 후 다시 적용)
+        self._reloading = False
+        self._journal: List[Tuple[bool, str, str]] = []
+        # 반영한 마지막 변경 순번, 마지막으로 DB와 맞춘 시각 (time.monotonic)
+        self.applied_seq = 0
+        self.synced_at = float("-inf")
+
+    def has(self, patient_id: str, monitor_id: str) -> bool:
+        return monitor_id in self._monitors_by_patient.get(patient_id, ())
+
+    def monitors_of(self, patient_id: str) -> Set[str]:
+        return set(self._monitors_by_patient.get(patient_id, ()))
+
+    def patients_of(self, monitor_id: str) -> Set[str]:
+        return set(self._patients_by_monitor.get(monitor_id, ()))
+
+    def add(self, patient_id: str, monitor_id: str) -> None:
+        if self._reloading:
+            self._journal.append((True, patient_id, monitor_id))
+        self._add(patient_id, monitor_id)
+
+    def remove(self, patient_id: str, monitor_id: str) -> None:
+        if self._reloading:
+            self._journal.append((False, patient_id, monitor_id))
+        self._remove(patient_id, monitor_id)
+
+    def begin_reload(self) -> None:
+        self._reloading = True
+        self._journal = []
+
+    def finish_reload(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        DB에서 읽은 전체 관계로 교체
+
+        Returns:
+            기존 그래프와 달랐던 관계 수 (추가 + 제거)
+        """
+        before = self._pairs()
+        self._monitors_by_patient, self._patients_by_monitor = {}, {}
+        for patient_id, monitor_id in pairs:
+            self._add(patient_id, monitor_id)
+
+        journal, self._journal, self._reloading = self._journal, [], False
+        for added, patient_id, monitor_id in journal:
+            if added:
+                self._add(patient_id, monitor_id)
+            else:
+                self._remove(patient_id, monitor_id)
+
+        return len(before ^ self._pairs())
+
+    def abort_reload(self) -> None:
+        self._reloading = False
+        self._journal = []
+
+    def size(self) -> int:
+        return sum(len(monitors) for monitors in self._monitors_by_patient.values())
+
+    def _pairs(self) -> Set[Tuple[str, str]]:
+        return {
+            (patient_id, monitor_id)
+            for patient_id, monitors in self._monitors_by_patient.items()
+            for monitor_id in monitors
+        }
+
+    def _add(self, patient_id: str, monitor_id: str) -> None:
+        self._monitors_by_patient.setdefault(patient_id, set()).add(monitor_id)
+        self._patients_by_monitor.setdefault(monitor_id, set()).add(patient_id)
+
+    def _remove(self, patient_id: str, monitor_id: str) -> None:
+        monitors = self._monitors_by_patient.get(patient_id)
+        if monitors is not None:
+            monitors.discard(monitor_id)
+            if not monitors:
+                del self._monitors_by_patient[patient_id]
+        patients = self._patients_by_monitor.get(monitor_id)
+        if patients is not None:
+            patients.discard(patient_id)
+            if not patients:
+                del self._patients_by_monitor[monitor_id]
+
+# 프로세스 전체에서 공유하는 관계 그래프
+relation_graph = RelationGraph()
+
+_sync_lock = asyncio.Lock()
+_gap_since: Optional[float] = None
+
+# DB의 전체 관계로 그래프 적재/재조정
+async def load_relation_graph(db: AsyncIOMotorDatabase) -> int:
+    """전체 모니터링 관계를 다시 읽어 그래프 교체, 기존 그래프와 달랐던 관계 수 반환"""
+    async with _sync_lock:
+        return await _reload(db)
+
+async def _reload(db: AsyncIOMotorDatabase) -> int:
+    global _gap_since
+    relation_graph.begin_reload()
+    try:
+        # 순번을 먼저 읽음 - 관계를 읽는 사이의 변경은 다음 동기화에서 다시 적용 (같은 변경을 다시 적용해도 결과는 같음)
+        seq = await monitoringCrud.get_relation_change_seq(db)
+        pairs = await monitoringCrud.get_all_relation_pairs(db)
+    except Exception:
+        relation_graph.abort_reload()
+        raise
+    drift = relation_graph.finish_reload(pairs)
+    relation_graph.applied_seq = seq
+    relation_graph.synced_at = time.monotonic()
+    _gap_since = None
+    return drift
+
+# 다른 워커의 변경 반영
+async def sync_relation_graph(db: AsyncIOMotorDatabase) -> None:
+    """마지막 확인 후 RELATION_GRAPH_MAX_STALENESS_SECONDS가 지났으면 이후 변경 내역 반영 (동시 호출은 한 번만 조회)"""
+    if time.monotonic() - relation_graph.synced_at < settings.relation_graph_max_staleness_seconds:
+        return
+    async with _sync_lock:
+        if time.monotonic() - relation_graph.synced_at < settings.relation_graph_max_staleness_seconds:
+            return
+        await _apply_changes(db)
+
+async def _apply_changes(db: AsyncIOMotorDatabase) -> None:
+    global _gap_since
+    checked_at = time.monotonic()
+    while True:
+        changes = await monitoringCrud.get_relation_changes(db, relation_graph.applied_seq, CHANGE_BATCH_SIZE)
+        for change in changes:
+            if change["_id"] != relation_graph.applied_seq + 1:
+                # 앞 순번이 아직 기록 중이거나 이미 삭제됨
+                if _gap_since is None:
+                    _gap_since = checked_at
+                elif checked_at - _gap_since > CHANGE_GAP_TIMEOUT_SECONDS:
+                    await _reload(db)
+                    return
+                relation_graph.synced_at = checked_at
+                return
+            if change["added"]:
+                relation_graph.add(change["patient_id"], change["monitor_id"])
+            else:
+                relation_graph.remove(change["patient_id"], change["monitor_id"])
+            relation_graph.applied_seq = change["_id"]
+        if len(changes) < CHANGE_BATCH_SIZE:
+            break
+    _gap_since = None
+    relation_graph.synced_at = checked_at
+
+# 주기적 재조정 (백그라운드 태스크)
+async def run_reconcile_loop(db: AsyncIOMotorDatabase, interval_seconds: float) -> None:
+    """interval_seconds 마다 DB와 그래프를 다시 맞추고 오래된 변경 내역 삭제"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            drift = await load_relation_graph(db)
+            if drift:
+                print(f"⚠️ 모니터링 관계 그래프 재조정: {drift}건 불일치 수정")
+            await monitoringCrud.delete_relation_changes_before(db, datetime.now() - CHANGE_RETENTION)
+        except Exception as e:
+            print(f"⚠️ 모니터링 관계 그래프 재조정 실패: {e}")
+
+# 관계 추가/해제 (승인/해제 직후 호출)
+async def add_relation(db: AsyncIOMotorDatabase, patient_id: str, monitor_id: str) -> None:
+    """이 워커의 그래프에 바로 반영하고 다른 워커가 읽을 변경 내역 기록"""
+    relation_graph.add(patient_id, monitor_id)
+    await monitoringCrud.record_relation_change(db, patient_id, monitor_id, True)
+
+async def remove_relation(db: AsyncIOMotorDatabase, patient_id: str, monitor_id: str) -> None:
+    """이 워커의 그래프에서 바로 제거하고 다른 워커가 읽을 변경 내역 기록"""
+    relation_graph.remove(patient_id, monitor_id)
+    await monitoringCrud.record_relation_change(db, patient_id, monitor_id, False)
+
+# 실시간 이벤트 수신자
+async def event_recipients(db: AsyncIOMotorDatabase, patient_id: str) -> Set[str]:
+    """환자 본인 + 환자의 모니터"""
+    await sync_relation_graph(db)
+    return {patient_id} | relation_graph.monitors_of(patient_id)
+
+# 모니터링 권한 확인
+async def is_monitoring(db: AsyncIOMotorDatabase, patient_id: str, monitor_id: str) -> bool:
+    """monitor_id가 patient_id를 모니터링할 수 있는지 그래프에서 확인 (필요하면 먼저 다른 워커의 변경 반영)"""
+    await sync_relation_graph(db)
+    return relation_graph.has(patient_id, monitor_id)
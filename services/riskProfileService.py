@@ -0,0 +1,135 @@
+# 사용자별 위험도 프로필(고정 위험 요인) 캐시
+# 건강 기록을 저장할 때마다 사용자 조회 + 고정 점수 재계산을 반복하지 않도록
+# 사용자별 고정 점수를 미리 계산해 프로세스 메모리에 보관하는 모듈
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic import BaseModel
+from models.userModel import UserRiskFieldsDB
+from crud import userCrud
+from core.cache import TTLCache
+from core.config import settings
+from core.riskCalculator import calculate_static_risk, calculate_age, get_age_bracket
+from datetime import date, datetime
+from typing import Optional, Dict, Iterable
+
+# 생년월일이 없는 사용자의 기본 나이 (healthService 기존 동작과 동일)
+DEFAULT_AGE = 50
+
+class RiskProfile(BaseModel):
+    """위험도 계산용 사용자 프로필 (고정 위험 요인 + 변동 점수 계산에 필요한 값)"""
+    user_id: str
+    birth_date: Optional[date] = None
+    sex: str
+    stroke_history: bool
+    hypertension: bool
+    heart_disease: bool
+    diabetes: bool
+    smoking_history: str          # 변동 점수(흡연) 계산에 필요
+    height_cm: Optional[int] = None  # 변동 점수(BMI) 계산에 필요
+    age_bracket: int
+    static_score: float           # 나이 구간, 성별, 질병력 점수 합
+    computed_on: date             # 나이 구간을 마지막으로 확인한 날짜
+
+# user_id -> RiskProfile (크기 제한 LRU + TTL)
+# 건강 정보 수정 시 이 프로세스의 항목은 바로 무효화되고 (조회 중에 무효화되면 조회 결과를 넣지 않음),
+# 여러 워커 프로세스로 실행하면 다른 워커의 항목은 TTL이 지나면 DB에서 다시 만든다
+_profiles = TTLCache(settings.risk_profile_cache_max_size, settings.risk_profile_cache_ttl_seconds)
+
+def _enum_value(value):
+    return value.value if hasattr(value, 'value') else value
+
+def _age_of(birth_date: Optional[date], on: Optional[date] = None) -> int:
+    return calculate_age(birth_date, on) if birth_date else DEFAULT_AGE
+
+def get_profile_age(profile: RiskProfile, on: Optional[date] = None) -> int:
+    """위험도 계산에 사용하는 나이 (on: 측정 날짜, 없으면 오늘 / 생년월일이 없으면 기본 나이)"""
+    return _age_of(profile.birth_date, on)
+
+def build_risk_profile(user: UserRiskFieldsDB) -> RiskProfile:
+    """사용자 문서(위험도 계산용 필드)로부터 위험도 프로필 생성"""
+    birth_date = user.birth_date
+    if isinstance(birth_date, datetime):
+        birth_date = birth_date.date()
+
+    age = _age_of(birth_date)
+    sex = _enum_value(user.sex)
+
+    return RiskProfile(
+        user_id=user.id,
+        birth_date=birth_date,
+        sex=sex,
+        stroke_history=user.stroke_history,
+        hypertension=user.hypertension,
+        heart_disease=user.heart_disease,
+        diabetes=user.diabetes,
+        smoking_history=_enum_value(user.smoking_history),
+        height_cm=user.height_cm,
+        age_bracket=get_age_bracket(age),
+        static_score=calculate_static_risk(
+            age=age,
+            sex=sex,
+            stroke_history=user.stroke_history,
+            hypertension=user.hypertension,
+            heart_disease=user.heart_disease,
+            diabetes=user.diabetes
+        ),
+        computed_on=datetime.now().date()
+    )
+
+def _get_cached_profile(user_id: str) -> Optional[RiskProfile]:
+    """캐시된 프로필 (날짜가 바뀌었으면 나이 구간이 달라질 수 있으므로 버리고 다시 만든다)"""
+    profile = _profiles.get(user_id)
+    if not profile:
+        return None
+
+    if profile.computed_on != datetime.now().date():
+        _profiles.invalidate(user_id)
+        return None
+    return profile
+
+# 위험도 프로필 조회 (캐시 우선)
+async def get_risk_profile(db: AsyncIOMotorDatabase, user_id: str) -> Optional[RiskProfile]:
+    """캐시된 위험도 프로필 반환, 없으면 사용자 조회 후 생성"""
+    profile = _get_cached_profile(user_id)
+    if profile:
+        return profile
+
+    # 사용자 캐시를 거치지 않고 DB에서 조회 (다른 워커에서 바뀐 건강 정보 반영)
+    token = _profiles.token(user_id)
+    user = await userCrud.get_risk_fields_by_id(db, user_id)
+    if not user:
+        return None
+
+    profile = build_risk_profile(user)
+    _profiles.set(user_id, profile, token)
+    return profile
+
+# 여러 사용자의 위험도 프로필 조회 (캐시 우선)
+async def get_risk_profiles(db: AsyncIOMotorDatabase, user_ids: Iterable[str]) -> Dict[str, RiskProfile]:
+    """캐시에 없는 사용자만 $in 한 번으로 조회 (없는 사용자는 결과에서 제외)"""
+    profiles = {}
+    missing = []
+    for user_id in set(user_ids):
+        profile = _get_cached_profile(user_id)
+        if profile:
+            profiles[user_id] = profile
+        else:
+            missing.append(user_id)
+    
+    if missing:
+        tokens = {user_id: _profiles.token(user_id) for user_id in missing}
+        users = await userCrud.get_risk_fields_by_ids(db, missing)
+        for user_id, user in users.items():
+            profile = build_risk_profile(user)
+            _profiles.set(user_id, profile, tokens[user_id])
+            profiles[user_id] = profile
+    return profiles
+
+# 위험도 프로필 무효화
+def invalidate_risk_profile(user_id: str) -> None:
+    """사용자 건강 정보가 바뀌었을 때 캐시 제거"""
+    _profiles.invalidate(user_id)
+
+def get_risk_profile_cache_stats() -> dict:
+    """위험도 프로필 캐시 카운터"""
+    return _profiles.stats()
@@ -5,6 +5,8 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from schemas.userSchema import UserCreate, UserResponse, UserUpdate, UserLogin, UserHealthInfoResponse
 from models.userModel import UserDB
 from crud import userCrud
+from services import riskProfileService
+from core.passwordHasher import password_hasher
 from typing import Optional
 
 # 회원가입
@@ -28,7 +30,7 @@ async def register_user(db: AsyncIOMotorDatabase, user_data: UserCreate) -> User
     # UserDB 모델로 변환
     user_dict = {
         "id": user_data.id,
-        "password": user_data.password,
+        "password": await password_hasher.hash(user_data.password),
         "name": user_data.name,
         "role": user_data.role
     }
@@ -61,15 +63,20 @@ async def register_user(db: AsyncIOMotorDatabase, user_data: UserCreate) -> User
 # 로그인
 async def login_user(db: AsyncIOMotorDatabase, login_data: UserLogin) -> Optional[UserResponse]:
     """사용자 로그인"""
-    # 사용자 조회
-    user = await userCrud.get_user_by_id(db, login_data.id)
+    # 사용자 조회 (인증은 캐시를 거치지 않음 - 다른 워커에서 바꾼 비밀번호/삭제가 바로 반영되도록)
+    user = await userCrud.get_user_by_id(db, login_data.id, use_cache=False)
     if not user:
         return None
     
-    # 비밀번호 검증
-    if login_data.password != user.password:
+    # 비밀번호 검증 (스레드 풀에서 실행)
+    if not await password_hasher.verify(login_data.password, user.password):
         return None
     
+    # 평문이나 이전 방식/비용 설정으로 저장된 비밀번호는 현재 방식으로 다시 저장
+    if password_hasher.needs_rehash(user.password):
+        new_hash = await password_hasher.hash(login_data.password)
+        await userCrud.replace_password(db, user.id, user.password, new_hash)
+    
     # 응답 (비밀번호 제외)
     return UserResponse(
         id=user.id,
@@ -102,6 +109,10 @@ async def update_user(db: AsyncIOMotorDatabase, user_id: str, update_dict: dict)
     if "role" in update_dict:
         del update_dict["role"]
     
+    # 비밀번호는 해시해서 저장
+    if update_dict.get("password") is not None:
+        update_dict["password"] = await password_hasher.hash(update_dict["password"])
+    
     # updated_at 자동 설정
     from datetime import datetime
     update_dict["updated_at"] = datetime.now()
@@ -158,5 +169,8 @@ async def update_user_health_info(db: AsyncIOMotorDatabase, user_id: str, health
     if not success:
         return None
     
+    # 캐시된 위험도 프로필 무효화 (다음 건강 기록 저장 시 다시 계산)
+    riskProfileService.invalidate_risk_profile(user_id)
+    
     # 업데이트된 정보 조회
     return await get_user_health_info(db, user_id)
\ No newline at end of file
@@ -66,6 +66,37 @@ async function apiCall(url, method = 'GET', data = null) {
     }
 }
 
+// 목록 API 한 페이지 조회 ({ items, nextCursor } - nextCursor가 null이면 마지막 페이지)
+async function apiCallPage(url, pageSize, cursor = null) {
+    const params = new URLSearchParams({ limit: pageSize });
+    if (cursor) params.set('after', cursor);
+    const response = await fetch(`${url}${url.includes('?') ? '&' : '?'}${params}`);
+    if (!response.ok) {
+        let errorMessage = '요청 실패';
+        try {
+            const error = await response.json();
+            errorMessage = error.detail || errorMessage;
+        } catch (e) {
+            errorMessage = response.statusText || errorMessage;
+        }
+        throw new Error(errorMessage);
+    }
+    return { items: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+}
+
+// 목록 API 전체 페이지 조회 (X-Next-Cursor 헤더를 따라가며 after 커서로 다음 페이지 요청)
+// 개수가 작은 목록(모니터링 관계/요청, 메모)에만 사용 - 건강 기록은 apiCallPage로 한 페이지씩
+async function apiCallAllPages(url, pageSize = 500) {
+    const records = [];
+    let cursor = null;
+    do {
+        const page = await apiCallPage(url, pageSize, cursor);
+        records.push(...page.items);
+        cursor = page.nextCursor;
+    } while (cursor);
+    return records;
+}
+
 // 로딩 스피너 표시/숨김
 function showLoading(elementId) {
     const element = document.getElementById(elementId);
@@ -0,0 +1,89 @@
+# 건강 기록 서비스 테스트 (healthService.score_health_records 위험도 일괄 계산, 삭제 이벤트)
+# 실행: python -m pytest tests
+
+import asyncio
+from datetime import date, datetime
+
+from core.eventBroker import event_broker, format_event, HEALTH_RECORD_DELETED
+from core.riskCalculator import calculate_age, calculate_stroke_risk, get_age_bracket
+from models.healthModel import HealthRecordDB
+from schemas.healthSchema import HealthRecordBatchItem
+from crud import healthCrud
+from services import healthService, relationGraphService, riskProfileService
+
+BIRTH_DATE = date(1960, 6, 15)
+
+class FakeUsers:
+    def __init__(self, docs: dict):
+        self.docs = docs
+
+    def find(self, query: dict, projection=None):
+        async def cursor():
+            for user_id in query["_id"]["$in"]:
+                if user_id in self.docs:
+                    yield dict(self.docs[user_id])
+        return cursor()
+
+class FakeDB:
+    def __init__(self, docs: dict):
+        self.users = FakeUsers(docs)
+
+def _reading(created_at=None) -> HealthRecordBatchItem:
+    return HealthRecordBatchItem(user_id="p1", weight_kg=70, systolic_bp=130, diastolic_bp=85,
+                                 glucose_level=110, smoking=0, created_at=created_at)
+
+def _expected(age: int) -> float:
+    return calculate_stroke_risk(age=age, sex="M", hypertension=True, systolic_bp=130, diastolic_bp=85,
+                                 weight_kg=70, height_cm=175, glucose_level=110, smoking=0)
+
+def test_back_dated_row_scored_with_age_at_measurement():
+    """측정 시각이 과거인 기록은 측정 당시 나이 구간으로 계산한다"""
+    measured = datetime(2005, 6, 14, 9, 0)  # 만 44세 (40-50 구간), 생일 하루 전
+    age_then = calculate_age(BIRTH_DATE, measured.date())
+    age_now = calculate_age(BIRTH_DATE)
+    assert age_then == 44
+    assert get_age_bracket(age_then) != get_age_bracket(age_now)
+
+    async def scenario():
+        riskProfileService._profiles.clear()
+        db = FakeDB({"p1": {"_id": "p1", "sex": "M", "birth_date": datetime.combine(BIRTH_DATE, datetime.min.time()),
+                            "height_cm": 175, "hypertension": True}})
+        return await healthService.score_health_records(db, [_reading(measured), _reading()])
+
+    back_dated, current = asyncio.run(scenario())
+    assert back_dated.created_at == measured
+    assert back_dated.stroke_risk_score == _expected(age_then)
+    assert current.stroke_risk_score == _expected(age_now)
+    assert back_dated.stroke_risk_score != current.stroke_risk_score
+
+def test_delete_publishes_event_to_patient_and_monitors(monkeypatch):
+    """기록을 삭제하면 환자 본인과 모니터의 연결로 health_record_deleted 이벤트를 보낸다"""
+    record = HealthRecordDB(id="r1", user_id="p1", weight_kg=70, systolic_bp=130, diastolic_bp=85,
+                            glucose_level=110, smoking=0, created_at=datetime(2024, 1, 1))
+
+    async def delete_health_record(db, record_id):
+        return record if record_id == "r1" else None
+
+    async def event_recipients(db, patient_id):
+        return {patient_id, "d1"}
+
+    monkeypatch.setattr(healthCrud, "delete_health_record", delete_health_record)
+    monkeypatch.setattr(relationGraphService, "event_recipients", event_recipients)
+
+    async def scenario():
+        monitor = event_broker.subscribe("d1")
+        stranger = event_broker.subscribe("d2")
+        try:
+            deleted = await healthService.delete_health_record(None, "r1")
+            missing = await healthService.delete_health_record(None, "r2")
+            return deleted, missing, monitor.queue.get_nowait(), stranger.queue.empty(), monitor.queue.empty()
+        finally:
+            event_broker.unsubscribe(monitor)
+            event_broker.unsubscribe(stranger)
+
+    deleted, missing, message, stranger_empty, monitor_drained = asyncio.run(scenario())
+    assert deleted.id == "r1"
+    assert missing is None
+    assert message == format_event(HEALTH_RECORD_DELETED, {"user_id": "p1", "record_id": "r1"})
+    assert stranger_empty
+    assert monitor_drained  # 없는 기록 삭제는 이벤트 없음
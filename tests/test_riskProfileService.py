@@ -0,0 +1,72 @@
+# 위험도 프로필 캐시 테스트 (riskProfileService)
+# 실행: python -m pytest tests
+
+import asyncio
+
+from services import riskProfileService
+
+class FakeUsers:
+    """첫 조회를 외부에서 끝낼 때까지 붙잡아 두는 users 컬렉션 (find_one/find 모두)"""
+
+    def __init__(self, docs: dict):
+        self.docs = docs
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def _snapshot(self, ids):
+        self.calls += 1
+        snapshot = [dict(self.docs[user_id]) for user_id in ids if user_id in self.docs]  # 수정 전 문서
+        if self.calls == 1:
+            self.started.set()
+            await self.release.wait()
+        return snapshot
+
+    async def find_one(self, query: dict, projection=None):
+        docs = await self._snapshot([query["_id"]])
+        return docs[0] if docs else None
+
+    def find(self, query: dict, projection=None):
+        async def cursor():
+            for doc in await self._snapshot(query["_id"]["$in"]):
+                yield doc
+        return cursor()
+
+class FakeDB:
+    def __init__(self, docs: dict):
+        self.users = FakeUsers(docs)
+
+def _patient(user_id: str, hypertension: bool) -> dict:
+    return {"_id": user_id, "sex": "M", "birth_date": "1960-01-01", "hypertension": hypertension}
+
+async def _interleave(db: FakeDB, read, user_id: str):
+    """조회가 진행 중일 때 건강 정보 수정 (update_user_health_info와 같은 순서: DB 수정 → 무효화)"""
+    task = asyncio.create_task(read)
+    await db.users.started.wait()
+    db.users.docs[user_id]["hypertension"] = True
+    riskProfileService.invalidate_risk_profile(user_id)
+    db.users.release.set()
+    return await task
+
+def test_single_profile_invalidated_during_read():
+    async def scenario():
+        riskProfileService._profiles.clear()
+        db = FakeDB({"p1": _patient("p1", False)})
+        stale = await _interleave(db, riskProfileService.get_risk_profile(db, "p1"), "p1")
+        assert stale.hypertension is False
+        assert (await riskProfileService.get_risk_profile(db, "p1")).hypertension is True
+        assert db.users.calls == 2
+
+    asyncio.run(scenario())
+
+def test_batch_profiles_invalidated_during_read():
+    async def scenario():
+        riskProfileService._profiles.clear()
+        db = FakeDB({"p2": _patient("p2", False), "p3": _patient("p3", False)})
+        stale = await _interleave(db, riskProfileService.get_risk_profiles(db, ["p2", "p3"]), "p2")
+        assert stale["p2"].hypertension is False
+        fresh = await riskProfileService.get_risk_profiles(db, ["p2", "p3"])
+        assert fresh["p2"].hypertension is True   # 무효화된 사용자만 다시 조회
+        assert db.users.calls == 2
+
+    asyncio.run(scenario())
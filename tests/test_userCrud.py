@@ -0,0 +1,63 @@
+# 사용자 조회 캐시 테스트 (userCrud.get_user_by_id)
+# 실행: python -m pytest tests
+
+import asyncio
+
+import pytest
+
+from crud import userCrud
+
+pytestmark = pytest.mark.skipif(userCrud._user_cache is None, reason="USER_CACHE_ENABLED=false")
+
+class FakeUsers:
+    """find_one 한 번을 외부에서 끝낼 때까지 붙잡아 두는 users 컬렉션"""
+
+    def __init__(self, doc: dict):
+        self.doc = doc
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def find_one(self, query: dict):
+        self.calls += 1
+        if self.calls == 1:
+            snapshot = dict(self.doc)  # 수정 전 문서
+            self.started.set()
+            await self.release.wait()
+            return snapshot
+        return dict(self.doc)
+
+class FakeDB:
+    def __init__(self, doc: dict):
+        self.users = FakeUsers(doc)
+
+def test_invalidation_during_read_is_not_overwritten():
+    """조회 중에 수정(무효화)되면 조회한 이전 문서를 캐시에 넣지 않는다"""
+    async def scenario():
+        userCrud._user_cache.clear()
+        db = FakeDB({"_id": "p1", "password": "x", "name": "이전 이름", "role": "PATIENT"})
+
+        read = asyncio.create_task(userCrud.get_user_by_id(db, "p1"))
+        await db.users.started.wait()
+        # update_user와 같은 순서: DB 수정 → 무효화
+        db.users.doc["name"] = "새 이름"
+        userCrud.invalidate_user_cache("p1")
+        db.users.release.set()
+
+        assert (await read).name == "이전 이름"  # 진행 중이던 조회 결과는 그대로 반환
+        assert (await userCrud.get_user_by_id(db, "p1")).name == "새 이름"
+        assert db.users.calls == 2
+
+    asyncio.run(scenario())
+
+def test_read_without_invalidation_is_cached():
+    async def scenario():
+        userCrud._user_cache.clear()
+        db = FakeDB({"_id": "p2", "password": "x", "name": "환자", "role": "PATIENT"})
+        db.users.release.set()
+
+        await userCrud.get_user_by_id(db, "p2")
+        assert (await userCrud.get_user_by_id(db, "p2")).name == "환자"
+        assert db.users.calls == 1
+
+    asyncio.run(scenario())